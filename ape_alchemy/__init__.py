@@ -29,6 +29,11 @@ def __getattr__(name: str):
 
         return Alchemy
 
+    if name == "AsyncAlchemy":
+        from .async_provider import AsyncAlchemy
+
+        return AsyncAlchemy
+
     if name == "AlcheymyConfig":
         from .config import AlchemyConfig
 
@@ -41,4 +46,5 @@ __all__ = [
     "NETWORKS",
     "Alchemy",
     "AlchemyConfig",
+    "AsyncAlchemy",
 ]
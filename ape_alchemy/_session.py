@@ -0,0 +1,73 @@
+from threading import Lock
+from typing import TYPE_CHECKING
+
+from requests import Session
+from requests.adapters import HTTPAdapter
+
+from .metrics import count_transfer
+
+if TYPE_CHECKING:
+    from .config import HTTPConfig
+
+# NOTE: Sessions are shared across all providers using the same URI and settings,
+#   so connections (and their TLS handshakes) get re-used.
+_SESSIONS: dict[tuple, Session] = {}
+_SESSIONS_LOCK = Lock()
+
+
+def get_session(uri: str, config: "HTTPConfig") -> Session:
+    """
+    Get the shared, pooled ``requests.Session`` for the given URI.
+    """
+    key = (
+        uri,
+        config.pool_connections,
+        config.pool_maxsize,
+        config.compress_responses,
+        config.keep_alive,
+    )
+    if session := _SESSIONS.get(key):
+        return session
+
+    with _SESSIONS_LOCK:
+        if session := _SESSIONS.get(key):
+            return session
+
+        session = Session()
+        adapter = HTTPAdapter(
+            pool_connections=config.pool_connections,
+            pool_maxsize=config.pool_maxsize,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if not config.compress_responses:
+            session.headers["Accept-Encoding"] = "identity"
+        if not config.keep_alive:
+            session.headers["Connection"] = "close"
+
+        session.hooks["response"].append(count_transfer)
+
+        _SESSIONS[key] = session
+        return session
+
+
+def get_pool_stats(session: Session) -> dict[str, int]:
+    """
+    Count the requests that re-used a pooled connection (hits)
+    and the requests that had to open a new one (misses).
+    """
+    requests = 0
+    connections = 0
+    for adapter in set(session.adapters.values()):
+        if not (pools := getattr(getattr(adapter, "poolmanager", None), "pools", None)):
+            continue
+
+        # NOTE: urllib3's pool container does not support iteration, only `.keys()`.
+        for pool_key in pools.keys():  # noqa: SIM118
+            if not (pool := pools.get(pool_key)):
+                continue
+
+            requests += pool.num_requests
+            connections += pool.num_connections
+
+    return {"hits": max(requests - connections, 0), "misses": connections}
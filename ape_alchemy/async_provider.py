@@ -0,0 +1,298 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from random import randint
+from typing import TYPE_CHECKING, Any
+
+from aiohttp import (
+    ClientConnectionError,
+    ClientResponse,
+    ClientResponseError,
+    ClientSession,
+    ClientTimeout,
+    TCPConnector,
+)
+from ape.api import ReceiptAPI
+from ape.exceptions import ProviderError, ProviderNotConnectedError, TransactionNotFoundError
+from ape.logging import logger
+from eth_typing import HexStr
+from web3 import AsyncHTTPProvider, AsyncWeb3
+from web3.exceptions import ExtraDataLengthError, TransactionNotFound
+from web3.types import RPCEndpoint
+
+try:
+    from web3.middleware import (  # type: ignore
+        ExtraDataToPOAMiddleware as AsyncExtraDataToPOAMiddleware,
+    )
+except ImportError:
+    from web3.middleware import (  # type: ignore
+        async_geth_poa_middleware as AsyncExtraDataToPOAMiddleware,
+    )
+
+from .exceptions import AlchemyProviderError, AlchemyRateLimitError
+from .metrics import start_span
+from .provider import POA_CHAIN_IDS, is_poa_block
+from .trace import AlchemyTransactionTrace, get_top_level_call_tracer
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+    from .provider import Alchemy
+
+
+class AsyncAlchemy:
+    """
+    An ``asyncio`` counterpart to the :class:`~ape_alchemy.provider.Alchemy` provider,
+    using web3's ``AsyncHTTPProvider``. It uses the same URI, configuration and
+    rate-limit handling as the provider it wraps.
+
+    .. code-block:: python
+
+        async with AsyncAlchemy(networks.provider) as alchemy:
+            receipts = await asyncio.gather(*[alchemy.get_receipt(h) for h in txn_hashes])
+    """
+
+    def __init__(self, provider: "Alchemy"):
+        self.provider = provider
+        self._web3: AsyncWeb3 | None = None
+        self._session: ClientSession | None = None
+
+    async def __aenter__(self) -> "Self":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *args):
+        await self.disconnect()
+
+    @property
+    def web3(self) -> AsyncWeb3:
+        """
+        Access to the ``AsyncWeb3`` object.
+        """
+        if web3 := self._web3:
+            return web3
+
+        raise ProviderNotConnectedError()
+
+    @property
+    def is_connected(self) -> bool:
+        return self._web3 is not None
+
+    async def connect(self):
+        http_config = self.provider.config.http
+        web3_provider = AsyncHTTPProvider(
+            self.provider.uri,
+            request_kwargs={"timeout": ClientTimeout(total=http_config.request_timeout)},
+        )
+        self._session = ClientSession(
+            raise_for_status=self._raise_for_status,
+            connector=TCPConnector(
+                limit=http_config.max_async_connections,
+                force_close=not http_config.keep_alive,
+            ),
+            headers=None if http_config.compress_responses else {"Accept-Encoding": "identity"},
+        )
+        await web3_provider.cache_async_session(self._session)
+        web3 = AsyncWeb3(web3_provider)
+        self._web3 = web3
+
+        chain_id, is_poa = self.provider._get_known_chain_metadata()
+        detected = chain_id is None or is_poa is None
+        if chain_id is None:
+            try:
+                chain_id = await web3.eth.chain_id
+            except Exception:
+                chain_id = None
+
+        if is_poa is None and chain_id in POA_CHAIN_IDS:
+            is_poa = True
+
+        if is_poa is None:
+            # NOTE: Same as `Alchemy.connect()`, check both earliest and latest
+            #   because if the chain was _ever_ PoA, we need this middleware.
+            for option in ("earliest", "latest"):
+                try:
+                    block = await web3.eth.get_block(option)  # type: ignore[arg-type]
+                except ExtraDataLengthError:
+                    is_poa = True
+                    break
+                else:
+                    is_poa = is_poa_block(dict(block))
+                    if is_poa:
+                        break
+
+        if is_poa:
+            web3.middleware_onion.inject(AsyncExtraDataToPOAMiddleware, layer=0)
+
+        if detected and chain_id is not None:
+            self.provider._set_known_chain_metadata(chain_id, is_poa)
+
+    async def disconnect(self):
+        if session := self._session:
+            await session.close()
+
+        self._session = None
+        self._web3 = None
+
+    async def make_request(self, rpc: str, parameters: Iterable | None = None) -> Any:
+        """
+        The ``asyncio`` version of :meth:`~ape_alchemy.provider.Alchemy.make_request`.
+        JSON-RPC errors are raised, mapped the same way as the provider's errors,
+        such as :class:`~ape_alchemy.exceptions.AlchemyFeatureNotAvailable` for
+        methods that are not available.
+        """
+        params = list(parameters or [])
+
+        async def request() -> Any:
+            response = await self.web3.provider.make_request(RPCEndpoint(rpc), params)
+            if isinstance(response, dict) and "error" in response:
+                raise self.provider._get_rpc_error(response["error"])
+
+            return response
+
+        result = await self._request(rpc, request)
+        return result["result"] if isinstance(result, dict) and "result" in result else result
+
+    async def get_receipt(self, txn_hash: str) -> ReceiptAPI:
+        """
+        Get a receipt, fetching the receipt and transaction data concurrently.
+
+        Args:
+            txn_hash (str): The transaction hash.
+
+        Returns:
+            :class:`~ape.api.transactions.ReceiptAPI`
+        """
+        try:
+            data, txn = await asyncio.gather(
+                self._request(
+                    "eth_getTransactionReceipt",
+                    lambda: self.web3.eth.get_transaction_receipt(HexStr(txn_hash)),
+                ),
+                self._request(
+                    "eth_getTransactionByHash",
+                    lambda: self.web3.eth.get_transaction(HexStr(txn_hash)),
+                ),
+            )
+        except TransactionNotFound as err:
+            raise TransactionNotFoundError(txn_hash) from err
+
+        return self.provider.network.ecosystem.decode_receipt(
+            {
+                "provider": self.provider,
+                "required_confirmations": 0,
+                **dict(txn),
+                **dict(data),
+            }
+        )
+
+    async def get_transaction_trace(
+        self, transaction_hash: str, **kwargs
+    ) -> AlchemyTransactionTrace:
+        """
+        Fetch the call tree and top-level call of a transaction concurrently.
+
+        Args:
+            transaction_hash (str): The transaction hash.
+            **kwargs: Additional trace kwargs.
+
+        Returns:
+            :class:`~ape_alchemy.trace.AlchemyTransactionTrace`: A trace that
+            does not need to make any more requests for its call tree,
+            return value or revert message.
+        """
+        tracer = get_top_level_call_tracer(self.provider.config.trace_timeout)
+        try:
+            parity_trace, top_level_call = await asyncio.gather(
+                self.make_request("trace_transaction", [transaction_hash]),
+                self.make_request("debug_traceTransaction", [transaction_hash, tracer]),
+            )
+        except ProviderError as err:
+            if "transaction not found" in str(err).lower():
+                raise TransactionNotFoundError(transaction_hash=transaction_hash) from err
+
+            raise  # The ProviderError as-is
+
+        return AlchemyTransactionTrace.from_raw(
+            transaction_hash,
+            parity_trace=parity_trace,
+            top_level_call=top_level_call,
+            **kwargs,
+        )
+
+    async def _request(self, rpc: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        started = time.perf_counter()
+        failed = True
+        try:
+            with start_span(rpc, self.provider.config.metrics.opentelemetry):
+                result = await self._request_with_retry(rpc, func)
+
+            failed = False
+            return result
+        finally:
+            # NOTE: Bytes are not counted for `asyncio` requests.
+            self.provider._record_request(rpc, time.perf_counter() - started, failed)
+
+    async def _request_with_retry(self, rpc: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        # NOTE: Same back-off logic as `ape.utils.request_with_retry()`,
+        #   using the provider's rate-limit config.
+        rate_limit = self.provider.config.rate_limit
+        for attempt in range(rate_limit.max_retries):
+            if delay := self.provider._reserve_compute_units(rpc):
+                await asyncio.sleep(delay)
+
+            try:
+                return await func()
+            except Exception as err:
+                if not self._response_checker(err):
+                    raise
+
+                self._record_retry(rpc, err, attempt)
+
+            logger.warning("Request was rate-limited. Backing-off and then retrying...")
+            retry_interval = min(
+                rate_limit.max_retry_delay,
+                rate_limit.min_retry_delay * rate_limit.retry_backoff_factor**attempt,
+            )
+            delay = retry_interval + randint(0, rate_limit.retry_jitter)
+            await asyncio.sleep(delay / 1000)
+
+        raise ProviderError(
+            f"Rate limit retry-mechanism exceeded after '{rate_limit.max_retries}' attempts."
+        )
+
+    async def _raise_for_status(self, response: ClientResponse):
+        """
+        Raise the JSON-RPC error of a failed HTTP response, which ``aiohttp``
+        otherwise discards, mapped the same way as the provider's errors.
+        """
+        if response.ok:
+            return
+
+        try:
+            data = await response.json(content_type=None)
+        except Exception:
+            data = None
+
+        if response.status == 429:
+            raise AlchemyRateLimitError(f"{response.status}: {response.reason}")
+
+        if isinstance(data, dict) and "error" in data:
+            raise self.provider._get_rpc_error(data["error"])
+
+        raise AlchemyProviderError(f"{response.status}: {response.reason}")
+
+    def _record_retry(self, rpc: str, err: Exception, attempt: int):
+        rate_limited = (isinstance(err, ClientResponseError) and err.status == 429) or isinstance(
+            err, AlchemyRateLimitError
+        )
+        retried = attempt < self.provider.config.rate_limit.max_retries - 1
+        self.provider._record_retry([rpc], retried=retried, rate_limited=rate_limited)
+
+    @staticmethod
+    def _response_checker(err: Exception) -> bool:
+        return (
+            (isinstance(err, ClientResponseError) and err.status == 429)
+            # NOTE: Same as `Alchemy._response_checker()`, retry dropped connections.
+            or isinstance(err, ClientConnectionError | AlchemyRateLimitError)
+        )
@@ -0,0 +1,65 @@
+from collections.abc import Iterable
+from concurrent.futures import Future
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .provider import Alchemy
+
+
+class RequestBatch:
+    """
+    Collects JSON-RPC calls and sends them to Alchemy in as few
+    batch requests as possible. Use :meth:`~ape_alchemy.provider.Alchemy.batch_requests`
+    to create one:
+
+    .. code-block:: python
+
+        with provider.batch_requests() as batch:
+            balance = batch.add("eth_getBalance", [address, "latest"])
+            code = batch.add("eth_getCode", [address, "latest"])
+
+        print(balance.result(), code.result())
+
+    Only calls queued using :meth:`add` are batched. Other requests made while
+    the batch is open, such as using ``make_request()`` or ape's own calls, are
+    sent on their own right away, because their results are needed at once.
+    """
+
+    def __init__(self, provider: "Alchemy"):
+        self.provider = provider
+        self._queue: list[tuple[str, list, Future]] = []
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def add(self, rpc: str, parameters: Iterable | None = None) -> Future:
+        """
+        Queue a call. The returned future resolves once the batch is flushed,
+        either when it reaches ``max_batch_size`` or when the context exits.
+
+        Args:
+            rpc (str): The RPC method.
+            parameters (Iterable | None): The RPC parameters.
+
+        Returns:
+            ``concurrent.futures.Future``: The result of the call.
+        """
+        future: Future = Future()
+        self._queue.append((rpc, list(parameters or []), future))
+        if len(self._queue) >= self.provider.config.max_batch_size:
+            self.flush()
+
+        return future
+
+    def flush(self):
+        """
+        Send all queued calls.
+        """
+        queue, self._queue = self._queue, []
+        if queue:
+            self.provider._send_batch(queue)
+
+    def _cancel(self):
+        queue, self._queue = self._queue, []
+        for _, _, future in queue:
+            future.cancel()
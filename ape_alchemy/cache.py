@@ -0,0 +1,179 @@
+import json
+import sqlite3
+import time
+from hashlib import sha256
+from pathlib import Path
+from threading import Lock
+from typing import Any
+
+from .serialization import MAGIC, dumps, loads
+
+# Methods with results that never change once their block is final.
+CACHEABLE_METHODS = (
+    "debug_traceTransaction",
+    "eth_getBlockByHash",
+    "eth_getBlockByNumber",
+    "eth_getTransactionByHash",
+    "eth_getTransactionReceipt",
+    "trace_block",
+    "trace_transaction",
+)
+
+
+def get_cache_key(chain_id: int, rpc: str, parameters: list) -> str | None:
+    """
+    The cache key of a request, or ``None`` if the request is not cacheable.
+    """
+    if rpc not in CACHEABLE_METHODS:
+        return None
+
+    if rpc in ("eth_getBlockByNumber", "trace_block") and not (
+        parameters and isinstance(parameters[0], int | str) and _is_block_number(parameters[0])
+    ):
+        # Block tags, such as "latest", change.
+        return None
+
+    try:
+        params_str = json.dumps(parameters, sort_keys=True)
+    except TypeError:
+        return None
+
+    return sha256(f"{chain_id}:{rpc}:{params_str}".encode()).hexdigest()
+
+
+def get_block_number(rpc: str, result: Any) -> int | None:
+    """
+    The number of the block a cacheable result belongs to, when the result has one.
+    """
+    if not result:
+        return None
+
+    if rpc in ("eth_getBlockByHash", "eth_getBlockByNumber") and isinstance(result, dict):
+        number = result.get("number")
+
+    elif rpc in ("eth_getTransactionByHash", "eth_getTransactionReceipt") and isinstance(
+        result, dict
+    ):
+        number = result.get("blockNumber")
+
+    elif rpc in ("trace_block", "trace_transaction") and isinstance(result, list):
+        number = result[0].get("blockNumber")
+
+    else:
+        return None
+
+    if isinstance(number, str):
+        return int(number, 16)
+
+    return number
+
+
+def _is_block_number(value: int | str) -> bool:
+    return isinstance(value, int) or value.startswith("0x")
+
+
+class RequestCache:
+    """
+    A persistent, size-bounded cache of RPC results, stored in SQLite
+    in a compact binary format. When the cache outgrows its maximum size,
+    the least-recently used results are evicted.
+    """
+
+    def __init__(self, path: Path, max_size: int):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.max_size = max_size
+        self._lock = Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS cache "
+            "(key TEXT PRIMARY KEY, value BLOB, size INTEGER, accessed REAL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS cache_accessed ON cache (accessed)")
+        self._size = self._get_size()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+
+    @property
+    def size(self) -> int:
+        """
+        The total size, in bytes, of the cached results.
+        """
+        with self._lock:
+            return self._get_size()
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            row = self._db.execute("SELECT value FROM cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+
+            self._db.execute("UPDATE cache SET accessed = ? WHERE key = ?", (time.time(), key))
+
+        # NOTE: Results cached by older versions are JSON.
+        return loads(row[0]) if row[0][: len(MAGIC)] == MAGIC else json.loads(row[0])
+
+    def set(self, key: str, value: Any):
+        data = dumps(value)
+        with self._lock:
+            row = self._db.execute("SELECT size FROM cache WHERE key = ?", (key,)).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO cache (key, value, size, accessed) VALUES (?, ?, ?, ?)",
+                (key, data, len(data), time.time()),
+            )
+            # NOTE: Replacing a result frees the size of the one it replaces.
+            self._size += len(data) - (row[0] if row else 0)
+            if self._size > self.max_size:
+                self._evict()
+
+    def clear(self):
+        with self._lock:
+            self._db.execute("DELETE FROM cache")
+            self._size = 0
+
+    def _get_size(self) -> int:
+        return self._db.execute("SELECT COALESCE(SUM(size), 0) FROM cache").fetchone()[0]
+
+    def _evict(self):
+        # NOTE: Other processes may share the database, so re-count first.
+        #   Evict down to 90% so eviction does not happen on every insert.
+        self._size = self._get_size()
+        excess = self._size - int(self.max_size * 0.9)
+        if excess <= 0:
+            return
+
+        evicted = []
+        rows = self._db.execute("SELECT key, size FROM cache ORDER BY accessed")
+        for key, size in rows:
+            evicted.append((key,))
+            excess -= size
+            self._size -= size
+            if excess <= 0:
+                break
+
+        rows.close()
+        self._db.executemany("DELETE FROM cache WHERE key = ?", evicted)
+
+
+_CACHES: dict[Path, RequestCache] = {}
+_CACHES_LOCK = Lock()
+
+
+def get_request_cache(path: Path, max_size: int) -> RequestCache:
+    """
+    Get the cache stored at the given path, shared by all providers.
+    """
+    # NOTE: Check against `None`; an empty cache is falsy.
+    if (cache := _CACHES.get(path)) is not None:
+        return cache
+
+    with _CACHES_LOCK:
+        if (cache := _CACHES.get(path)) is not None:
+            return cache
+
+        cache = RequestCache(path, max_size)
+        _CACHES[path] = cache
+        return cache
@@ -1,5 +1,28 @@
+from typing import Literal
+
 from ape.api import PluginConfig
 
+# Standard read methods, which are safe to send twice or to another node.
+READ_METHODS = [
+    "eth_blockNumber",
+    "eth_call",
+    "eth_chainId",
+    "eth_estimateGas",
+    "eth_feeHistory",
+    "eth_gasPrice",
+    "eth_getBalance",
+    "eth_getBlockByHash",
+    "eth_getBlockByNumber",
+    "eth_getCode",
+    "eth_getLogs",
+    "eth_getStorageAt",
+    "eth_getTransactionByHash",
+    "eth_getTransactionCount",
+    "eth_getTransactionReceipt",
+    "eth_maxPriorityFeePerGas",
+    "net_version",
+]
+
 
 class RateLimitConfig(PluginConfig):
     """
@@ -16,6 +39,14 @@ class RateLimitConfig(PluginConfig):
           Defaults to ``3``.
         retry_jitter (int): A random number of milliseconds up to this limit
           is added to each retry delay. Defaults to ``250`` milliseconds.
+        compute_units_per_second (int | None): Set to your plan's throughput to
+          delay requests *before* they would get rate-limited, using a token bucket
+          of compute units. Defaults to ``None`` (no limit).
+        compute_unit_costs (dict[str, int]): Compute-unit costs per RPC method,
+          overriding the built-in table in :mod:`ape_alchemy.rate_limit`.
+        share_across_processes (bool): Set to ``True`` to share the compute-unit
+          budget with all processes on the machine using a file lock.
+          Defaults to ``False``.
     """
 
     min_retry_delay: int = 1_000
@@ -23,6 +54,333 @@ class RateLimitConfig(PluginConfig):
     max_retry_delay: int = 30_000
     max_retries: int = 3
     retry_jitter: int = 250
+    compute_units_per_second: int | None = None
+    compute_unit_costs: dict[str, int] = {}
+    share_across_processes: bool = False
+
+
+class HTTPConfig(PluginConfig):
+    """
+    Configuration for the HTTP session shared by all Alchemy providers
+    connected to the same URI.
+
+    Args:
+        pool_connections (int): The number of connection pools to cache.
+          Defaults to ``10``.
+        pool_maxsize (int): The maximum number of connections to keep open per pool.
+          Raise this when making requests from many threads. Defaults to ``10``.
+        request_timeout (float): The number of seconds to wait for a response.
+          Defaults to ``30``.
+        compress_responses (bool): Set to ``False`` to stop requesting compressed
+          (gzip, and brotli when installed) responses. Defaults to ``True``.
+        keep_alive (bool): Set to ``False`` to close connections after each request.
+          Defaults to ``True``.
+        max_async_connections (int): The maximum number of open connections for
+          :class:`~ape_alchemy.async_provider.AsyncAlchemy`. Defaults to ``100``.
+    """
+
+    pool_connections: int = 10
+    pool_maxsize: int = 10
+    request_timeout: float = 30
+    compress_responses: bool = True
+    keep_alive: bool = True
+    max_async_connections: int = 100
+
+
+class CacheConfig(PluginConfig):
+    """
+    Configuration for the persistent cache of immutable RPC results,
+    such as receipts and traces of finalized transactions.
+
+    Args:
+        enabled (bool): Set to ``True`` to cache results in the plugin's data folder.
+          Defaults to ``False``.
+        finality_depth (int): The number of blocks behind the head a block must be
+          before its results are cached. Defaults to ``64``.
+        max_size_mb (int): The maximum size of the cache, in megabytes. The least-recently
+          used results are evicted past this size. Defaults to ``1_024``.
+    """
+
+    enabled: bool = False
+    finality_depth: int = 64
+    max_size_mb: int = 1_024
+
+
+class MemoizeConfig(PluginConfig):
+    """
+    Configuration for the in-memory memoization of repeated reads at the head block.
+
+    Args:
+        enabled (bool): Set to ``True`` to memoize reads. Defaults to ``False``.
+        max_entries (int): The maximum number of memoized results. The least-recently
+          used results are evicted past this size. Defaults to ``1_024``.
+        ttls (dict[str, float | None]): The RPC methods to memoize, mapped to the number
+          of seconds to keep their results. ``None`` means the network's block time.
+          Results are also dropped when a new block is seen, except for ``eth_chainId``.
+    """
+
+    enabled: bool = False
+    max_entries: int = 1_024
+    ttls: dict[str, float | None] = {
+        "eth_call": None,
+        "eth_chainId": 3_600,
+        "eth_gasPrice": None,
+        "eth_getCode": None,
+        "eth_maxPriorityFeePerGas": None,
+    }
+
+
+class LogsConfig(PluginConfig):
+    """
+    Configuration for fetching logs with ``eth_getLogs``.
+
+    Args:
+        initial_page_size (int | None): The number of blocks in the first range
+          requested. Defaults to ``None``, which uses the provider's ``block_page_size``.
+        max_page_size (int): The maximum number of blocks to request at once.
+          Defaults to ``10_000``.
+        target_logs_per_page (int): Ranges double in size while they return fewer
+          than half this many logs. Defaults to ``2_000``.
+    """
+
+    initial_page_size: int | None = None
+    max_page_size: int = 10_000
+    target_logs_per_page: int = 2_000
+
+
+class WebSocketConfig(PluginConfig):
+    """
+    Configuration for WebSocket connections, used for subscriptions and,
+    optionally, for all requests.
+
+    Args:
+        enabled (bool): Set to ``True`` to use the network's WebSocket URI instead of
+          HTTP. Networks without WebSocket support still use HTTP. Defaults to ``False``.
+        request_timeout (float): The number of seconds to wait for a response.
+          Defaults to ``30``.
+        max_reconnect_attempts (int): The number of times to try reconnecting after the
+          connection drops before failing the requests awaiting a response.
+          Defaults to ``5``.
+        reconnect_delay (float): The number of seconds to wait before the first reconnect
+          attempt, doubling after each failed attempt. Defaults to ``1``.
+        max_queued_notifications (int): The number of subscription notifications to hold
+          for a slow consumer, after which its oldest notifications are dropped.
+          Defaults to ``1_000``.
+        poll_with_subscriptions (bool): Set to ``False`` to have ``poll_blocks()``,
+          ``poll_logs()`` and receipt waiting poll over HTTP rather than wait for
+          ``newHeads`` notifications. Defaults to ``True``.
+    """
+
+    enabled: bool = False
+    request_timeout: float = 30
+    max_reconnect_attempts: int = 5
+    reconnect_delay: float = 1
+    max_queued_notifications: int = 1_000
+    poll_with_subscriptions: bool = True
+
+
+class MetricsConfig(PluginConfig):
+    """
+    Configuration for the request stats at ``provider.stats``.
+
+    Args:
+        enabled (bool): Set to ``False`` to stop recording request stats.
+          Defaults to ``True``.
+        max_latency_samples (int): The number of recent latencies kept per RPC method
+          for computing percentiles. Defaults to ``1_000``.
+        prometheus_port (int | None): Set to serve the stats of all providers in the
+          OpenMetrics text format at ``/metrics`` on this port, for Prometheus to scrape.
+          Defaults to ``None`` (no server).
+        prometheus_host (str): The address the metrics server listens on.
+          Defaults to ``127.0.0.1``.
+        opentelemetry (bool): Set to ``True`` to create an OpenTelemetry span for each
+          request. Requires ``opentelemetry-api``. Defaults to ``False``.
+    """
+
+    enabled: bool = True
+    max_latency_samples: int = 1_000
+    prometheus_port: int | None = None
+    prometheus_host: str = "127.0.0.1"
+    opentelemetry: bool = False
+
+
+class HedgeConfig(PluginConfig):
+    """
+    Configuration for hedging read requests: when a response is slower than usual,
+    the request is sent again and whichever response comes first is used. This cuts
+    the tail latency of requests that stall, at the cost of extra compute units.
+
+    Args:
+        enabled (bool): Set to ``True`` to hedge requests. Defaults to ``False``.
+        percentile (float): Hedge once a request takes longer than this percentile of
+          the recent latencies of its method. Defaults to ``95``.
+        min_samples (int): The number of latencies a method needs before using their
+          percentile. Defaults to ``20``.
+        initial_delay (float): The number of seconds to wait before hedging a method
+          with too few latencies. Defaults to ``1``.
+        min_delay (float): The minimum number of seconds to wait before hedging.
+          Defaults to ``0.05``.
+        max_extra_compute_units (float): The most compute units to spend on hedges,
+          as a percentage of the compute units of all requests that could be hedged.
+          Defaults to ``5``.
+        max_workers (int): The number of threads sending hedged requests, and so the
+          most hedges in flight at once. Defaults to ``32``.
+        methods (list[str]): The RPC methods to hedge. Only add methods that are safe
+          to send twice.
+    """
+
+    enabled: bool = False
+    percentile: float = 95
+    min_samples: int = 20
+    initial_delay: float = 1
+    min_delay: float = 0.05
+    max_extra_compute_units: float = 5
+    max_workers: int = 32
+    methods: list[str] = READ_METHODS
+
+
+class ApiKeysConfig(PluginConfig):
+    """
+    Configuration for spreading requests across several API keys (apps), set
+    comma-separated in the API key environment variable, such as
+    ``WEB3_ALCHEMY_API_KEY=key1,key2``.
+
+    Args:
+        strategy (str): How to choose the key for each request: ``round-robin``,
+          ``least-loaded`` (fewest requests in flight) or ``compute-units`` (most
+          compute units left of ``rate_limit.compute_units_per_second``, which each
+          key gets in full). Defaults to ``round-robin``.
+        cooldown (float): The number of seconds to skip a key after it gets
+          rate-limited. Defaults to ``30``.
+    """
+
+    strategy: Literal["round-robin", "least-loaded", "compute-units"] = "round-robin"
+    cooldown: float = 30
+
+
+class FailoverConfig(PluginConfig):
+    """
+    Configuration for routing read requests to fallback RPC endpoints, such as another
+    Alchemy region or a self-hosted node, when they are healthier than Alchemy.
+
+    Args:
+        endpoints (dict[str, list[str]]): The fallback RPC URIs per network, such as
+          ``ethereum:mainnet``. Defaults to none.
+        methods (list[str]): The RPC methods that may be sent to a fallback. Only add
+          methods every fallback supports. Defaults to standard read methods.
+        max_failures (int): The number of connection errors, timeouts or server errors
+          in a row that take an endpoint out of rotation until a health check passes.
+          Defaults to ``3``.
+        health_check_interval (float): The number of seconds between health checks of
+          each endpoint, which request ``eth_chainId`` (costing no compute units) and
+          only run while requests are being made. Defaults to ``5``.
+        fallback_penalty (float): A fallback only gets requests over a healthy Alchemy
+          when its score (health-check latency divided by success rate) is this many
+          times better. Defaults to ``2``.
+    """
+
+    endpoints: dict[str, list[str]] = {}
+    methods: list[str] = READ_METHODS
+    max_failures: int = 3
+    health_check_interval: float = 5
+    fallback_penalty: float = 2
+
+
+class PrivateTransactionsConfig(PluginConfig):
+    """
+    Configuration for sending private transactions with ``send_private_transactions()``.
+
+    Args:
+        max_concurrent_sends (int): The number of ``eth_sendPrivateTransaction``
+          requests to have in flight at once. Defaults to ``16``.
+    """
+
+    max_concurrent_sends: int = 16
+
+
+class ReceiptsConfig(PluginConfig):
+    """
+    Configuration for waiting for receipts, such as when sending transactions.
+
+    Args:
+        poll_interval (float | None): The number of seconds between checks for a new
+          block when not using a ``newHeads`` subscription. Defaults to half the
+          network's block time.
+    """
+
+    poll_interval: float | None = None
+
+
+class MulticallConfig(PluginConfig):
+    """
+    Configuration for aggregating ``eth_call`` requests into Multicall3
+    ``aggregate3`` calls.
+
+    Args:
+        enabled (bool): Set to ``True`` to aggregate calls made at about the
+          same time, or queued in the same batch. Defaults to ``False``.
+        address (str): The Multicall3 contract address. Defaults to
+          ``0xcA11bde05977b3631167028862bE2a173976CA11``.
+        window (float): The number of seconds queued calls wait for others to join
+          them. A call made while no others are queued is sent right away.
+          Defaults to ``0.005``.
+        max_calls (int): The most calls in one ``aggregate3`` call. Defaults to ``500``.
+        max_calldata_size (int): The most bytes of call data in one ``aggregate3``
+          call. Defaults to ``128_000``.
+    """
+
+    enabled: bool = False
+    address: str = "0xcA11bde05977b3631167028862bE2a173976CA11"
+    window: float = 0.005
+    max_calls: int = 500
+    max_calldata_size: int = 128_000
+
+
+class TokensConfig(PluginConfig):
+    """
+    Configuration for the token balance and metadata APIs.
+
+    Args:
+        max_tokens_per_request (int): The most token contracts to get the balances
+          of in one ``alchemy_getTokenBalances`` request. Defaults to ``100``.
+        metadata_cache_size_mb (int): The maximum size of the persistent token
+          metadata cache, in megabytes. The least-recently used metadata is evicted
+          past this size. Defaults to ``64``.
+    """
+
+    max_tokens_per_request: int = 100
+    metadata_cache_size_mb: int = 64
+
+
+class NetworkMetadataConfig(PluginConfig):
+    """
+    Chain metadata declared for a network, so it is not detected on connect.
+
+    Args:
+        chain_id (int | None): The network's chain ID. Defaults to ``None`` (detect).
+        is_poa (bool | None): Whether the network's blocks have POA ``extraData``.
+          Defaults to ``None`` (detect).
+    """
+
+    chain_id: int | None = None
+    is_poa: bool | None = None
+
+
+class ConnectConfig(PluginConfig):
+    """
+    Configuration for connecting, which detects the chain ID and whether the
+    chain uses POA ``extraData`` (up to three requests).
+
+    Args:
+        metadata_ttl (float): The number of seconds to re-use the chain metadata
+          detected for a URI, stored in the plugin's data folder. ``0`` detects it
+          on every connect. Defaults to ``86_400`` (one day).
+        networks (dict[str, NetworkMetadataConfig]): Chain metadata declared per
+          network, such as ``ethereum:mainnet``, which is never detected.
+    """
+
+    metadata_ttl: float = 86_400
+    networks: dict[str, NetworkMetadataConfig] = {}
 
 
 class AlchemyConfig(PluginConfig):
@@ -33,7 +391,48 @@ class AlchemyConfig(PluginConfig):
         rate_limit (RateLimitConfig): The rate limiting configuration.
         trace_timeout (int): The maximum amount of milliseconds to wait for a
           trace. Defaults to ``10_000`` (10 seconds).
+        combine_traces (bool): Set to ``True`` to fetch a trace's call tree, result and
+          prestate together in one batch request, sharing the results. Otherwise,
+          each is fetched only when needed. Defaults to ``False``.
+        stream_traces (bool): Set to ``True`` to stream full call traces into a
+          temporary file and parse each call frame only when it is used, rather than
+          loading the whole trace into memory. Defaults to ``False``.
+        max_batch_size (int): The maximum number of calls to send in a single
+          JSON-RPC batch request. Larger batches are split. Defaults to ``1_000``,
+          which is the most Alchemy accepts over HTTP.
+        http (HTTPConfig): The HTTP session configuration.
+        cache (CacheConfig): The persistent RPC result cache configuration.
+        memoize (MemoizeConfig): The in-memory read memoization configuration.
+        logs (LogsConfig): The ``eth_getLogs`` range configuration.
+        websocket (WebSocketConfig): The WebSocket transport configuration.
+        connect (ConnectConfig): The chain metadata configuration used on connect.
+        metrics (MetricsConfig): The request stats configuration.
+        hedge (HedgeConfig): The read-request hedging configuration.
+        api_keys (ApiKeysConfig): The configuration for using several API keys.
+        failover (FailoverConfig): The fallback endpoints configuration.
+        private_transactions (PrivateTransactionsConfig): The private transaction
+          sending configuration.
+        receipts (ReceiptsConfig): The receipt waiting configuration.
+        multicall (MulticallConfig): The ``eth_call`` aggregation configuration.
+        tokens (TokensConfig): The token balance and metadata configuration.
     """
 
     rate_limit: RateLimitConfig = RateLimitConfig()
     trace_timeout: str = "10s"
+    combine_traces: bool = False
+    stream_traces: bool = False
+    max_batch_size: int = 1_000
+    http: HTTPConfig = HTTPConfig()
+    cache: CacheConfig = CacheConfig()
+    memoize: MemoizeConfig = MemoizeConfig()
+    logs: LogsConfig = LogsConfig()
+    websocket: WebSocketConfig = WebSocketConfig()
+    connect: ConnectConfig = ConnectConfig()
+    metrics: MetricsConfig = MetricsConfig()
+    hedge: HedgeConfig = HedgeConfig()
+    api_keys: ApiKeysConfig = ApiKeysConfig()
+    failover: FailoverConfig = FailoverConfig()
+    private_transactions: PrivateTransactionsConfig = PrivateTransactionsConfig()
+    receipts: ReceiptsConfig = ReceiptsConfig()
+    multicall: MulticallConfig = MulticallConfig()
+    tokens: TokensConfig = TokensConfig()
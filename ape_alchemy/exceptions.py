@@ -1,3 +1,5 @@
+from typing import Any
+
 from ape.exceptions import ProviderError
 
 
@@ -6,6 +8,11 @@ class AlchemyProviderError(ProviderError):
     An error raised by the Alchemy provider plugin.
     """
 
+    def __init__(self, message: str, data: Any = None):
+        super().__init__(message)
+        # The error's data from the node, such as the revert data of a custom error.
+        self.data = data
+
 
 class AlchemyFeatureNotAvailable(AlchemyProviderError):
     """
@@ -14,6 +21,13 @@ class AlchemyFeatureNotAvailable(AlchemyProviderError):
     """
 
 
+class AlchemyRateLimitError(AlchemyProviderError):
+    """
+    An error raised when Alchemy rejects a request for exceeding
+    the app's compute-unit capacity.
+    """
+
+
 # TODO: Delete this error in 0.9
 class MissingProjectKeyError(AlchemyProviderError):
     """
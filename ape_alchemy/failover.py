@@ -0,0 +1,179 @@
+import time
+from collections.abc import Callable
+from threading import Lock, Thread
+from typing import Any
+
+from requests.exceptions import ConnectionError, HTTPError, Timeout
+from urllib3.exceptions import ProtocolError
+
+# The weight of the newest sample in the moving averages.
+SMOOTHING = 0.2
+
+
+class EndpointHealth:
+    """
+    The health of a single endpoint.
+    """
+
+    __slots__ = (
+        "checking",
+        "consecutive_failures",
+        "is_down",
+        "latency",
+        "next_check",
+        "success_rate",
+    )
+
+    def __init__(self) -> None:
+        # The moving average of the health-check latency.
+        self.latency: float | None = None
+        # The moving average of the share of requests that succeeded.
+        self.success_rate = 1.0
+        self.consecutive_failures = 0
+        self.is_down = False
+        self.next_check = 0.0
+        self.checking = False
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "latency": self.latency,
+            "success_rate": self.success_rate,
+            "consecutive_failures": self.consecutive_failures,
+            "is_down": self.is_down,
+        }
+
+
+class EndpointRouter:
+    """
+    Routes requests to the healthiest of a primary endpoint and its fallbacks.
+    Each endpoint is scored by its health-check latency divided by the success
+    rate of its recent requests. An endpoint is taken out of rotation after
+    ``max_failures`` failed requests in a row, or a failed health check, until
+    a health check passes.
+
+    Health checks run in the background, at most every ``health_check_interval``
+    seconds per endpoint, and only while requests are being routed.
+
+    Args:
+        primary (str): The primary endpoint.
+        fallbacks (list[str]): The fallback endpoints.
+        check (Callable[[str], bool]): Checks the health of an endpoint.
+        max_failures (int): The number of failures in a row that take an
+          endpoint out of rotation.
+        health_check_interval (float): The number of seconds between health
+          checks of each endpoint.
+        fallback_penalty (float): The factor fallback scores are multiplied by,
+          so a healthy primary is preferred.
+    """
+
+    def __init__(
+        self,
+        primary: str,
+        fallbacks: list[str],
+        check: Callable[[str], bool],
+        max_failures: int = 3,
+        health_check_interval: float = 5,
+        fallback_penalty: float = 2,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.primary = primary
+        self.endpoints = [primary, *[uri for uri in fallbacks if uri != primary]]
+        self.max_failures = max_failures
+        self.health_check_interval = health_check_interval
+        self.fallback_penalty = fallback_penalty
+        self._check = check
+        self._clock = clock
+        self._lock = Lock()
+        self._health = {uri: EndpointHealth() for uri in self.endpoints}
+
+    def __getitem__(self, endpoint: str) -> dict[str, Any]:
+        with self._lock:
+            return self._health[endpoint].to_dict()
+
+    def select(self) -> str:
+        """
+        The endpoint to send the next request to.
+        """
+        with self._lock:
+            due = self._get_due_checks()
+            healthy = [uri for uri in self.endpoints if not self._health[uri].is_down]
+            # NOTE: When all are down, the request still goes to the primary.
+            endpoint = min(healthy, key=self._get_score) if healthy else self.primary
+
+        for uri in due:
+            Thread(target=self._run_check, args=(uri,), daemon=True).start()
+
+        return endpoint
+
+    def record(self, endpoint: str, failed: bool):
+        """
+        Record the outcome of a request sent to an endpoint.
+        """
+        with self._lock:
+            self._record(self._health[endpoint], failed)
+
+    def to_dict(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            return {uri: self._health[uri].to_dict() for uri in self.endpoints}
+
+    def _get_score(self, endpoint: str) -> float:
+        health = self._health[endpoint]
+        if health.latency is None:
+            # NOTE: Until checked, prefer the primary and avoid the fallbacks.
+            return 0.0 if endpoint == self.primary else float("inf")
+
+        score = health.latency / max(health.success_rate, 0.01)
+        return score if endpoint == self.primary else score * self.fallback_penalty
+
+    def _get_due_checks(self) -> list[str]:
+        now = self._clock()
+        due = []
+        for uri, health in self._health.items():
+            if not health.checking and health.next_check <= now:
+                health.checking = True
+                due.append(uri)
+
+        return due
+
+    def _run_check(self, endpoint: str):
+        started = self._clock()
+        try:
+            healthy = self._check(endpoint)
+        except Exception:
+            healthy = False
+
+        latency = self._clock() - started
+        with self._lock:
+            health = self._health[endpoint]
+            health.checking = False
+            health.next_check = self._clock() + self.health_check_interval
+            if healthy:
+                health.latency = (
+                    latency
+                    if health.latency is None
+                    else (1 - SMOOTHING) * health.latency + SMOOTHING * latency
+                )
+
+            self._record(health, not healthy)
+            # NOTE: Unlike requests, health checks are definitive.
+            health.is_down = not healthy
+
+    def _record(self, health: EndpointHealth, failed: bool):
+        health.success_rate = (1 - SMOOTHING) * health.success_rate + SMOOTHING * (not failed)
+        if failed:
+            health.consecutive_failures += 1
+            health.is_down = health.is_down or health.consecutive_failures >= self.max_failures
+        else:
+            health.consecutive_failures = 0
+            health.is_down = False
+
+
+def is_endpoint_failure(err: Exception) -> bool:
+    """
+    Whether an error is the endpoint's fault, such as a dropped connection,
+    a timeout or a server error, rather than the request's.
+    """
+    if isinstance(err, HTTPError):
+        return err.response is not None and err.response.status_code >= 500
+
+    return isinstance(err, ConnectionError | Timeout | ProtocolError)
@@ -0,0 +1,108 @@
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from threading import Lock, Thread
+from typing import Any
+
+
+class HedgeBudget:
+    """
+    Caps the compute units spent on hedged (duplicate) requests to a percentage
+    of the compute units of all requests that could be hedged, and the number
+    of hedges in flight, so hedges never queue behind each other.
+    """
+
+    def __init__(self, max_extra_percent: float, max_in_flight: int | None = None):
+        self.max_extra_percent = max_extra_percent
+        self.max_in_flight = max_in_flight
+        self.compute_units = 0
+        self.hedged_compute_units = 0
+        self.in_flight = 0
+        self._lock = Lock()
+
+    def add(self, compute_units: int):
+        """
+        Count a request that could be hedged.
+        """
+        with self._lock:
+            self.compute_units += compute_units
+
+    def spend(self, compute_units: int) -> bool:
+        """
+        Take the compute units of a hedge from the budget. Returns ``False``,
+        taking nothing, when they would exceed it or too many hedges are in flight.
+        Call :meth:`finish` once the hedge is done.
+        """
+        with self._lock:
+            if self.max_in_flight is not None and self.in_flight >= self.max_in_flight:
+                return False
+
+            limit = self.compute_units * self.max_extra_percent / 100
+            if self.hedged_compute_units + compute_units > limit:
+                return False
+
+            self.hedged_compute_units += compute_units
+            self.in_flight += 1
+            return True
+
+    def finish(self):
+        """
+        Count a hedge as done.
+        """
+        with self._lock:
+            self.in_flight = max(self.in_flight - 1, 0)
+
+
+def send_hedged(
+    executor: Executor,
+    func: Callable[[], Any],
+    delay: float,
+    can_hedge: Callable[[], bool],
+    on_hedged: Callable[[], None] | None = None,
+) -> Any:
+    """
+    Call ``func`` and, if it has not returned after ``delay`` seconds and
+    ``can_hedge()``, call it again on the executor. Returns whichever result
+    comes first. Only raises once both calls fail, with the first call's error.
+
+    The first call starts at once on its own thread, rather than queuing for
+    the executor, so requests that never hedge are not limited by its workers
+    and the delay only counts time spent on the request.
+
+    Args:
+        executor (Executor): Runs the hedges.
+        func (Callable[[], Any]): The request. Must be safe to send twice.
+        delay (float): The number of seconds to wait before hedging.
+        can_hedge (Callable[[], bool]): Called once the delay passes.
+        on_hedged (Callable[[], None] | None): Called once a hedge finishes.
+
+    Returns:
+        Any: The first result.
+    """
+    primary: Future = Future()
+
+    def send():
+        try:
+            primary.set_result(func())
+        except BaseException as err:
+            primary.set_exception(err)
+
+    Thread(target=send, daemon=True, name="alchemy-request").start()
+    # NOTE: Not `primary.result(timeout=...)`, which cannot tell a timeout raised
+    #   by the request apart from running out of time waiting for it.
+    done, _ = wait([primary], timeout=delay)
+    if done or not can_hedge():
+        return primary.result()
+
+    hedge = executor.submit(func)
+    if on_hedged is not None:
+        hedge.add_done_callback(lambda _: on_hedged())
+
+    pending = {primary, hedge}
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        # NOTE: Prefer the first call when both are done.
+        for future in sorted(done, key=lambda f: f is not primary):
+            if future.exception() is None:
+                return future.result()
+
+    return primary.result()
@@ -0,0 +1,137 @@
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from threading import Lock, local
+from typing import TYPE_CHECKING, Any
+
+from web3 import HTTPProvider
+
+if TYPE_CHECKING:
+    from .rate_limit import ComputeUnitBucket
+
+# The ways of choosing the API key for each request.
+ROUND_ROBIN = "round-robin"
+LEAST_LOADED = "least-loaded"
+COMPUTE_UNITS = "compute-units"
+
+
+class ApiKeyPool:
+    """
+    Spreads requests across the URIs of several Alchemy API keys (apps).
+    A URI that gets rate-limited is skipped until its cooldown passes.
+
+    Args:
+        uris (list[str]): The URI of each API key.
+        strategy (str): ``round-robin``, ``least-loaded`` (fewest requests in flight)
+          or ``compute-units`` (most compute units left in its rate-limit budget).
+        cooldown (float): The number of seconds to skip a rate-limited URI.
+        get_bucket (Callable[[str], ComputeUnitBucket | None] | None): Get the
+          rate-limit budget of a URI, for the ``compute-units`` strategy.
+    """
+
+    def __init__(
+        self,
+        uris: list[str],
+        strategy: str = ROUND_ROBIN,
+        cooldown: float = 30,
+        get_bucket: Callable[[str], "ComputeUnitBucket | None"] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.uris = uris
+        self.strategy = strategy
+        self.cooldown = cooldown
+        self._get_bucket = get_bucket
+        self._clock = clock
+        self._lock = Lock()
+        self._next = 0
+        self._in_flight = dict.fromkeys(uris, 0)
+        self._cooldowns: dict[str, float] = {}
+
+    def __len__(self) -> int:
+        return len(self.uris)
+
+    def select(self) -> str:
+        """
+        The URI to send the next request to.
+        """
+        if len(self.uris) == 1:
+            return self.uris[0]
+
+        with self._lock:
+            now = self._clock()
+            # NOTE: Rotate the order, so ties go round-robin.
+            uris = self.uris[self._next :] + self.uris[: self._next]
+            self._next = (self._next + 1) % len(self.uris)
+            available = [uri for uri in uris if self._cooldowns.get(uri, 0) <= now]
+            if not available:
+                # NOTE: All are cooling down, so use the one that is done soonest.
+                return min(uris, key=lambda uri: self._cooldowns[uri])
+
+            if self.strategy == LEAST_LOADED:
+                return min(available, key=lambda uri: self._in_flight[uri])
+
+            if self.strategy == COMPUTE_UNITS and self._get_bucket is not None:
+                return max(available, key=self._get_remaining_compute_units)
+
+            return available[0]
+
+    @contextmanager
+    def use(self) -> Iterator[str]:
+        """
+        Select a URI and count a request in flight to it until the context exits.
+        """
+        uri = self.select()
+        with self._lock:
+            self._in_flight[uri] += 1
+
+        try:
+            yield uri
+        finally:
+            with self._lock:
+                self._in_flight[uri] -= 1
+
+    def eject(self, uri: str):
+        """
+        Skip a rate-limited URI until its cooldown passes.
+        """
+        if len(self.uris) > 1:
+            with self._lock:
+                self._cooldowns[uri] = self._clock() + self.cooldown
+
+    def is_cooling_down(self, uri: str) -> bool:
+        return self._cooldowns.get(uri, 0) > self._clock()
+
+    def _get_remaining_compute_units(self, uri: str) -> float:
+        bucket = self._get_bucket(uri) if self._get_bucket else None
+        return bucket.remaining() if bucket else 0.0
+
+
+class AlchemyHTTPProvider(HTTPProvider):
+    """
+    An HTTP provider whose endpoint can be switched per thread, for sending
+    requests to the URIs of different API keys.
+    """
+
+    def __init__(self, endpoint_uri: str, **kwargs: Any):
+        self._endpoints = local()
+        super().__init__(endpoint_uri, **kwargs)
+
+    @property  # type: ignore[override]
+    def endpoint_uri(self) -> Any:
+        return getattr(self._endpoints, "uri", None) or self._default_endpoint_uri
+
+    @endpoint_uri.setter
+    def endpoint_uri(self, value: Any):
+        self._default_endpoint_uri = value
+
+    @contextmanager
+    def use_endpoint(self, uri: str) -> Iterator[None]:
+        """
+        Send the current thread's requests to the given URI until the context exits.
+        """
+        previous = getattr(self._endpoints, "uri", None)
+        self._endpoints.uri = uri
+        try:
+            yield
+        finally:
+            self._endpoints.uri = previous
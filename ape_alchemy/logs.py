@@ -0,0 +1,130 @@
+import re
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+from .exceptions import AlchemyProviderError
+
+if TYPE_CHECKING:
+    from ape.types import ContractLog, LogFilter
+
+    from .provider import Alchemy
+
+# Alchemy's (and other nodes') errors for `eth_getLogs` ranges that are too large.
+_RANGE_TOO_LARGE_PATTERNS = (
+    "log response size exceeded",
+    "block range",
+    "range too large",
+    "range is too large",
+    "query returned more than",
+    "response size",
+    "10000 results",
+)
+
+# e.g. "... this block range should work: [0x1298a6c, 0x12993e5]"
+_SUGGESTED_RANGE_PATTERN = re.compile(r"\[(0x[0-9a-fA-F]+),\s*(0x[0-9a-fA-F]+)\]")
+
+
+def is_range_too_large(error: Exception) -> bool:
+    """
+    Whether an ``eth_getLogs`` error was caused by too many blocks or logs.
+    """
+    message = str(error).lower()
+    return any(pattern in message for pattern in _RANGE_TOO_LARGE_PATTERNS)
+
+
+def get_suggested_page_size(error: Exception) -> int | None:
+    """
+    The block-range size suggested in Alchemy's error message, if any.
+    """
+    if match := _SUGGESTED_RANGE_PATTERN.search(str(error)):
+        start, stop = (int(n, 16) for n in match.groups())
+        return max(stop - start + 1, 1)
+
+    return None
+
+
+class LogQuery:
+    """
+    Fetches logs in block ranges that adapt to Alchemy's limits: a range
+    is split when Alchemy rejects it, and ranges grow while results are sparse.
+    Ranges are fetched concurrently but the logs are yielded in block order,
+    holding at most a few pages in memory at a time.
+    """
+
+    def __init__(self, provider: "Alchemy", log_filter: "LogFilter", start: int, stop: int):
+        logs_config = provider.config.logs
+        self.provider = provider
+        self.log_filter = log_filter
+        self.start = start
+        self.stop = stop
+        self.max_page_size = max(logs_config.max_page_size, 1)
+        self.target_logs_per_page = logs_config.target_logs_per_page
+        self.page_size = min(
+            logs_config.initial_page_size or provider.block_page_size, self.max_page_size
+        )
+
+    def __iter__(self) -> Iterator["ContractLog"]:
+        concurrency = max(self.provider.concurrency, 1)
+        pending: deque[tuple[int, int, Future]] = deque()
+        next_start = self.start
+        pool = ThreadPoolExecutor(concurrency)
+        try:
+            while pending or next_start <= self.stop:
+                while next_start <= self.stop and len(pending) < concurrency:
+                    stop = min(self.stop, next_start + self.page_size - 1)
+                    pending.append((next_start, stop, pool.submit(self._fetch, next_start, stop)))
+                    next_start = stop + 1
+
+                start, stop, future = pending.popleft()
+                try:
+                    logs = future.result()
+                except AlchemyProviderError as err:
+                    if not is_range_too_large(err) or start == stop:
+                        raise
+
+                    self._shrink(err, stop - start + 1)
+                    yield from self._fetch_sequentially(start, stop)
+                else:
+                    self._grow(len(logs))
+                    yield from self.provider.network.ecosystem.decode_logs(
+                        logs, *self.log_filter.events
+                    )
+
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _fetch_sequentially(self, start: int, stop: int) -> Iterator["ContractLog"]:
+        while start <= stop:
+            page_stop = min(stop, start + self.page_size - 1)
+            try:
+                logs = self._fetch(start, page_stop)
+            except AlchemyProviderError as err:
+                if not is_range_too_large(err) or start == page_stop:
+                    raise
+
+                self._shrink(err, page_stop - start + 1)
+                continue
+
+            yield from self.provider.network.ecosystem.decode_logs(logs, *self.log_filter.events)
+            start = page_stop + 1
+
+    def _fetch(self, start: int, stop: int) -> list[dict]:
+        page_filter = self.log_filter.model_copy(update={"start_block": start, "stop_block": stop})
+        # NOTE: Using JSON mode since used as request data.
+        filter_params = page_filter.model_dump(mode="json")
+        result = self.provider.make_request("eth_getLogs", [filter_params])
+        if isinstance(result, dict) and "error" in result:
+            raise self.provider._get_rpc_error(result["error"])
+
+        return result
+
+    def _shrink(self, error: Exception, failed_page_size: int):
+        suggested = get_suggested_page_size(error)
+        page_size = suggested if suggested is not None else failed_page_size // 2
+        self.page_size = max(min(page_size, failed_page_size - 1), 1)
+
+    def _grow(self, num_logs: int):
+        if num_logs < self.target_logs_per_page // 2:
+            self.page_size = min(self.page_size * 2, self.max_page_size)
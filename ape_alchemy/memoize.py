@@ -0,0 +1,109 @@
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from threading import Lock
+from typing import Any
+
+# Methods with results that do not depend on the block.
+BLOCK_INDEPENDENT_METHODS = ("eth_chainId", "net_version")
+
+# The block-tag parameter index of each memoizable method, if it has one.
+_BLOCK_TAG_INDEX = {
+    "eth_call": 1,
+    "eth_getBalance": 1,
+    "eth_getCode": 1,
+    "eth_getStorageAt": 2,
+    "eth_getTransactionCount": 1,
+}
+
+
+def get_memo_key(rpc: str, parameters: list) -> str | None:
+    """
+    The memoization key of a request, or ``None`` when the request is not for the
+    head block, such as an ``eth_call`` at a specific block number.
+    """
+    index = _BLOCK_TAG_INDEX.get(rpc)
+    if index is not None and len(parameters) > index and parameters[index] != "latest":
+        return None
+
+    try:
+        return f"{rpc}:{json.dumps(parameters, sort_keys=True)}"
+    except TypeError:
+        return None
+
+
+class BlockScopedLRUCache:
+    """
+    A bounded, in-memory LRU cache of read results, scoped to the head block.
+    Entries expire after their method's TTL or when a newer head block is seen,
+    whichever comes first.
+    """
+
+    def __init__(self, max_entries: int, clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self.head: int | None = None
+        self.hits = 0
+        self.misses = 0
+        self._clock = clock
+        self._lock = Lock()
+        # key -> (expiration, head, rpc, value)
+        self._entries: OrderedDict[str, tuple[float, int | None, str, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> dict[str, float]:
+        """
+        The number of hits and misses, and the hit rate.
+        """
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            if (entry := self._entries.get(key)) is None:
+                self.misses += 1
+                return None
+
+            expiration, head, rpc, value = entry
+            if self._clock() >= expiration or (
+                rpc not in BLOCK_INDEPENDENT_METHODS and head != self.head
+            ):
+                del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, rpc: str, value: Any, ttl: float):
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl, self.head, rpc, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def set_head(self, block_number: int):
+        """
+        Record the latest block number. Seeing a new head block
+        invalidates all block-scoped entries.
+        """
+        with self._lock:
+            if self.head is not None and block_number <= self.head:
+                return
+
+            self.head = block_number
+            scoped = [k for k, e in self._entries.items() if e[2] not in BLOCK_INDEPENDENT_METHODS]
+            for key in scoped:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
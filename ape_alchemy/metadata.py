@@ -0,0 +1,57 @@
+import json
+import os
+import time
+from hashlib import sha256
+from pathlib import Path
+from threading import Lock
+
+_LOCK = Lock()
+
+
+def get_chain_metadata(path: Path, uri: str, ttl: float) -> dict | None:
+    """
+    The chain ID and POA status last detected for a URI, unless older than ``ttl``
+    seconds. They are stored under a hash of the URI, since it contains the API key.
+
+    Returns:
+        dict | None: ``chain_id`` and ``is_poa``, when known.
+    """
+    if ttl <= 0:
+        return None
+
+    with _LOCK:
+        entries = _read(path)
+
+    entry = entries.get(_get_key(uri))
+    if not isinstance(entry, dict) or time.time() - entry.get("updated", 0) > ttl:
+        return None
+
+    return {"chain_id": entry.get("chain_id"), "is_poa": entry.get("is_poa")}
+
+
+def set_chain_metadata(path: Path, uri: str, chain_id: int, is_poa: bool | None):
+    """
+    Store the chain ID and POA status detected for a URI.
+    """
+    with _LOCK:
+        entries = _read(path)
+        entries[_get_key(uri)] = {"chain_id": chain_id, "is_poa": is_poa, "updated": time.time()}
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # NOTE: Replace the file atomically, since other processes may be reading it.
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        temp_path.write_text(json.dumps(entries))
+        os.replace(temp_path, path)
+
+
+def _get_key(uri: str) -> str:
+    return sha256(uri.encode()).hexdigest()[:16]
+
+
+def _read(path: Path) -> dict:
+    try:
+        entries = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+    return entries if isinstance(entries, dict) else {}
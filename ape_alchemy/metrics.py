@@ -0,0 +1,394 @@
+import time
+from bisect import bisect_left
+from collections import deque
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread, local
+from typing import Any
+from weakref import WeakSet
+
+try:
+    from opentelemetry import trace as otel_trace  # type: ignore[import-not-found]
+except ImportError:
+    # NOTE: Install `opentelemetry-api` to create a span for each request.
+    otel_trace = None
+
+# The upper bounds, in seconds, of the latency histogram buckets.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# The percentiles reported for each method.
+PERCENTILES = (50, 95, 99)
+
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+_COUNTERS = (
+    ("requests", "count", "Requests sent to Alchemy."),
+    ("errors", "errors", "Requests that failed."),
+    ("retries", "retries", "Retried attempts."),
+    ("rate_limited", "rate_limited", "Attempts rejected for exceeding the rate limit."),
+    ("cache_hits", "cache_hits", "Requests answered from the cache or memoized reads."),
+    ("hedged", "hedged", "Requests sent again for being slower than usual."),
+    ("sent_bytes", "bytes_sent", "Bytes sent over HTTP."),
+    ("received_bytes", "bytes_received", "Bytes received over HTTP."),
+    ("compute_units", "compute_units", "Estimated compute units used."),
+)
+
+# The bytes sent and received over HTTP by each thread, since last taken.
+_transfer = local()
+
+
+class MethodStats:
+    """
+    The stats of a single RPC method.
+    """
+
+    __slots__ = (
+        "buckets",
+        "bytes_received",
+        "bytes_sent",
+        "cache_hits",
+        "compute_units",
+        "count",
+        "errors",
+        "hedged",
+        "latency_sum",
+        "rate_limited",
+        "retries",
+        "samples",
+    )
+
+    def __init__(self, max_samples: int):
+        self.count = 0
+        self.errors = 0
+        self.retries = 0
+        self.rate_limited = 0
+        self.cache_hits = 0
+        self.hedged = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.compute_units = 0
+        self.latency_sum = 0.0
+        # NOTE: The last bucket counts latencies above the largest bound.
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.samples: deque[float] = deque(maxlen=max_samples)
+
+    def to_dict(self) -> dict[str, Any]:
+        samples = sorted(self.samples)
+        latency = {f"p{p}": _get_percentile(samples, p) for p in PERCENTILES}
+        num_timed = sum(self.buckets)
+        latency["mean"] = self.latency_sum / num_timed if num_timed else None
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "retries": self.retries,
+            "rate_limited": self.rate_limited,
+            "cache_hits": self.cache_hits,
+            "hedged": self.hedged,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "compute_units": self.compute_units,
+            "latency": latency,
+        }
+
+
+class RequestStats:
+    """
+    Counts, latencies and estimated compute units of the requests a provider
+    makes, per RPC method. Latency percentiles are of the most recent
+    ``max_samples`` requests of each method.
+    """
+
+    def __init__(self, labels: dict[str, str] | None = None, max_samples: int = 1_000):
+        self.labels = labels or {}
+        self.max_samples = max_samples
+        self.started = time.time()
+        self._lock = Lock()
+        self._methods: dict[str, MethodStats] = {}
+        _REGISTRY.add(self)
+
+    def __getitem__(self, rpc: str) -> dict[str, Any]:
+        with self._lock:
+            if (stats := self._methods.get(rpc)) is None:
+                raise KeyError(rpc)
+
+            return stats.to_dict()
+
+    def __contains__(self, rpc: str) -> bool:
+        return rpc in self._methods
+
+    @property
+    def methods(self) -> list[str]:
+        """
+        The RPC methods with stats.
+        """
+        return sorted(self._methods)
+
+    @property
+    def totals(self) -> dict[str, int]:
+        """
+        The counters summed across all methods.
+        """
+        with self._lock:
+            return {
+                attr: sum(getattr(s, attr) for s in self._methods.values())
+                for _, attr, _ in _COUNTERS
+            }
+
+    def record(
+        self,
+        rpc: str,
+        latency: float | None,
+        error: bool = False,
+        bytes_sent: int = 0,
+        bytes_received: int = 0,
+        compute_units: int = 0,
+    ):
+        """
+        Record a request.
+
+        Args:
+            rpc (str): The RPC method.
+            latency (float | None): The number of seconds the request took, retries included.
+            error (bool): Whether the request failed.
+            bytes_sent (int): The number of bytes sent.
+            bytes_received (int): The number of bytes received.
+            compute_units (int): The estimated compute units used.
+        """
+        with self._lock:
+            stats = self._get(rpc)
+            stats.count += 1
+            stats.errors += error
+            stats.bytes_sent += bytes_sent
+            stats.bytes_received += bytes_received
+            stats.compute_units += compute_units
+            if latency is not None:
+                stats.latency_sum += latency
+                stats.buckets[bisect_left(LATENCY_BUCKETS, latency)] += 1
+                stats.samples.append(latency)
+
+    def record_retries(self, rpcs: Iterable[str], retries: int, rate_limited: int):
+        """
+        Record retried attempts of a request, and how many were rate-limited.
+        """
+        with self._lock:
+            for rpc in rpcs:
+                stats = self._get(rpc)
+                stats.retries += retries
+                stats.rate_limited += rate_limited
+
+    def record_cache_hit(self, rpc: str):
+        with self._lock:
+            self._get(rpc).cache_hits += 1
+
+    def record_hedge(self, rpc: str):
+        with self._lock:
+            self._get(rpc).hedged += 1
+
+    def get_latency(self, rpc: str, percentile: float, min_samples: int = 1) -> float | None:
+        """
+        A percentile of the recent latencies of an RPC method, or ``None`` when
+        there are fewer than ``min_samples`` of them.
+        """
+        with self._lock:
+            if (stats := self._methods.get(rpc)) is None or len(stats.samples) < min_samples:
+                return None
+
+            samples = sorted(stats.samples)
+
+        return _get_percentile(samples, percentile)
+
+    def reset(self):
+        with self._lock:
+            self._methods.clear()
+            self.started = time.time()
+
+    def to_dict(self) -> dict[str, dict[str, Any]]:
+        """
+        The stats of each RPC method.
+        """
+        with self._lock:
+            return {rpc: stats.to_dict() for rpc, stats in sorted(self._methods.items())}
+
+    def to_openmetrics(self, prefix: str = "alchemy") -> str:
+        """
+        The stats in the OpenMetrics (and Prometheus) text format.
+        """
+        return render_openmetrics([self], prefix=prefix)
+
+    def _get(self, rpc: str) -> MethodStats:
+        if (stats := self._methods.get(rpc)) is None:
+            stats = MethodStats(self.max_samples)
+            self._methods[rpc] = stats
+
+        return stats
+
+
+# All stats, for the metrics server.
+_REGISTRY: WeakSet[RequestStats] = WeakSet()
+
+
+def render_openmetrics(all_stats: Iterable[RequestStats], prefix: str = "alchemy") -> str:
+    """
+    Render stats in the OpenMetrics text format, labeled by method and each stats' labels.
+    """
+    snapshots = []
+    for stats in all_stats:
+        with stats._lock:
+            methods = [
+                (
+                    rpc,
+                    {attr: getattr(m, attr) for _, attr, _ in _COUNTERS},
+                    list(m.buckets),
+                    m.latency_sum,
+                )
+                for rpc, m in sorted(stats._methods.items())
+            ]
+
+        snapshots.append((stats.labels, methods))
+
+    lines = []
+    for name, attr, description in _COUNTERS:
+        metric = f"{prefix}_{name}"
+        lines += [f"# TYPE {metric} counter", f"# HELP {metric} {description}"]
+        for labels, methods in snapshots:
+            for rpc, counters, _, _ in methods:
+                lines.append(f"{metric}_total{_format_labels(labels, method=rpc)} {counters[attr]}")
+
+    metric = f"{prefix}_request_duration_seconds"
+    lines += [f"# TYPE {metric} histogram", f"# HELP {metric} Request latency, retries included."]
+    for labels, methods in snapshots:
+        for rpc, _, buckets, latency_sum in methods:
+            cumulative = 0
+            for bound, count in zip((*LATENCY_BUCKETS, "+Inf"), buckets, strict=True):
+                cumulative += count
+                bucket_labels = _format_labels(labels, method=rpc, le=str(bound))
+                lines.append(f"{metric}_bucket{bucket_labels} {cumulative}")
+
+            method_labels = _format_labels(labels, method=rpc)
+            lines += [
+                f"{metric}_count{method_labels} {cumulative}",
+                f"{metric}_sum{method_labels} {latency_sum}",
+            ]
+
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+def start_metrics_server(port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """
+    Serve the stats of all providers in the OpenMetrics text format at
+    ``/metrics``, for Prometheus to scrape. Only one server runs per port.
+
+    Args:
+        port (int): The port.
+        host (str): The address to listen on. Defaults to ``127.0.0.1``.
+
+    Returns:
+        ``ThreadingHTTPServer``
+    """
+    if server := _SERVERS.get(port):
+        return server
+
+    with _SERVERS_LOCK:
+        if server := _SERVERS.get(port):
+            return server
+
+        server = ThreadingHTTPServer((host, port), _MetricsHandler)
+        Thread(target=server.serve_forever, daemon=True, name=f"alchemy-metrics-{port}").start()
+        _SERVERS[port] = server
+        return server
+
+
+_SERVERS: dict[int, ThreadingHTTPServer] = {}
+_SERVERS_LOCK = Lock()
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+
+        body = render_openmetrics(list(_REGISTRY)).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", OPENMETRICS_CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any):
+        # NOTE: Do not log each scrape.
+        pass
+
+
+@contextmanager
+def start_span(rpc: str, enabled: bool) -> Iterator[Any]:
+    """
+    An OpenTelemetry client span for a request, when ``enabled`` and
+    ``opentelemetry-api`` is installed. Yields ``None`` otherwise.
+    """
+    if not enabled or otel_trace is None:
+        yield None
+        return
+
+    tracer = otel_trace.get_tracer("ape_alchemy")
+    with tracer.start_as_current_span(
+        f"alchemy {rpc}",
+        kind=otel_trace.SpanKind.CLIENT,
+        attributes={"rpc.system": "jsonrpc", "rpc.method": rpc},
+    ) as span:
+        yield span
+
+
+def count_transfer(response: Any, *_, **kwargs) -> Any:
+    """
+    A ``requests`` response hook counting the bytes the current thread sent and
+    received. The bytes of streamed responses are counted using ``add_transfer()``
+    once read.
+    """
+    body = response.request.body
+    received = 0
+    if not kwargs.get("stream"):
+        content_length = response.headers.get("Content-Length")
+        received = int(content_length) if content_length else len(response.content)
+
+    add_transfer(len(body) if body else 0, received)
+    return response
+
+
+def add_transfer(sent: int, received: int):
+    """
+    Count bytes the current thread sent and received.
+    """
+    _transfer.sent = getattr(_transfer, "sent", 0) + sent
+    _transfer.received = getattr(_transfer, "received", 0) + received
+
+
+def take_transfer() -> tuple[int, int]:
+    """
+    The bytes sent and received by the current thread since last taken.
+    """
+    sent = getattr(_transfer, "sent", 0)
+    received = getattr(_transfer, "received", 0)
+    _transfer.sent = _transfer.received = 0
+    return sent, received
+
+
+def _get_percentile(samples: list[float], percentile: float) -> float | None:
+    if not samples:
+        return None
+
+    # NOTE: Nearest-rank.
+    index = max(int(len(samples) * percentile / 100 + 0.5) - 1, 0)
+    return samples[min(index, len(samples) - 1)]
+
+
+def _format_labels(labels: dict[str, str], **extra: str) -> str:
+    items = {**labels, **extra}
+    values = ",".join(f'{k}="{_escape(v)}"' for k, v in items.items())
+    return f"{{{values}}}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
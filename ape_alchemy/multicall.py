@@ -0,0 +1,283 @@
+from collections.abc import Iterator
+from concurrent.futures import Future
+from threading import Condition, Thread, current_thread, local
+from typing import TYPE_CHECKING, Any
+
+from ape.logging import logger
+from eth_abi import decode, encode
+from eth_utils import to_hex
+from hexbytes import HexBytes
+
+from .exceptions import AlchemyProviderError
+
+if TYPE_CHECKING:
+    from .provider import Alchemy
+
+# The same address on most chains. See https://www.multicall3.com
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+# aggregate3((address target, bool allowFailure, bytes callData)[])
+AGGREGATE3_SELECTOR = HexBytes("0x82ad56cb")
+# Error(string) and Panic(uint256)
+ERROR_SELECTOR = HexBytes("0x08c379a0")
+PANIC_SELECTOR = HexBytes("0x4e487b71")
+
+
+class PendingCall:
+    """
+    An ``eth_call`` waiting to be aggregated.
+    """
+
+    __slots__ = ("block_id", "data", "future", "parameters", "target")
+
+    def __init__(self, parameters: list):
+        self.parameters = parameters
+        self.target = parameters[0]["to"]
+        self.data = HexBytes(parameters[0].get("data") or parameters[0].get("input") or b"")
+        self.block_id = parameters[1] if len(parameters) > 1 else "latest"
+        self.future: Future[str] = Future()
+
+
+class CallAggregator:
+    """
+    Collects ``eth_call`` requests made at about the same time and sends those
+    at the same block as Multicall3 ``aggregate3`` calls, so many reads cost a
+    few requests. Each call may fail on its own, without failing the others.
+
+    A call made while no others are queued is sent straight away. Otherwise, the
+    queued calls wait up to ``window`` seconds for others to join them. The aggregated
+    calls are split into chunks of at most ``max_calls`` calls and
+    ``max_calldata_size`` bytes, and all chunks are sent in one batch request.
+    A chunk that fails, such as from running out of gas or a response that is
+    too large, is split in half and sent again. A call that fails without revert
+    data, which may be from running out of gas, and calls where Multicall3 is not
+    deployed are sent on their own.
+
+    Calls are made by the Multicall3 contract, so only calls without a sender
+    or value are aggregated.
+
+    Args:
+        provider (:class:`~ape_alchemy.provider.Alchemy`): The provider.
+        address (str): The Multicall3 contract address.
+        window (float): The number of seconds to wait for more calls.
+        max_calls (int): The most calls in one ``aggregate3`` call.
+        max_calldata_size (int): The most bytes of call data in one ``aggregate3`` call.
+    """
+
+    def __init__(
+        self,
+        provider: "Alchemy",
+        address: str = MULTICALL3_ADDRESS,
+        window: float = 0.005,
+        max_calls: int = 500,
+        max_calldata_size: int = 128_000,
+    ):
+        self.provider = provider
+        self.address = address
+        self.window = window
+        self.max_calls = max(max_calls, 1)
+        self.max_calldata_size = max_calldata_size
+        self._condition = Condition()
+        self._queue: list[PendingCall] = []
+        self._thread: Thread | None = None
+        self._stopped = False
+        self._local = local()
+
+    def accepts(self, parameters: list) -> bool:
+        """
+        Whether an ``eth_call`` can be aggregated.
+        """
+        if len(parameters) not in (1, 2) or not isinstance(parameters[0], dict):
+            # NOTE: Calls with state overrides cannot be aggregated.
+            return False
+
+        txn = parameters[0]
+        value = txn.get("value") or 0
+        return (
+            # NOTE: The aggregated calls themselves are sent from the aggregating thread.
+            not getattr(self._local, "is_aggregating", False)
+            and bool(txn.get("to"))
+            and not txn.get("from")
+            and (int(value, 16) if isinstance(value, str) else value) == 0
+        )
+
+    def submit(self, parameters: list) -> "Future[str]":
+        """
+        Queue an ``eth_call`` to be aggregated.
+
+        Args:
+            parameters (list): The ``eth_call`` parameters.
+
+        Returns:
+            Future[str]: The call's return data, as hex, or the error of a failed call.
+        """
+        return self.submit_many([parameters])[0]
+
+    def submit_many(self, calls: list[list]) -> "list[Future[str]]":
+        """
+        Queue several ``eth_call`` requests to be aggregated together.
+
+        Args:
+            calls (list[list]): The parameters of each ``eth_call``.
+
+        Returns:
+            list[Future[str]]: The return data, as hex, or the error of each call.
+        """
+        pending = [PendingCall(parameters) for parameters in calls]
+        with self._condition:
+            self._queue.extend(pending)
+            if self._thread is None:
+                self._stopped = False
+                self._thread = Thread(target=self._run, daemon=True, name="alchemy-multicall")
+                self._thread.start()
+
+            self._condition.notify_all()
+
+        return [call.future for call in pending]
+
+    def stop(self):
+        """
+        Stop aggregating, failing the calls still queued.
+        """
+        with self._condition:
+            self._stopped = True
+            queue, self._queue = self._queue, []
+            self._thread = None
+            self._condition.notify_all()
+
+        for call in queue:
+            if not call.future.done():
+                call.future.set_exception(AlchemyProviderError("Stopped aggregating calls."))
+
+    def _run(self):
+        self._local.is_aggregating = True
+        while True:
+            with self._condition:
+                if self._stopped or not self._queue:
+                    if current_thread() is self._thread:
+                        self._thread = None
+
+                    return
+
+                # NOTE: Wait for more calls to join, unless there are already plenty.
+                #   A lone call is sent right away; calls made meanwhile queue behind it.
+                if len(self._queue) > 1:
+                    self._condition.wait_for(
+                        lambda: self._stopped or len(self._queue) >= self.max_calls, self.window
+                    )
+
+                queue, self._queue = self._queue, []
+
+            try:
+                self._send(queue)
+            except Exception as err:
+                for call in queue:
+                    if not call.future.done():
+                        call.future.set_exception(err)
+
+    def _send(self, calls: list[PendingCall]):
+        by_block: dict[Any, list[PendingCall]] = {}
+        for call in calls:
+            by_block.setdefault(call.block_id, []).append(call)
+
+        chunks = [chunk for group in by_block.values() for chunk in self._chunk(group)]
+        while chunks:
+            with self.provider.batch_requests() as batch:
+                sent = [
+                    (chunk, batch.add("eth_call", self._get_parameters(chunk))) for chunk in chunks
+                ]
+
+            chunks = []
+            for chunk, future in sent:
+                chunks.extend(self._resolve(chunk, future))
+
+    def _chunk(self, calls: list[PendingCall]) -> Iterator[list[PendingCall]]:
+        chunk: list[PendingCall] = []
+        size = 0
+        for call in calls:
+            if chunk and (
+                len(chunk) >= self.max_calls or size + len(call.data) > self.max_calldata_size
+            ):
+                yield chunk
+                chunk, size = [], 0
+
+            chunk.append(call)
+            size += len(call.data)
+
+        if chunk:
+            yield chunk
+
+    def _get_parameters(self, chunk: list[PendingCall]) -> list:
+        if len(chunk) == 1:
+            return chunk[0].parameters
+
+        data = AGGREGATE3_SELECTOR + encode(
+            ["(address,bool,bytes)[]"], [[(call.target, True, call.data) for call in chunk]]
+        )
+        return [{"to": self.address, "data": to_hex(data)}, chunk[0].block_id]
+
+    def _resolve(self, chunk: list[PendingCall], future: Future) -> list[list[PendingCall]]:
+        """
+        Resolve the calls of a sent chunk. Returns the chunks to send again.
+        """
+        if len(chunk) == 1:
+            try:
+                chunk[0].future.set_result(future.result())
+            except Exception as err:
+                chunk[0].future.set_exception(err)
+
+            return []
+
+        try:
+            result = HexBytes(future.result())
+            if not result:
+                # NOTE: Multicall3 is not deployed (at this block), so send the calls on their own.
+                logger.debug(f"No Multicall3 at '{self.address}'. Sending calls on their own.")
+                return [[call] for call in chunk]
+
+            (results,) = decode(["(bool,bytes)[]"], result)
+            if len(results) != len(chunk):
+                raise AlchemyProviderError(
+                    f"Expected {len(chunk)} aggregated results but received {len(results)}."
+                )
+
+        except Exception as err:
+            middle = len(chunk) // 2
+            logger.debug(f"Splitting {len(chunk)} aggregated calls: {err}")
+            return [chunk[:middle], chunk[middle:]]
+
+        retry = []
+        for call, (success, return_data) in zip(chunk, results, strict=True):
+            if success:
+                call.future.set_result(to_hex(return_data))
+            elif not return_data:
+                # NOTE: Failing without data may be from running out of gas, such as by
+                #   only getting 63/64 of the gas left, so send the call on its own.
+                retry.append([call])
+            else:
+                # NOTE: Fails like the call would on its own, keeping the revert data.
+                error = {
+                    "code": 3,
+                    "message": get_revert_message(return_data),
+                    "data": to_hex(return_data),
+                }
+                call.future.set_exception(self.provider._get_rpc_error(error))
+
+        return retry
+
+
+def get_revert_message(data: bytes) -> str:
+    """
+    The ``eth_call`` error message for the data of a failed call.
+    """
+    data = HexBytes(data)
+    try:
+        if data[:4] == ERROR_SELECTOR:
+            return f"execution reverted: {decode(['string'], data[4:])[0]}"
+
+        if data[:4] == PANIC_SELECTOR:
+            return f"execution reverted: Panic({decode(['uint256'], data[4:])[0]:#x})"
+
+    except Exception:
+        pass
+
+    return "execution reverted"
@@ -1,26 +1,39 @@
 import os
-from collections.abc import Iterable
-from typing import TYPE_CHECKING, Any, Optional
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor,
+    TimeoutError as FutureTimeoutError,
+)
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, Optional
 
-from ape.api import ReceiptAPI, TraceAPI, TransactionAPI, UpstreamProvider
+from ape.api import BlockAPI, ReceiptAPI, TraceAPI, TransactionAPI, UpstreamProvider
 from ape.exceptions import (
     APINotImplementedError,
+    BlockNotFoundError,
     ContractLogicError,
+    ProviderError,
+    TransactionError,
     TransactionNotFoundError,
     VirtualMachineError,
 )
 from ape.logging import logger
+from ape.types import ContractLog, LogFilter
 from ape.utils import request_with_retry
 from ape_ethereum.provider import Web3Provider
+from ape_ethereum.trace import TraceApproach
+from ape_ethereum.transactions import TransactionStatusEnum
 from eth_pydantic_types import HexBytes
-from eth_typing import HexStr
+from eth_utils import is_hex, to_checksum_address, to_hex
 from requests.exceptions import ConnectionError, HTTPError
 from urllib3.exceptions import ProtocolError
-from web3 import HTTPProvider, Web3
+from web3 import Web3
 from web3.exceptions import (
     ContractLogicError as Web3ContractLogicError,
     ExtraDataLengthError,
-    TransactionNotFound,
 )
 from web3.gas_strategies.rpc import rpc_gas_price_strategy
 
@@ -29,15 +42,50 @@ try:
 except ImportError:
     from web3.middleware import geth_poa_middleware as ExtraDataToPOAMiddleware  # type: ignore
 
+from web3._utils.method_formatters import receipt_formatter, transaction_result_formatter
 from web3.middleware.validation import MAX_EXTRADATA_LENGTH
 from web3.types import RPCEndpoint
 
-from .exceptions import AlchemyFeatureNotAvailable, AlchemyProviderError
-from .trace import AlchemyTransactionTrace
+from ._session import get_pool_stats, get_session
+from .batch import RequestBatch
+from .cache import (
+    CACHEABLE_METHODS,
+    RequestCache,
+    get_block_number,
+    get_cache_key,
+    get_request_cache,
+)
+from .exceptions import (
+    AlchemyFeatureNotAvailable,
+    AlchemyProviderError,
+    AlchemyRateLimitError,
+)
+from .failover import EndpointRouter, is_endpoint_failure
+from .hedging import HedgeBudget, send_hedged
+from .keys import AlchemyHTTPProvider, ApiKeyPool
+from .logs import LogQuery
+from .memoize import BlockScopedLRUCache, get_memo_key
+from .metadata import get_chain_metadata, set_chain_metadata
+from .metrics import (
+    RequestStats,
+    add_transfer,
+    otel_trace,
+    start_metrics_server,
+    start_span,
+    take_transfer,
+)
+from .multicall import CallAggregator
+from .rate_limit import get_compute_unit_bucket, get_compute_units
+from .receipts import ReceiptWatcher
+from .simulation import AssetChange, Simulation, get_simulation_params, get_simulation_revert
+from .streaming import check_response, new_spool
+from .trace import AlchemyTransactionTrace, get_prestate_tracer
+from .websocket import AlchemyWebSocketProvider, Subscription, WebSocketClient
 
 if TYPE_CHECKING:
-    from ape.types import BlockID
+    from ape.types import AddressType, BlockID
     from ape_ethereum.transactions import AccessList
+    from web3.providers import BaseProvider
 
 
 # The user must either set one of these or an ENV VAR of the pattern:
@@ -46,6 +94,10 @@ DEFAULT_ENVIRONMENT_VARIABLE_NAMES = ("WEB3_ALCHEMY_PROJECT_ID", "WEB3_ALCHEMY_A
 
 # Alchemy will try to publish private transactions for 25 blocks.
 PRIVATE_TX_BLOCK_WAIT = 25
+# Seconds to wait for a receipt beyond its timeout before giving up on the watcher.
+RECEIPT_WAIT_MARGIN = 30
+# Seconds between refreshing each method's hedge delay from its latencies.
+HEDGE_DELAY_REFRESH_INTERVAL = 1
 
 # NOTE: "*" means "all networks".
 NETWORKS_SUPPORTING_WEBSOCKETS = {
@@ -70,6 +122,18 @@ NETWORKS_SUPPORTING_WEBSOCKETS = {
     "zksync": "*",
 }
 
+# Any chain that *began* as PoA needs the middleware for pre-merge blocks
+POA_CHAIN_IDS = (
+    8453,  # base
+    10,  # optimism
+    137,  # polygon
+    80002,  # polygon amoy
+)
+
+
+def is_poa_block(block: dict) -> bool:
+    return "proofOfAuthorityData" in block or len(block.get("extraData", "")) > MAX_EXTRADATA_LENGTH
+
 
 class Alchemy(Web3Provider, UpstreamProvider):
     """
@@ -80,17 +144,71 @@ class Alchemy(Web3Provider, UpstreamProvider):
 
     network_uris: dict[tuple, str] = {}
 
+    # The URIs of each API key, per network, when using several.
+    _network_key_uris: dict[tuple, list[str]] = {}
+
+    # The time and number of the last head block checked for finality.
+    _finality_head: tuple[float, int] | None = None
+
+    # Memoized reads at the head block. Created on first use.
+    _memoized_reads: BlockScopedLRUCache | None = None
+
+    # The WebSocket connection, when connected using the WebSocket transport.
+    _ws_client: WebSocketClient | None = None
+
+    # The WebSocket connection for subscriptions. Created on first use.
+    _ws_subscriptions: WebSocketClient | None = None
+
+    # The chain ID, once known from connecting.
+    _chain_id: int | None = None
+
+    # The request stats. Created on first use.
+    _stats: RequestStats | None = None
+
+    # The threads sending hedged requests, and the compute units they may spend.
+    # Created on first use.
+    _hedge_executor: ThreadPoolExecutor | None = None
+    _hedge_budget: HedgeBudget | None = None
+    # RPC method -> (hedge delay, when to refresh it).
+    _hedge_delays: dict[str, tuple[float, float]] | None = None
+
+    # The API keys requests are spread across. Created on first use.
+    _api_keys: ApiKeyPool | None = None
+
+    # The health of the fallback endpoints, when configured. Created on first use.
+    _router: EndpointRouter | None = None
+
+    # The threads sending private transactions, and the thread waiting for
+    # receipts. Created on first use.
+    _private_executor: ThreadPoolExecutor | None = None
+    _receipt_watcher: ReceiptWatcher | None = None
+
+    # Aggregates `eth_call` requests, when enabled. Created on first use.
+    _call_aggregator: CallAggregator | None = None
+
     @property
     def uri(self):
         """
-        Alchemy RPC URI, including the project ID.
+        Alchemy RPC URI, including the project ID. With several API keys, the first key's.
+        """
+        return self.uris[0]
+
+    @property
+    def uris(self) -> list[str]:
+        """
+        The Alchemy RPC URI of each API key. Set several keys, separated by commas
+        (such as ``WEB3_ALCHEMY_API_KEY=key1,key2``), to spread requests across them.
+        See the ``api_keys`` config.
         """
         ecosystem_name = self.network.ecosystem.name
         network_name = self.network.name
         if (ecosystem_name, network_name) in self.network_uris:
-            return self.network_uris[(ecosystem_name, network_name)]
+            uri = self.network_uris[(ecosystem_name, network_name)]
+            uris = self._network_key_uris.get((ecosystem_name, network_name), [])
+            # NOTE: `network_uris` may be set directly, to use a single URI.
+            return uris if uris[:1] == [uri] else [uri]
 
-        key = None
+        keys = []
 
         ecosystem_nm_part = ecosystem_name.upper().replace("-", "_")
         network_nm_part = network_name.upper().replace("-", "_")
@@ -104,17 +222,24 @@ class Alchemy(Web3Provider, UpstreamProvider):
         for env_var_name in options:
             env_var = os.environ.get(env_var_name)
             if env_var:
-                key = env_var
+                keys = [key.strip() for key in env_var.split(",") if key.strip()]
                 break
 
-        if not key:
+        if not keys:
             env_var_str = ", ".join([f"${n}" for n in options])
             error_message = f"Using demo key. Set one of {env_var_str}."
             logger.warning(error_message)
 
             # Alchemy allows you to use the "demo" key for simple, demo purposes.
-            key = "demo"
+            keys = ["demo"]
 
+        uris = [f"https://{self._format_uri(key)}" for key in keys]
+        self.network_uris[(ecosystem_name, network_name)] = uris[0]
+        self._network_key_uris[(ecosystem_name, network_name)] = uris
+        return uris
+
+    def _format_uri(self, key: str) -> str:
+        ecosystem_name = self.network.ecosystem.name
         network_name = self.network.name
 
         # NOTE: Fantom's mainnet is named "opera", but the Alchemy URI expects "mainnet".
@@ -137,21 +262,18 @@ class Alchemy(Web3Provider, UpstreamProvider):
         if ecosystem_name in network_formats_by_ecosystem:
             # Special cases.
             if network_name == "nova":
-                uri = f"arbnova-mainnet.g.alchemy.com/v2/{key}"
-            elif network_name.startswith("opbnb"):
+                return f"arbnova-mainnet.g.alchemy.com/v2/{key}"
+            if network_name.startswith("opbnb"):
                 sub_network = "mainnet" if network_name == "opbnb" else "testnet"
-                uri = f"opbnb-{sub_network}.g.alchemy.com/v2/{key}"
-            else:
-                network_format = network_formats_by_ecosystem[ecosystem_name]
-                uri = network_format.format(network_name, key)
-        elif ecosystem_name == "xmtp" and network_name == "sepolia":
-            uri = f"xmtp-testnet.g.alchemy.com/v2/{key}"
-        else:
-            uri = default_format.format(ecosystem_name, network_name, key)
+                return f"opbnb-{sub_network}.g.alchemy.com/v2/{key}"
 
-        uri = f"https://{uri}"
-        self.network_uris[(ecosystem_name, network_name)] = uri
-        return uri
+            network_format = network_formats_by_ecosystem[ecosystem_name]
+            return network_format.format(network_name, key)
+
+        if ecosystem_name == "xmtp" and network_name == "sepolia":
+            return f"xmtp-testnet.g.alchemy.com/v2/{key}"
+
+        return default_format.format(ecosystem_name, network_name, key)
 
     @property
     def http_uri(self) -> str:
@@ -175,29 +297,51 @@ class Alchemy(Web3Provider, UpstreamProvider):
             # The error is only 400 with no info otherwise.
             raise APINotImplementedError()
 
-        return super().priority_fee
+        # NOTE: Using `make_request()` so the result can be memoized.
+        result = self.make_request("eth_maxPriorityFeePerGas", [])
+        if not isinstance(result, str):
+            # The user likely should be using a more-catered plugin.
+            raise APINotImplementedError(
+                "eth_maxPriorityFeePerGas not supported in this RPC. Please specify manually."
+            )
+
+        return int(result, 16)
+
+    @property
+    def gas_price(self) -> int:
+        # NOTE: Using `make_request()` so the result can be memoized.
+        return int(self.make_request("eth_gasPrice", []), 16)
+
+    def get_code(self, address: "AddressType", block_id: Optional["BlockID"] = None) -> HexBytes:
+        # NOTE: Using `make_request()` so the result can be memoized.
+        block_id = to_hex(block_id) if isinstance(block_id, int) else block_id
+        return HexBytes(self.make_request("eth_getCode", [address, block_id or "latest"]))
 
     @property
     def connection_str(self) -> str:
         return self.uri
 
-    def connect(self):
-        self._web3 = Web3(HTTPProvider(self.uri))
-        is_poa = None
-        try:
-            # Any chain that *began* as PoA needs the middleware for pre-merge blocks
-            base = 8453
-            optimism = 10
-            polygon = 137
-            polygon_amoy = 80002
+    @property
+    def connection_pool_stats(self) -> dict[str, int]:
+        """
+        The number of requests that re-used a pooled HTTP connection (``hits``)
+        and the number that had to open a new one (``misses``), across all
+        providers sharing this provider's session.
+        """
+        return get_pool_stats(get_session(self.uri, self.config.http))
 
-            if self._web3.eth.chain_id in (base, optimism, polygon, polygon_amoy):
-                self._web3.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
-                is_poa = True
+    def connect(self):
+        self._web3 = Web3(self._get_web3_provider())
+        chain_id, is_poa = self._get_known_chain_metadata()
+        detected = chain_id is None or is_poa is None
+        if chain_id is None:
+            try:
+                chain_id = self._web3.eth.chain_id
+            except Exception:
+                chain_id = None
 
-            self._web3.eth.set_gas_price_strategy(rpc_gas_price_strategy)
-        except Exception:
-            is_poa = None
+        if is_poa is None and chain_id in POA_CHAIN_IDS:
+            is_poa = True
 
         if is_poa is None:
             # Check if is PoA but just wasn't as such yet.
@@ -211,34 +355,398 @@ class Alchemy(Web3Provider, UpstreamProvider):
                     is_poa = True
                     break
                 else:
-                    is_poa = (
-                        "proofOfAuthorityData" in block
-                        or len(block.get("extraData", "")) > MAX_EXTRADATA_LENGTH
-                    )
+                    is_poa = is_poa_block(block)
                     if is_poa:
                         break
 
-            if is_poa and ExtraDataToPOAMiddleware not in self.web3.middleware_onion:
-                self.web3.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
+        if is_poa:
+            self.web3.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
+
+        self.web3.eth.set_gas_price_strategy(rpc_gas_price_strategy)
+        self._chain_id = chain_id
+        if detected and chain_id is not None:
+            self._set_known_chain_metadata(chain_id, is_poa)
+
+        metrics_config = self.config.metrics
+        if metrics_config.enabled and (port := metrics_config.prometheus_port):
+            _ = self.stats  # NOTE: Served once created.
+            start_metrics_server(port, host=metrics_config.prometheus_host)
+
+        if metrics_config.opentelemetry and otel_trace is None:
+            logger.warning("Install 'opentelemetry-api' to create spans for requests.")
 
     def disconnect(self):
+        for client in (self._ws_client, self._ws_subscriptions):
+            if client is not None:
+                client.close()
+
+        if self._hedge_executor is not None:
+            # NOTE: Do not wait for the hedges that lost.
+            self._hedge_executor.shutdown(wait=False)
+
+        if self._private_executor is not None:
+            self._private_executor.shutdown(wait=False)
+
+        if self._receipt_watcher is not None:
+            self._receipt_watcher.stop()
+
+        if self._call_aggregator is not None:
+            self._call_aggregator.stop()
+
+        self._ws_client = None
+        self._ws_subscriptions = None
+        self._hedge_executor = None
+        self._hedge_budget = None
+        self._hedge_delays = None
+        self._api_keys = None
+        self._router = None
+        self._private_executor = None
+        self._receipt_watcher = None
+        self._call_aggregator = None
+        self._chain_id = None
         self._web3 = None
 
+    def _get_chain_id(self) -> int:
+        # NOTE: The chain ID does not change, so re-use the one found on connect.
+        if (chain_id := self._chain_id) is not None:
+            return chain_id
+
+        return super()._get_chain_id()
+
+    def _get_known_chain_metadata(self) -> tuple[int | None, bool | None]:
+        """
+        The chain ID and POA status declared in the config or detected by an
+        earlier connection, so they do not need to be requested.
+        """
+        connect_config = self.config.connect
+        network_choice = f"{self.network.ecosystem.name}:{self.network.name}"
+        declared = connect_config.networks.get(network_choice)
+        chain_id = declared.chain_id if declared else None
+        is_poa = declared.is_poa if declared else None
+        if chain_id is None or is_poa is None:
+            stored = get_chain_metadata(
+                self._chain_metadata_path, self.uri, connect_config.metadata_ttl
+            )
+            if stored:
+                chain_id = stored["chain_id"] if chain_id is None else chain_id
+                is_poa = stored["is_poa"] if is_poa is None else is_poa
+
+        return chain_id, is_poa
+
+    def _set_known_chain_metadata(self, chain_id: int, is_poa: bool | None):
+        if self.config.connect.metadata_ttl > 0:
+            set_chain_metadata(self._chain_metadata_path, self.uri, chain_id, is_poa)
+
+    @property
+    def _chain_metadata_path(self) -> Path:
+        return self.data_folder / "chain_metadata.json"
+
+    def _get_web3_provider(self) -> "BaseProvider":
+        ws_config = self.config.websocket
+        if ws_config.enabled and (ws_uri := self.ws_uri):
+            client = WebSocketClient(
+                ws_uri,
+                request_timeout=ws_config.request_timeout,
+                max_reconnect_attempts=ws_config.max_reconnect_attempts,
+                reconnect_delay=ws_config.reconnect_delay,
+            )
+            try:
+                client.connect()
+            except AlchemyProviderError as err:
+                logger.warning(f"{err} Using HTTP instead.")
+            else:
+                self._ws_client = client
+                return AlchemyWebSocketProvider(client)
+
+        elif ws_config.enabled:
+            network_choice = f"{self.network.ecosystem.name}:{self.network.name}"
+            logger.warning(f"WebSockets are not supported on '{network_choice}'. Using HTTP.")
+
+        http_config = self.config.http
+        provider = AlchemyHTTPProvider(
+            self.uri,
+            request_kwargs={"timeout": http_config.request_timeout},
+            session=get_session(self.uri, http_config),
+        )
+        # NOTE: Requests are retried using the `rate_limit` config instead. Otherwise,
+        #   web3 (v7) retries failed requests itself, with its own back-off, first.
+        provider.exception_retry_configuration = None  # type: ignore[assignment]
+        return provider
+
+    def subscribe_new_heads(self) -> Subscription:
+        """
+        Subscribe to new head blocks, including blocks added by re-orgs.
+
+        Returns:
+            :class:`~ape_alchemy.websocket.Subscription`: An iterator of block headers.
+        """
+        return self._subscribe("newHeads")
+
+    def subscribe_logs(self, log_filter: LogFilter | None = None) -> Subscription:
+        """
+        Subscribe to new logs. Logs removed by a re-org are sent again
+        with ``removed`` set to ``True``.
+
+        Args:
+            log_filter (LogFilter | None): The addresses and topics to filter by.
+              The block range is ignored. Defaults to all logs.
+
+        Returns:
+            :class:`~ape_alchemy.websocket.Subscription`: An iterator of raw logs.
+        """
+        if log_filter is None:
+            return self._subscribe("logs", {})
+
+        # NOTE: Using JSON mode since used as request data.
+        filter_params = log_filter.model_dump(mode="json")
+        return self._subscribe(
+            "logs", {k: filter_params[k] for k in ("address", "topics") if filter_params.get(k)}
+        )
+
+    def subscribe_pending_transactions(
+        self,
+        from_address: "AddressType | list[AddressType] | None" = None,
+        to_address: "AddressType | list[AddressType] | None" = None,
+        hashes_only: bool = False,
+    ) -> Subscription:
+        """
+        Subscribe to transactions entering the mempool,
+        using ``alchemy_pendingTransactions``.
+
+        Args:
+            from_address (AddressType | list[AddressType] | None): Only include
+              transactions sent from these addresses.
+            to_address (AddressType | list[AddressType] | None): Only include
+              transactions sent to these addresses.
+            hashes_only (bool): Set to ``True`` to receive only transaction hashes.
+
+        Returns:
+            :class:`~ape_alchemy.websocket.Subscription`: An iterator of raw
+            transactions, or transaction hashes.
+        """
+        options: dict[str, Any] = {"hashesOnly": hashes_only}
+        if from_address is not None:
+            options["fromAddress"] = from_address
+        if to_address is not None:
+            options["toAddress"] = to_address
+
+        return self._subscribe("alchemy_pendingTransactions", options)
+
+    def subscribe_mined_transactions(
+        self,
+        addresses: list[dict[str, "AddressType"]] | None = None,
+        include_removed: bool = False,
+        hashes_only: bool = False,
+    ) -> Subscription:
+        """
+        Subscribe to transactions as they are mined, using ``alchemy_minedTransactions``.
+
+        Args:
+            addresses (list[dict[str, AddressType]] | None): Only include transactions
+              matching one of these filters, such as ``[{"to": address}]``.
+            include_removed (bool): Set to ``True`` to also receive transactions
+              removed by re-orgs.
+            hashes_only (bool): Set to ``True`` to receive only transaction hashes.
+
+        Returns:
+            :class:`~ape_alchemy.websocket.Subscription`: An iterator of mined transactions.
+        """
+        options: dict[str, Any] = {"includeRemoved": include_removed, "hashesOnly": hashes_only}
+        if addresses:
+            options["addresses"] = addresses
+
+        return self._subscribe("alchemy_minedTransactions", options)
+
+    def poll_blocks(
+        self,
+        stop_block: int | None = None,
+        required_confirmations: int | None = None,
+        new_block_timeout: int | None = None,
+    ) -> Iterator[BlockAPI]:
+        if self.config.websocket.poll_with_subscriptions and self.ws_uri is not None:
+            try:
+                heads = self.subscribe_new_heads()
+            except AlchemyProviderError as err:
+                logger.warning(f"{err} Polling over HTTP instead.")
+            else:
+                with heads:
+                    yield from self._poll_new_heads(
+                        heads, stop_block, required_confirmations, new_block_timeout
+                    )
+
+                return
+
+        yield from super().poll_blocks(
+            stop_block=stop_block,
+            required_confirmations=required_confirmations,
+            new_block_timeout=new_block_timeout,
+        )
+
+    def _poll_new_heads(
+        self,
+        heads: Subscription,
+        stop_block: int | None = None,
+        required_confirmations: int | None = None,
+        new_block_timeout: int | None = None,
+    ) -> Iterator[BlockAPI]:
+        # NOTE: The same defaults as polling over HTTP.
+        block_time = self.network.block_time
+        timeout = (
+            (10.0 if self.network.is_dev else 50 * block_time)
+            if new_block_timeout is None
+            else new_block_timeout
+        )
+        if required_confirmations is None:
+            required_confirmations = self.network.required_confirmations
+
+        # Start after the last confirmed block.
+        last = self.web3.eth.block_number - required_confirmations
+        while True:
+            try:
+                head = heads.get(timeout=timeout)
+            except TimeoutError as err:
+                raise ProviderError("Timed out waiting for next block.") from err
+
+            confirmed = int(head["number"], 16) - required_confirmations
+            if confirmed < last:
+                logger.error(
+                    "Chain has reorganized since returning the last block. "
+                    "Try adjusting the required network confirmations."
+                )
+                next_block = confirmed
+            else:
+                next_block = last + 1
+
+            # NOTE: Fetches blocks missed while reconnecting, too.
+            for number in range(next_block, confirmed + 1):
+                yield self.get_block(number)
+                if stop_block is not None and number >= stop_block:
+                    return
+
+            if confirmed >= next_block:
+                last = confirmed
+
+    def _subscribe(self, *parameters) -> Subscription:
+        if self._ws_subscriptions is None:
+            if not (ws_uri := self.ws_uri):
+                network_choice = f"{self.network.ecosystem.name}:{self.network.name}"
+                raise AlchemyFeatureNotAvailable(
+                    f"Subscriptions require WebSockets, which are not supported on "
+                    f"'{network_choice}'."
+                )
+
+            # NOTE: Separate from the request connection, so a slow
+            #   subscriber does not hold up responses.
+            ws_config = self.config.websocket
+            self._ws_subscriptions = WebSocketClient(
+                ws_uri,
+                request_timeout=ws_config.request_timeout,
+                max_reconnect_attempts=ws_config.max_reconnect_attempts,
+                reconnect_delay=ws_config.reconnect_delay,
+            )
+
+        return self._ws_subscriptions.subscribe(
+            list(parameters), max_queue=self.config.websocket.max_queued_notifications
+        )
+
     def _get_prestate_trace(self, transaction_hash: str) -> dict:
         return self.make_request(
             "debug_traceTransaction",
-            [
-                transaction_hash,
-                {
-                    "tracer": "prestateTracer",
-                    "timeout": self.config.trace_timeout,
-                },
-            ],
+            [transaction_hash, get_prestate_tracer(self.config.trace_timeout)],
         )
 
+    def get_contract_logs(self, log_filter: LogFilter) -> Iterator[ContractLog]:
+        height = self.chain_manager.blocks.height
+        stop_block_arg = log_filter.stop_block if log_filter.stop_block is not None else height
+        stop_block = min(stop_block_arg, height)
+        yield from LogQuery(self, log_filter, log_filter.start_block, stop_block)
+
     def get_transaction_trace(self, transaction_hash: str, **kwargs) -> TraceAPI:
+        if self.config.combine_traces:
+            # NOTE: Builds the call tree from the combined `callTracer` result.
+            kwargs.setdefault("call_trace_approach", TraceApproach.GETH_CALL_TRACER)
+
         return AlchemyTransactionTrace(transaction_hash=transaction_hash, **kwargs)
 
+    def get_transaction_traces(
+        self, transaction_hashes: Iterable[str | bytes], concurrency: int | None = None
+    ) -> list[AlchemyTransactionTrace]:
+        """
+        Trace many transactions concurrently. The traces are returned with their
+        call trees already fetched, so using them makes no further requests.
+
+        Args:
+            transaction_hashes (Iterable[str | bytes]): The transaction hashes.
+            concurrency (int | None): The number of requests to make at once.
+              Defaults to the provider's ``concurrency``. Requests still wait on
+              the configured compute-unit budget.
+
+        Returns:
+            list[:class:`~ape_alchemy.trace.AlchemyTransactionTrace`]: The traces,
+            in the same order as the hashes.
+        """
+        traces = [
+            AlchemyTransactionTrace(transaction_hash=to_hex(HexBytes(txn_hash)))
+            for txn_hash in transaction_hashes
+        ]
+        with ThreadPoolExecutor(concurrency or self.concurrency) as pool:
+            # NOTE: Fetching fills each trace's cached parity trace.
+            list(pool.map(lambda trace: trace._parity_trace, traces))
+
+        return traces
+
+    def trace_block(self, block_id: "BlockID") -> list[AlchemyTransactionTrace]:
+        """
+        Trace every transaction in a block using a single ``trace_block`` request.
+        On networks without ``trace_block``, the transactions are traced concurrently
+        instead.
+
+        Args:
+            block_id (:class:`~ape.types.BlockID`): The block number, hash or tag.
+
+        Returns:
+            list[:class:`~ape_alchemy.trace.AlchemyTransactionTrace`]: The traces,
+            in block order.
+        """
+        if isinstance(block_id, str) and block_id.isnumeric():
+            block_id = int(block_id)
+
+        if isinstance(block_id, bytes) or (isinstance(block_id, str) and len(block_id) == 66):
+            # NOTE: `trace_block` only accepts block numbers and tags.
+            block_hash = to_hex(HexBytes(block_id))
+            block = self.make_request("eth_getBlockByHash", [block_hash, False])
+            if not block:
+                raise BlockNotFoundError(block_hash)
+
+            block_id = block["number"]
+
+        elif isinstance(block_id, int):
+            block_id = to_hex(block_id)
+
+        try:
+            parity_traces = self.make_request("trace_block", [block_id])
+        except AlchemyFeatureNotAvailable as err:
+            logger.debug(f"Tracing transactions concurrently: {err}")
+            block = self.make_request("eth_getBlockByNumber", [block_id, False])
+            if not block:
+                raise BlockNotFoundError(block_id) from err
+
+            return self.get_transaction_traces(block["transactions"])
+
+        if parity_traces is None:
+            raise BlockNotFoundError(block_id)
+
+        # NOTE: Block-reward traces have no transaction hash.
+        traces_by_hash: dict[str, list] = {}
+        for parity_trace in parity_traces:
+            if txn_hash := parity_trace.get("transactionHash"):
+                traces_by_hash.setdefault(txn_hash, []).append(parity_trace)
+
+        return [
+            AlchemyTransactionTrace.from_raw(txn_hash, parity_trace=txn_traces)
+            for txn_hash, txn_traces in traces_by_hash.items()
+        ]
+
     def get_virtual_machine_error(self, exception: Exception, **kwargs) -> VirtualMachineError:
         txn = kwargs.get("txn")
         if not hasattr(exception, "args") or not len(exception.args):
@@ -266,6 +774,14 @@ class Alchemy(Web3Provider, UpstreamProvider):
                 # Was given a revert message
                 message = message.split(":")[-1].strip()
                 return ContractLogicError(revert_message=message, txn=txn)
+
+            data = getattr(exception, "data", None)
+            if isinstance(data, str) and is_hex(data) and HexBytes(data):
+                # A custom error. Its data is the message, so the compiler can decode it.
+                return self.compiler_manager.enrich_error(
+                    ContractLogicError(revert_message=to_hex(HexBytes(data)), txn=txn)
+                )
+
             # No revert message
             return ContractLogicError(txn=txn)
 
@@ -280,49 +796,943 @@ class Alchemy(Web3Provider, UpstreamProvider):
 
         return super().create_access_list(transaction, block_id=block_id)
 
+    def simulate(self, txns: Iterable[TransactionAPI]) -> list[Simulation]:
+        """
+        Simulate many transactions, each on its own, using Alchemy's
+        ``alchemy_simulateAssetChanges`` and ``alchemy_simulateExecution``.
+        All the simulations are sent in one batch request.
+
+        .. code-block:: python
+
+            for simulation in provider.simulate(candidates):
+                if not simulation.failed:
+                    print(simulation.changes)
+
+        Args:
+            txns (Iterable[:class:`~ape.api.transactions.TransactionAPI`]): The
+              transactions. They do not need to be signed.
+
+        Raises:
+            :class:`~ape_alchemy.exceptions.AlchemyFeatureNotAvailable`: When the
+              simulation methods are unavailable on the tier or network.
+
+        Returns:
+            list[:class:`~ape_alchemy.simulation.Simulation`]: The simulations, in
+            the same order as the transactions. A transaction that would revert
+            has its ``error`` set, rather than raising.
+        """
+        txns = list(txns)
+        with self.batch_requests() as batch:
+            calls = [
+                (
+                    batch.add("alchemy_simulateAssetChanges", [params]),
+                    batch.add("alchemy_simulateExecution", [params]),
+                )
+                for params in map(self._get_simulation_params, txns)
+            ]
+
+        simulations = []
+        for txn, (changes_future, execution_future) in zip(txns, calls, strict=True):
+            try:
+                changes, execution = changes_future.result(), execution_future.result()
+            except AlchemyFeatureNotAvailable:
+                raise
+
+            except AlchemyProviderError as err:
+                simulations.append(Simulation(error=self.get_virtual_machine_error(err, txn=txn)))
+                continue
+
+            simulations.append(self._get_simulation(txn, changes, execution))
+
+        return simulations
+
+    def simulate_bundle(self, txns: Iterable[TransactionAPI]) -> list[Simulation]:
+        """
+        Simulate transactions one after the other, each seeing the state left
+        by those before it, using Alchemy's ``alchemy_simulateAssetChangesBundle``
+        and ``alchemy_simulateExecutionBundle`` in one batch request.
+
+        Args:
+            txns (Iterable[:class:`~ape.api.transactions.TransactionAPI`]): The
+              transactions, in order. They do not need to be signed.
+
+        Raises:
+            :class:`~ape_alchemy.exceptions.AlchemyFeatureNotAvailable`: When the
+              simulation methods are unavailable on the tier or network.
+
+        Returns:
+            list[:class:`~ape_alchemy.simulation.Simulation`]: The simulation of
+            each transaction, in order.
+        """
+        txns = list(txns)
+        params = [self._get_simulation_params(txn) for txn in txns]
+        with self.batch_requests() as batch:
+            changes_future = batch.add("alchemy_simulateAssetChangesBundle", [params])
+            execution_future = batch.add("alchemy_simulateExecutionBundle", [params])
+
+        try:
+            changes, executions = changes_future.result(), execution_future.result()
+        except AlchemyFeatureNotAvailable:
+            raise
+
+        except AlchemyProviderError as err:
+            raise self.get_virtual_machine_error(err) from err
+
+        return [
+            self._get_simulation(txn, txn_changes, execution)
+            for txn, txn_changes, execution in zip(txns, changes, executions, strict=True)
+        ]
+
+    def get_token_balances(
+        self, address: "AddressType", tokens: Iterable["AddressType"] | None = None
+    ) -> dict["AddressType", int]:
+        """
+        Get an account's token balances using Alchemy's ``alchemy_getTokenBalances``,
+        following every page of results.
+
+        Args:
+            address (AddressType): The account.
+            tokens (Iterable[AddressType] | None): The token contracts. Defaults to
+              every ERC-20 token the account has held.
+
+        Returns:
+            dict[AddressType, int]: The balance of each token.
+        """
+        balances: dict[AddressType, int] = {}
+        if tokens is None:
+            options: dict = {}
+            while True:
+                params = [address, "erc20", options] if options else [address, "erc20"]
+                result = self.make_request("alchemy_getTokenBalances", params)
+                balances.update(self._get_token_balances(result))
+                if not (page_key := result.get("pageKey")):
+                    return balances
+
+                options = {"pageKey": page_key}
+
+        tokens = list(tokens)
+        chunk_size = max(self.config.tokens.max_tokens_per_request, 1)
+        for index in range(0, len(tokens), chunk_size):
+            result = self.make_request(
+                "alchemy_getTokenBalances", [address, tokens[index : index + chunk_size]]
+            )
+            balances.update(self._get_token_balances(result))
+
+        return balances
+
+    def get_token_balances_for_accounts(
+        self,
+        addresses: Iterable["AddressType"],
+        tokens: Iterable["AddressType"] | None = None,
+        concurrency: int | None = None,
+    ) -> dict["AddressType", dict["AddressType", int]]:
+        """
+        Get the token balances of many accounts concurrently. See
+        :meth:`~ape_alchemy.provider.Alchemy.get_token_balances`.
+
+        Args:
+            addresses (Iterable[AddressType]): The accounts.
+            tokens (Iterable[AddressType] | None): The token contracts. Defaults to
+              every ERC-20 token each account has held.
+            concurrency (int | None): The number of requests to make at once.
+              Defaults to the provider's ``concurrency``. Requests still wait on
+              the configured compute-unit budget.
+
+        Returns:
+            dict[AddressType, dict[AddressType, int]]: The balances of each account.
+        """
+        addresses = list(addresses)
+        tokens = None if tokens is None else list(tokens)
+        with ThreadPoolExecutor(concurrency or self.concurrency) as pool:
+            balances = pool.map(lambda address: self.get_token_balances(address, tokens), addresses)
+            return dict(zip(addresses, balances, strict=True))
+
+    def get_token_metadata(self, tokens: Iterable["AddressType"]) -> dict["AddressType", dict]:
+        """
+        Get the name, symbol, decimals and logo of tokens using Alchemy's
+        ``alchemy_getTokenMetadata``. Metadata does not change, so it is cached
+        in the plugin's data folder and only fetched once, in one batch request.
+
+        Args:
+            tokens (Iterable[AddressType]): The token contracts.
+
+        Returns:
+            dict[AddressType, dict]: The metadata of each token.
+        """
+        cache = self._token_metadata_cache
+        tokens = [to_checksum_address(token) for token in tokens]
+        metadata: dict[AddressType, Any] = {
+            token: cache.get(self._get_token_metadata_key(token)) for token in tokens
+        }
+        missing = [token for token, cached in metadata.items() if cached is None]
+        with self.batch_requests() as batch:
+            futures = [batch.add("alchemy_getTokenMetadata", [token]) for token in missing]
+
+        for token, future in zip(missing, futures, strict=True):
+            metadata[token] = future.result()
+            cache.set(self._get_token_metadata_key(token), metadata[token])
+
+        return metadata
+
+    @property
+    def _token_metadata_cache(self) -> RequestCache:
+        return get_request_cache(
+            self.data_folder / "token_metadata.sqlite",
+            self.config.tokens.metadata_cache_size_mb * 1024 * 1024,
+        )
+
+    def _get_token_metadata_key(self, token: "AddressType") -> str:
+        return f"{self.chain_id}:{token}"
+
+    @staticmethod
+    def _get_token_balances(result: dict) -> dict["AddressType", int]:
+        balances = {}
+        for balance in result.get("tokenBalances", []):
+            if balance.get("error") or (value := balance.get("tokenBalance")) is None:
+                # NOTE: Balances that could not be read have an error instead.
+                continue
+
+            balances[to_checksum_address(balance["contractAddress"])] = int(value[2:] or "0", 16)
+
+        return balances
+
+    def _get_simulation_params(self, txn: TransactionAPI) -> dict:
+        return get_simulation_params(txn.model_dump(by_alias=True, mode="json"))
+
+    def _get_simulation(self, txn: TransactionAPI, changes: dict, execution: dict) -> Simulation:
+        error = None
+        if (revert := get_simulation_revert(changes, execution)) is not None:
+            error = self.get_virtual_machine_error(AlchemyProviderError(revert), txn=txn)
+
+        calls = execution.get("calls") or []
+        gas_used = changes.get("gasUsed") or (calls[0].get("gasUsed") if calls else None)
+        return Simulation(
+            changes=[AssetChange.from_raw(change) for change in changes.get("changes") or []],
+            calls=calls,
+            logs=execution.get("logs") or [],
+            gas_used=None if gas_used is None else int(gas_used, 16),
+            error=error,
+        )
+
     @staticmethod
     def _response_checker(err: Exception) -> bool:
         return (
             # NOTE: This is copied from `ape.utils.request_with_retry(..., is_rate_limit=None)`
             (isinstance(err, HTTPError) and err.response.status_code == 429)
             # NOTE: Sometimes Alchemy justs... stops responding in the middle of a response,
-            #       so treat it like a rate limit error since it usually works 2nd/3rd time
-            or isinstance(err, ConnectionError | ProtocolError)
+            #       so treat it like a rate limit error since it usually works 2nd/3rd time.
+            #       Batch requests with rate-limited calls raise `AlchemyRateLimitError`.
+            or isinstance(err, ConnectionError | ProtocolError | AlchemyRateLimitError)
         )
 
     def make_request(self, rpc: str, parameters: Iterable | None = None) -> Any:
-        rate_limit = self.config.rate_limit
         parameters = parameters or []
 
+        def request():
+            with self._use_endpoint(rpc) as uri:
+                self._wait_for_compute_units(rpc, uri=uri)
+                return self.web3.provider.make_request(RPCEndpoint(rpc), parameters)
+
+        send = self._hedge(rpc, request)
+        memo_key = self._get_memo_key(rpc, parameters)
+        if memo_key is not None and (memoized := self._memo.get(memo_key)) is not None:
+            self._record_cache_hit(rpc)
+            return memoized
+
+        cache_key = self._get_cache_key(rpc, parameters)
+        if cache_key is not None and (cached := self._request_cache.get(cache_key)) is not None:
+            self._record_cache_hit(rpc)
+            return cached
+
+        if (aggregator := self._get_call_aggregator(rpc, parameters)) is not None:
+            # NOTE: Sent in a Multicall3 `eth_call`, which records its own stats.
+            result = {"result": aggregator.submit(list(parameters)).result()}
+        else:
+            result = self._send_request(rpc, send)
+
+        if rpc == "eth_call" and isinstance(result, dict) and "error" in result:
+            # NOTE: Raised like an aggregated call's error, so a revert maps to the
+            #   same `ContractLogicError`, with its revert data, either way.
+            raise self._get_rpc_error(result["error"])
+
+        if not isinstance(result, dict) or "result" not in result:
+            return result
+
+        if cache_key is not None and self._is_final(rpc, parameters, result["result"]):
+            self._request_cache.set(cache_key, result["result"])
+
+        if self.config.memoize.enabled:
+            self._memoize(rpc, parameters, memo_key, result["result"])
+
+        return result["result"]
+
+    def _send_request(self, rpc: str, send: Callable[[], Any]) -> Any:
+        started = time.perf_counter()
+        failed = True
+        take_transfer()
         try:
-            result = request_with_retry(
-                lambda: self.web3.provider.make_request(RPCEndpoint(rpc), parameters),
-                min_retry_delay=rate_limit.min_retry_delay,
-                retry_backoff_factor=rate_limit.retry_backoff_factor,
-                max_retry_delay=rate_limit.max_retry_delay,
-                max_retries=rate_limit.max_retries,
-                retry_jitter=rate_limit.retry_jitter,
-                is_rate_limit=self._response_checker,
+            with start_span(rpc, self.config.metrics.opentelemetry):
+                result = self._request_with_retry(send, lambda: (rpc,))
+
+            failed = isinstance(result, dict) and "error" in result
+        except HTTPError as err:
+            raise self._get_http_error(err) from err
+        finally:
+            self._record_request(rpc, time.perf_counter() - started, failed)
+
+        return result
+
+    def _get_call_aggregator(self, rpc: str, parameters: Iterable) -> CallAggregator | None:
+        """
+        The aggregator to send an ``eth_call`` with, when it can be aggregated.
+        See the ``multicall`` config.
+        """
+        multicall_config = self.config.multicall
+        if rpc != "eth_call" or not multicall_config.enabled:
+            return None
+
+        if self._call_aggregator is None:
+            self._call_aggregator = CallAggregator(
+                self,
+                address=multicall_config.address,
+                window=multicall_config.window,
+                max_calls=multicall_config.max_calls,
+                max_calldata_size=multicall_config.max_calldata_size,
             )
+
+        parameters = parameters if isinstance(parameters, list) else list(parameters)
+        return self._call_aggregator if self._call_aggregator.accepts(parameters) else None
+
+    def _request_with_retry(
+        self, func: Callable[[], Any], get_rpcs: Callable[[], Iterable[str]] | None = None
+    ) -> Any:
+        rate_limit = self.config.rate_limit
+        attempts = 0
+
+        def attempt():
+            nonlocal attempts
+            attempts += 1
+            try:
+                return func()
+            except Exception as err:
+                if get_rpcs is not None and self._response_checker(err):
+                    # NOTE: The last attempt is not retried.
+                    self._record_retry(
+                        get_rpcs(),
+                        retried=attempts < rate_limit.max_retries,
+                        rate_limited=self._is_rate_limited(err),
+                    )
+
+                raise
+
+        return request_with_retry(
+            attempt,
+            min_retry_delay=rate_limit.min_retry_delay,
+            retry_backoff_factor=rate_limit.retry_backoff_factor,
+            max_retry_delay=rate_limit.max_retry_delay,
+            max_retries=rate_limit.max_retries,
+            retry_jitter=rate_limit.retry_jitter,
+            is_rate_limit=self._response_checker,
+        )
+
+    def _hedge(self, rpc: str, func: Callable[[], Any]) -> Callable[[], Any]:
+        """
+        Wrap a request to send it again if it is slower than usual, when
+        hedging is enabled for the method. See the ``hedge`` config.
+        """
+        hedge_config = self.config.hedge
+        if not hedge_config.enabled or rpc not in hedge_config.methods:
+            return func
+
+        compute_units = get_compute_units(rpc, self.config.rate_limit.compute_unit_costs)
+
+        def call():
+            # NOTE: Calls run on the hedging threads, so hand their bytes back.
+            take_transfer()
+            result = func()
+            return result, take_transfer()
+
+        def can_hedge() -> bool:
+            if not self._get_hedge_budget().spend(compute_units):
+                return False
+
+            if self.config.metrics.enabled:
+                self.stats.record_hedge(rpc)
+
+            return True
+
+        def send():
+            budget = self._get_hedge_budget()
+            budget.add(compute_units)
+            result, transfer = send_hedged(
+                self._get_hedge_executor(),
+                call,
+                self._get_hedge_delay(rpc),
+                can_hedge,
+                on_hedged=budget.finish,
+            )
+            add_transfer(*transfer)
+            return result
+
+        return send
+
+    def _get_hedge_delay(self, rpc: str) -> float:
+        # NOTE: Getting the percentile sorts the latencies, so only do so now and then.
+        now = time.monotonic()
+        if self._hedge_delays is None:
+            self._hedge_delays = {}
+
+        elif (cached := self._hedge_delays.get(rpc)) is not None and now < cached[1]:
+            return cached[0]
+
+        hedge_config = self.config.hedge
+        latency = None
+        if self.config.metrics.enabled:
+            latency = self.stats.get_latency(
+                rpc, hedge_config.percentile, min_samples=hedge_config.min_samples
+            )
+
+        delay = (
+            hedge_config.initial_delay if latency is None else max(latency, hedge_config.min_delay)
+        )
+        self._hedge_delays[rpc] = (delay, now + HEDGE_DELAY_REFRESH_INTERVAL)
+        return delay
+
+    def _get_hedge_executor(self) -> ThreadPoolExecutor:
+        if self._hedge_executor is None:
+            self._hedge_executor = ThreadPoolExecutor(
+                max_workers=self.config.hedge.max_workers, thread_name_prefix="alchemy-hedge"
+            )
+
+        return self._hedge_executor
+
+    def _get_hedge_budget(self) -> HedgeBudget:
+        if self._hedge_budget is None:
+            hedge_config = self.config.hedge
+            self._hedge_budget = HedgeBudget(
+                hedge_config.max_extra_compute_units, max_in_flight=hedge_config.max_workers
+            )
+
+        return self._hedge_budget
+
+    def _get_api_key_pool(self) -> ApiKeyPool:
+        if self._api_keys is None:
+            uris = self.uris
+            if self.uri not in uris:
+                # NOTE: The URI is overridden, such as by a subclass.
+                uris = [self.uri]
+
+            api_keys_config = self.config.api_keys
+            rate_limit = self.config.rate_limit
+            self._api_keys = ApiKeyPool(
+                uris,
+                strategy=api_keys_config.strategy,
+                cooldown=api_keys_config.cooldown,
+                get_bucket=lambda uri: get_compute_unit_bucket(uri, rate_limit, self.data_folder),
+            )
+
+        return self._api_keys
+
+    @contextmanager
+    def _use_api_key(self) -> Iterator[str]:
+        """
+        Send the current thread's requests to the URI of the next API key, when
+        using several. A key that gets rate-limited is skipped for a cooldown.
+        """
+        pool = self._get_api_key_pool()
+        if len(pool) == 1:
+            yield self.uri
+            return
+
+        # NOTE: Streamed requests do not use web3.
+        provider = self._web3.provider if self._web3 else None
+        with pool.use() as uri:
+            endpoint: AbstractContextManager[None]
+            if isinstance(provider, AlchemyHTTPProvider):
+                endpoint = provider.use_endpoint(uri)
+            else:
+                # NOTE: Such as when using the WebSocket transport.
+                endpoint = nullcontext()
+
+            with endpoint:
+                try:
+                    yield uri
+                except Exception as err:
+                    if self._is_rate_limited(err):
+                        pool.eject(uri)
+
+                    raise
+
+    @property
+    def endpoint_health(self) -> dict[str, dict[str, Any]]:
+        """
+        The health of Alchemy and each fallback endpoint: the moving averages of
+        their health-check latency and request success rate, their failures in a
+        row and whether they are out of rotation. See the ``failover`` config.
+        """
+        return router.to_dict() if (router := self._get_router()) else {}
+
+    def _get_router(self) -> EndpointRouter | None:
+        if self._router is None:
+            failover_config = self.config.failover
+            network_choice = f"{self.network.ecosystem.name}:{self.network.name}"
+            if not (fallbacks := failover_config.endpoints.get(network_choice)):
+                return None
+
+            self._router = EndpointRouter(
+                self.uri,
+                fallbacks,
+                self._check_endpoint,
+                max_failures=failover_config.max_failures,
+                health_check_interval=failover_config.health_check_interval,
+                fallback_penalty=failover_config.fallback_penalty,
+            )
+
+        return self._router
+
+    def _check_endpoint(self, uri: str) -> bool:
+        """
+        Whether an endpoint responds with the expected chain ID.
+        """
+        http_config = self.config.http
+        payload = {"jsonrpc": "2.0", "id": 1, "method": "eth_chainId", "params": []}
+        response = get_session(uri, http_config).post(
+            uri, json=payload, timeout=http_config.request_timeout
+        )
+        response.raise_for_status()
+        if not isinstance(result := response.json().get("result"), str):
+            return False
+
+        return self._chain_id is None or int(result, 16) == self._chain_id
+
+    @contextmanager
+    def _use_endpoint(self, *rpcs: str) -> Iterator[str]:
+        """
+        Send the current thread's requests to the healthiest endpoint, when
+        the calls may use a fallback. Otherwise, to the next API key's URI.
+        """
+        router = self._get_router()
+        # NOTE: Streamed requests do not use web3.
+        provider = self._web3.provider if self._web3 else None
+        methods = self.config.failover.methods
+        if (
+            router is None
+            or not isinstance(provider, AlchemyHTTPProvider)
+            or any(rpc not in methods for rpc in rpcs)
+        ):
+            with self._use_api_key() as uri:
+                yield uri
+
+            return
+
+        endpoint = router.select()
+        try:
+            if endpoint == router.primary:
+                with self._use_api_key() as uri:
+                    yield uri
+            else:
+                with provider.use_endpoint(endpoint):
+                    yield endpoint
+
+        except Exception as err:
+            router.record(endpoint, failed=is_endpoint_failure(err))
+            raise
+
+        router.record(endpoint, failed=False)
+
+    @staticmethod
+    def _is_rate_limited(err: Exception) -> bool:
+        return (isinstance(err, HTTPError) and err.response.status_code == 429) or isinstance(
+            err, AlchemyRateLimitError
+        )
+
+    def _spool_request(self, rpc: str, parameters: list) -> IO[bytes]:
+        """
+        Make a request over HTTP, streaming the raw response into a temporary
+        file rather than parsing it. Used for responses too large to parse at once.
+        """
+        http_config = self.config.http
+        session = get_session(self.uri, http_config)
+        payload = {"jsonrpc": "2.0", "id": 1, "method": rpc, "params": parameters}
+
+        def send():
+            with self._use_endpoint(rpc) as uri:
+                self._wait_for_compute_units(rpc, uri=uri)
+                file = new_spool()
+                with session.post(
+                    uri, json=payload, stream=True, timeout=http_config.request_timeout
+                ) as response:
+                    response.raise_for_status()
+                    for chunk in response.iter_content(chunk_size=2**17):
+                        file.write(chunk)
+
+                    # NOTE: Streamed responses are counted once read, as received on the wire.
+                    add_transfer(0, response.raw.tell())
+
+            return file
+
+        started = time.perf_counter()
+        failed = True
+        take_transfer()
+        try:
+            with start_span(rpc, self.config.metrics.opentelemetry):
+                file = self._request_with_retry(send, lambda: (rpc,))
+
+            failed = False
         except HTTPError as err:
-            response_data = err.response.json() if err.response else {}
-            if "error" not in response_data:
-                raise AlchemyProviderError(str(err)) from err
-
-            error_data = response_data["error"]
-            message = (
-                error_data.get("message", str(error_data))
-                if isinstance(error_data, dict)
-                else error_data
+            raise self._get_http_error(err) from err
+        finally:
+            self._record_request(rpc, time.perf_counter() - started, failed)
+
+        if (error := check_response(file)) is not None:
+            file.close()
+            raise self._get_rpc_error(error)
+
+        return file
+
+    def make_batch_request(self, calls: Iterable[tuple[str, Iterable | None]]) -> list[Any]:
+        """
+        Make many JSON-RPC calls using as few HTTP round trips as possible.
+        Each call is retried and error-mapped the same as
+        :meth:`~ape_alchemy.provider.Alchemy.make_request`.
+
+        Args:
+            calls (Iterable[tuple[str, Iterable | None]]): Pairs of RPC method and parameters.
+
+        Returns:
+            list[Any]: The results, in the same order as the calls.
+        """
+        with self.batch_requests() as batch:
+            futures = [batch.add(rpc, parameters) for rpc, parameters in calls]
+
+        return [future.result() for future in futures]
+
+    @contextmanager
+    def batch_requests(self) -> Iterator[RequestBatch]:
+        """
+        A context manager for collecting calls into JSON-RPC batch requests.
+        The queued calls are sent when the context exits. Only calls queued using
+        :meth:`~ape_alchemy.batch.RequestBatch.add` are batched; other requests
+        made inside the context, such as using ``make_request()``, are not.
+
+        Returns:
+            :class:`~ape_alchemy.batch.RequestBatch`
+        """
+        batch = RequestBatch(self)
+        try:
+            yield batch
+        except BaseException:
+            batch._cancel()
+            raise
+
+        batch.flush()
+
+    def _send_batch(self, queue: list[tuple[str, list, Future]]):
+        queue = self._aggregate_batched_calls(queue)
+        batch_size = max(self.config.max_batch_size, 1)
+        for index in range(0, len(queue), batch_size):
+            pending = queue[index : index + batch_size]
+
+            def send():
+                nonlocal pending
+                pending = self._send_batch_once(pending)
+                if pending:
+                    raise AlchemyRateLimitError(
+                        f"{len(pending)} batched request(s) exceeded the compute-unit capacity."
+                    )
+
+            try:
+                # NOTE: Retries are counted for the calls still pending.
+                self._request_with_retry(send, lambda: [rpc for rpc, _, _ in pending])  # noqa: B023
+            except Exception as err:
+                error = self._get_http_error(err) if isinstance(err, HTTPError) else err
+                failed = [(rpc, True) for rpc, _, future in pending if not future.done()]
+                self._record_batch(failed, None)
+                for _, _, future in pending:
+                    if not future.done():
+                        future.set_exception(error)
+
+    def _aggregate_batched_calls(
+        self, queue: list[tuple[str, list, Future]]
+    ) -> list[tuple[str, list, Future]]:
+        """
+        Hand the batched calls that can be aggregated to the call aggregator.
+        Returns the rest.
+        """
+        rest = []
+        aggregated = []
+        for rpc, parameters, future in queue:
+            if self._get_call_aggregator(rpc, parameters) is None:
+                rest.append((rpc, parameters, future))
+            else:
+                aggregated.append((parameters, future))
+
+        if not aggregated or self._call_aggregator is None:
+            return rest
+
+        # NOTE: Queued together, so the calls are aggregated together.
+        submitted = self._call_aggregator.submit_many([parameters for parameters, _ in aggregated])
+        for done, (_, future) in zip(submitted, aggregated, strict=True):
+
+            def resolve(done: Future, future: Future = future):
+                if (error := done.exception()) is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(done.result())
+
+            done.add_done_callback(resolve)
+
+        return rest
+
+    def _send_batch_once(
+        self, pending: list[tuple[str, list, Future]]
+    ) -> list[tuple[str, list, Future]]:
+        """
+        Send one batch request and resolve the futures of each call that
+        did not get rate-limited. Returns the rate-limited calls.
+        """
+        provider = self.web3.provider
+        if not hasattr(provider, "make_batch_request"):
+            # NOTE: web3 v6 does not support batch requests.
+            for rpc, parameters, future in pending:
+                try:
+                    future.set_result(self.make_request(rpc, parameters))
+                except Exception as err:
+                    future.set_exception(err)
+
+            return []
+
+        with self._use_endpoint(*[rpc for rpc, _, _ in pending]) as uri:
+            self._wait_for_compute_units(*[rpc for rpc, _, _ in pending], uri=uri)
+            started = time.perf_counter()
+            take_transfer()
+            try:
+                responses = provider.make_batch_request(
+                    [(RPCEndpoint(rpc), parameters) for rpc, parameters, _ in pending]
+                )
+            except Exception:
+                # NOTE: Recorded once retries run out.
+                take_transfer()
+                raise
+
+        latency = time.perf_counter() - started
+        if isinstance(responses, dict):
+            # The whole batch failed, such as from a malformed request.
+            responses = [responses] * len(pending)
+
+        elif len(responses) != len(pending):
+            raise AlchemyProviderError(
+                f"Expected {len(pending)} batch responses but received {len(responses)}."
             )
-            cls = (
-                AlchemyFeatureNotAvailable
-                if "is not available" in message
-                else AlchemyProviderError
+
+        # NOTE: web3 sorts the responses by their request IDs, which are
+        #   assigned in the order the calls were made.
+        rate_limited = []
+        # NOTE: Rate-limited calls are recorded once resent.
+        resolved: list[tuple[str, bool]] = []
+        for call, response in zip(pending, responses, strict=True):
+            future = call[2]
+            if not isinstance(response, dict) or "error" not in response:
+                future.set_result(
+                    response["result"]
+                    if isinstance(response, dict) and "result" in response
+                    else response
+                )
+                resolved.append((call[0], False))
+                continue
+
+            error = self._get_rpc_error(response["error"])
+            if isinstance(error, AlchemyRateLimitError):
+                rate_limited.append(call)
+            else:
+                future.set_exception(error)
+                resolved.append((call[0], True))
+
+        self._record_batch(resolved, latency)
+        if rate_limited and uri in (pool := self._get_api_key_pool()).uris:
+            pool.eject(uri)
+
+        return rate_limited
+
+    @property
+    def stats(self) -> "RequestStats":
+        """
+        Per RPC method: request counts, errors, retries, rate-limited attempts,
+        cache hits, bytes sent and received over HTTP, estimated compute units
+        and latency percentiles. See the ``metrics`` config.
+
+        .. code-block:: python
+
+            print(provider.stats["eth_call"]["latency"]["p95"])
+            print(provider.stats.totals["compute_units"])
+        """
+        if self._stats is None:
+            network_choice = f"{self.network.ecosystem.name}:{self.network.name}"
+            self._stats = RequestStats(
+                labels={"network": network_choice},
+                max_samples=self.config.metrics.max_latency_samples,
+            )
+
+        return self._stats
+
+    def _record_request(self, rpc: str, latency: float, failed: bool):
+        bytes_sent, bytes_received = take_transfer()
+        if not self.config.metrics.enabled:
+            return
+
+        costs = self.config.rate_limit.compute_unit_costs
+        self.stats.record(
+            rpc,
+            latency,
+            error=failed,
+            bytes_sent=bytes_sent,
+            bytes_received=bytes_received,
+            compute_units=get_compute_units(rpc, costs),
+        )
+
+    def _record_batch(self, calls: list[tuple[str, bool]], latency: float | None):
+        # NOTE: Batched calls share their batch's latency, and its bytes evenly.
+        bytes_sent, bytes_received = take_transfer()
+        if not self.config.metrics.enabled or not calls:
+            return
+
+        costs = self.config.rate_limit.compute_unit_costs
+        for rpc, failed in calls:
+            self.stats.record(
+                rpc,
+                latency,
+                error=failed,
+                bytes_sent=bytes_sent // len(calls),
+                bytes_received=bytes_received // len(calls),
+                compute_units=get_compute_units(rpc, costs),
+            )
+
+    def _record_retry(self, rpcs: Iterable[str], retried: bool, rate_limited: bool):
+        if self.config.metrics.enabled:
+            self.stats.record_retries(rpcs, retries=int(retried), rate_limited=int(rate_limited))
+
+    def _record_cache_hit(self, rpc: str):
+        if self.config.metrics.enabled:
+            self.stats.record_cache_hit(rpc)
+
+    @property
+    def memoization_stats(self) -> dict[str, float]:
+        """
+        The number of memoized-read hits and misses, and the hit rate.
+        See the ``memoize`` config.
+        """
+        return self._memo.stats
+
+    @property
+    def _memo(self) -> BlockScopedLRUCache:
+        if self._memoized_reads is None:
+            self._memoized_reads = BlockScopedLRUCache(self.config.memoize.max_entries)
+
+        return self._memoized_reads
+
+    def _get_memo_key(self, rpc: str, parameters: Iterable) -> str | None:
+        memoize_config = self.config.memoize
+        if not memoize_config.enabled or rpc not in memoize_config.ttls:
+            return None
+
+        return get_memo_key(rpc, list(parameters))
+
+    def _memoize(self, rpc: str, parameters: Iterable, memo_key: str | None, result: Any):
+        # Seeing a new head block invalidates the memoized reads.
+        if rpc == "eth_blockNumber" and isinstance(result, str):
+            self._memo.set_head(int(result, 16))
+        elif rpc == "eth_getBlockByNumber" and list(parameters)[:1] == ["latest"] and result:
+            self._memo.set_head(int(result["number"], 16))
+
+        if memo_key is not None and result is not None:
+            ttl = self.config.memoize.ttls[rpc]
+            self._memo.set(memo_key, rpc, result, self.network.block_time if ttl is None else ttl)
+
+    @property
+    def _request_cache(self) -> RequestCache:
+        return get_request_cache(
+            self.data_folder / "cache.sqlite", self.config.cache.max_size_mb * 1024 * 1024
+        )
+
+    def _get_cache_key(self, rpc: str, parameters: Iterable) -> str | None:
+        if not self.config.cache.enabled or rpc not in CACHEABLE_METHODS:
+            return None
+
+        return get_cache_key(self.chain_id, rpc, list(parameters))
+
+    def _is_final(self, rpc: str, parameters: Iterable, result: Any) -> bool:
+        if rpc == "debug_traceTransaction" and result:
+            # NOTE: Geth traces do not include the block number, so use the receipt's.
+            #   The receipt is usually cached already.
+            txn_hash = list(parameters)[0]
+            block_number = get_block_number(
+                "eth_getTransactionReceipt",
+                self.make_request("eth_getTransactionReceipt", [txn_hash]),
             )
-            raise cls(message) from err
+        else:
+            block_number = get_block_number(rpc, result)
+
+        if block_number is None:
+            return False
+
+        cache_config = self.config.cache
+        now = time.monotonic()
+        if self._finality_head is None or (
+            block_number > self._finality_head[1] - cache_config.finality_depth
+            and now - self._finality_head[0] > self.network.block_time
+        ):
+            head = int(self.make_request("eth_blockNumber", []), 16)
+            self._finality_head = (now, head)
+
+        return block_number <= self._finality_head[1] - cache_config.finality_depth
+
+    def _reserve_compute_units(self, *rpcs: str, uri: str | None = None) -> float:
+        """
+        Take the compute units of the given calls from the rate-limit budget of the
+        URI (each API key has its own). Returns the number of seconds to wait before
+        sending them.
+        """
+        if uri is not None and uri not in self._get_api_key_pool().uris:
+            # NOTE: Fallback endpoints do not spend Alchemy compute units.
+            return 0.0
+
+        rate_limit = self.config.rate_limit
+        bucket = get_compute_unit_bucket(uri or self.uri, rate_limit, self.data_folder)
+        if not bucket:
+            return 0.0
+
+        costs = rate_limit.compute_unit_costs
+        return bucket.reserve(sum(get_compute_units(rpc, costs) for rpc in rpcs))
+
+    def _wait_for_compute_units(self, *rpcs: str, uri: str | None = None):
+        if delay := self._reserve_compute_units(*rpcs, uri=uri):
+            time.sleep(delay)
 
-        return result["result"] if isinstance(result, dict) and "result" in result else result
+    def _get_http_error(self, err: HTTPError) -> AlchemyProviderError:
+        response_data = err.response.json() if err.response else {}
+        if "error" not in response_data:
+            return AlchemyProviderError(str(err))
+
+        return self._get_rpc_error(response_data["error"])
+
+    @staticmethod
+    def _get_rpc_error(error_data: Any) -> AlchemyProviderError:
+        message = (
+            error_data.get("message", str(error_data))
+            if isinstance(error_data, dict)
+            else error_data
+        )
+        if isinstance(error_data, dict) and error_data.get("code") == 429:
+            return AlchemyRateLimitError(message)
+
+        # NOTE: Methods that do not exist on the network are reported as not found.
+        cls = (
+            AlchemyFeatureNotAvailable
+            if "is not available" in message
+            or (isinstance(error_data, dict) and error_data.get("code") == -32601)
+            else AlchemyProviderError
+        )
+        return cls(message, data=error_data.get("data") if isinstance(error_data, dict) else None)
 
     def send_private_transaction(self, txn: TransactionAPI, **kwargs) -> ReceiptAPI:
         """
@@ -338,6 +1748,58 @@ class Alchemy(Web3Provider, UpstreamProvider):
         Returns:
             :class:`~ape.api.transactions.ReceiptAPI`
         """
+        future: Future[ReceiptAPI] = Future()
+        self._send_private_transaction(txn, future, **kwargs)
+        return self._wait_for_receipt(
+            future,
+            self._get_private_transaction_timeout(),
+            self._get_required_confirmations(txn),
+        )
+
+    def send_private_transactions(
+        self, txns: Iterable[TransactionAPI], **kwargs
+    ) -> list["Future[ReceiptAPI]"]:
+        """
+        Send many private transactions concurrently, without waiting for them.
+        Rather than each transaction polling for its receipt, a single thread
+        checks all of them on each new block.
+
+        .. code-block:: python
+
+            futures = provider.send_private_transactions(txns, fast=True)
+            receipts = [future.result() for future in futures]
+
+        Args:
+            txns (Iterable[:class:`~ape.api.transactions.TransactionAPI`]): The
+              signed transactions.
+            **kwargs: Private-transaction "preferences" used for all the transactions.
+
+        Returns:
+            list[Future[:class:`~ape.api.transactions.ReceiptAPI`]]: The confirmed
+            receipts, in the same order as the transactions. A future raises the
+            error of a failed send, or ``TransactionNotFoundError`` when its
+            transaction is not mined in time.
+        """
+        if self._private_executor is None:
+            self._private_executor = ThreadPoolExecutor(
+                max_workers=self.config.private_transactions.max_concurrent_sends,
+                thread_name_prefix="alchemy-private",
+            )
+
+        futures: list[Future[ReceiptAPI]] = []
+        for txn in txns:
+            future: Future[ReceiptAPI] = Future()
+            self._private_executor.submit(self._send_private_transaction, txn, future, **kwargs)
+            futures.append(future)
+
+        return futures
+
+    def _send_private_transaction(
+        self, txn: TransactionAPI, future: "Future[ReceiptAPI]", **kwargs
+    ):
+        """
+        Send a private transaction and resolve the future with its confirmed receipt.
+        """
         max_block_number = kwargs.pop("max_block_number", None)
 
         params = {
@@ -350,32 +1812,72 @@ class Alchemy(Web3Provider, UpstreamProvider):
             params["preferences"] = kwargs
 
         try:
-            txn_hash = self.make_request("eth_sendPrivateTransaction", [params])
-        except (ValueError, Web3ContractLogicError) as err:
-            vm_err = self.get_virtual_machine_error(err, txn=txn)
-            raise vm_err from err
+            try:
+                txn_hash = self.make_request("eth_sendPrivateTransaction", [params])
+            except (ValueError, Web3ContractLogicError) as err:
+                vm_err = self.get_virtual_machine_error(err, txn=txn)
+                raise vm_err from err
+
+            if isinstance(txn_hash, dict) and "error" in txn_hash:
+                error = self._get_rpc_error(txn_hash["error"])
+                if type(error) is AlchemyProviderError:
+                    raise self.get_virtual_machine_error(error, txn=txn) from error
+
+                raise error
+
+        except Exception as err:
+            future.set_exception(err)
+            return
+
+        confirmed = self._get_receipt_watcher().watch(
+            txn_hash,
+            required_confirmations=self._get_required_confirmations(txn),
+            timeout=self._get_private_transaction_timeout(),
+            max_block_number=(
+                int(max_block_number, 16) if isinstance(max_block_number, str) else max_block_number
+            ),
+        )
+
+        def on_confirmed(done: "Future[ReceiptAPI]"):
+            if (error := done.exception()) is not None:
+                future.set_exception(error)
+                return
 
+            receipt = done.result()
+            logger.info(
+                f"Confirmed {receipt.txn_hash} (private) "
+                f"(total fees paid = {receipt.total_fees_paid})"
+            )
+            self.chain_manager.history.append(receipt)
+            future.set_result(receipt)
+
+        confirmed.add_done_callback(on_confirmed)
+
+    def _get_private_transaction_timeout(self) -> float:
         # Since Alchemy will attempt to publish for 25 blocks,
         # we add 25 * block_time to the timeout.
-        timeout = (
+        return (
             PRIVATE_TX_BLOCK_WAIT * self.network.block_time
             + self.network.transaction_acceptance_timeout
         )
 
-        receipt = self.get_receipt(
-            txn_hash,
-            required_confirmations=(
-                txn.required_confirmations
-                if txn.required_confirmations is not None
-                else self.network.required_confirmations
-            ),
-            timeout=timeout,
-        )
-        logger.info(
-            f"Confirmed {receipt.txn_hash} (private) (total fees paid = {receipt.total_fees_paid})"
+    def _get_required_confirmations(self, txn: TransactionAPI) -> int:
+        return (
+            txn.required_confirmations
+            if txn.required_confirmations is not None
+            else self.network.required_confirmations
         )
-        self.chain_manager.history.append(receipt)
-        return receipt
+
+    def _get_receipt_watcher(self) -> ReceiptWatcher:
+        if self._receipt_watcher is None:
+            poll_interval = self.config.receipts.poll_interval
+            self._receipt_watcher = ReceiptWatcher(
+                self,
+                self.network.block_time / 2 if poll_interval is None else poll_interval,
+                use_subscriptions=self.config.websocket.poll_with_subscriptions,
+            )
+
+        return self._receipt_watcher
 
     def get_receipt(
         self,
@@ -386,21 +1888,180 @@ class Alchemy(Web3Provider, UpstreamProvider):
     ) -> ReceiptAPI:
         if not required_confirmations and not timeout:
             # Allows `get_receipt` to work better when not sending.
-            try:
-                data = self.web3.eth.get_transaction_receipt(HexStr(txn_hash))
-            except TransactionNotFound as err:
-                raise TransactionNotFoundError(txn_hash) from err
-
-            txn = dict(self.web3.eth.get_transaction(HexStr(txn_hash)))
-            return self.network.ecosystem.decode_receipt(
-                {
-                    "provider": self,
-                    "required_confirmations": required_confirmations,
-                    **txn,
-                    **data,
-                }
-            )
+            # NOTE: Using `make_request()` so finalized results are cached.
+            if not (data := self.make_request("eth_getTransactionReceipt", [txn_hash])):
+                raise TransactionNotFoundError(txn_hash)
+
+            txn = self.make_request("eth_getTransactionByHash", [txn_hash])
+            return self._decode_receipt(txn, data)
+
+        if required_confirmations < 0:
+            raise TransactionError("Required confirmations cannot be negative.")
+
+        # perf: If called from `send_transaction()`, the transaction is already known.
+        transaction = kwargs.get("transaction")
+        txn_data = (
+            None
+            if not transaction
+            else transaction
+            if isinstance(transaction, dict)
+            else transaction.model_dump(by_alias=True, mode="json")
+        )
+
         # Sending txns will get here because they always pass in required confs.
-        return super().get_receipt(
-            txn_hash, required_confirmations=required_confirmations, timeout=timeout, **kwargs
+        # NOTE: One thread waits for all of them, checking each new block once.
+        timeout = self.network.transaction_acceptance_timeout if timeout is None else timeout
+        future = self._get_receipt_watcher().watch(
+            txn_hash,
+            required_confirmations=required_confirmations,
+            timeout=timeout,
+            transaction=txn_data,
+        )
+        try:
+            return self._wait_for_receipt(future, timeout, required_confirmations, txn_hash)
+        except TransactionNotFoundError:
+            if not kwargs.get("private"):
+                raise
+
+            # Since private transactions can take longer,
+            #  return a partial receipt instead, like ape does.
+            return self._create_receipt(
+                block_number=-1,
+                required_confirmations=required_confirmations,
+                txn_hash=txn_hash,
+                status=TransactionStatusEnum.NO_ERROR,
+                **(txn_data or {}),
+            )
+
+    def _wait_for_receipt(
+        self,
+        future: "Future[ReceiptAPI]",
+        timeout: float,
+        required_confirmations: int,
+        txn_hash: str | None = None,
+    ) -> ReceiptAPI:
+        # NOTE: The watcher fails the future once the transaction times out. This is a
+        #   backstop, should it not, with time for the confirmations once mined.
+        backstop = timeout + (required_confirmations + 1) * self.network.block_time
+        try:
+            return future.result(timeout=backstop + RECEIPT_WAIT_MARGIN)
+        except FutureTimeoutError as err:
+            raise TransactionNotFoundError(txn_hash, "Timed out waiting for receipt.") from err
+
+    def get_receipts(self, txn_hashes: Iterable[str]) -> list[ReceiptAPI]:
+        """
+        Get many receipts, fetching all their receipt and transaction data
+        using batch requests.
+
+        Args:
+            txn_hashes (Iterable[str]): The transaction hashes.
+
+        Returns:
+            list[:class:`~ape.api.transactions.ReceiptAPI`]: The receipts,
+            in the same order as the hashes.
+        """
+        txn_hashes = list(txn_hashes)
+        with self.batch_requests() as batch:
+            calls = [
+                (
+                    batch.add("eth_getTransactionReceipt", [txn_hash]),
+                    batch.add("eth_getTransactionByHash", [txn_hash]),
+                )
+                for txn_hash in txn_hashes
+            ]
+
+        receipts = []
+        for txn_hash, (receipt_future, txn_future) in zip(txn_hashes, calls, strict=True):
+            if not (data := receipt_future.result()):
+                raise TransactionNotFoundError(txn_hash)
+
+            receipts.append(self._decode_receipt(txn_future.result(), data))
+
+        return receipts
+
+    def get_receipts_for_block(self, block_id: "BlockID") -> list[ReceiptAPI]:
+        """
+        Get the receipts of all transactions in a block, using Alchemy's
+        ``alchemy_getTransactionReceipts`` and a single full-block request.
+        On networks without ``alchemy_getTransactionReceipts``, the receipts
+        are fetched concurrently instead.
+
+        Args:
+            block_id (:class:`~ape.types.BlockID`): The block number, hash or tag.
+
+        Returns:
+            list[:class:`~ape.api.transactions.ReceiptAPI`]: The receipts, in block order.
+        """
+        if isinstance(block_id, str) and block_id.isnumeric():
+            block_id = int(block_id)
+
+        if isinstance(block_id, bytes) or (isinstance(block_id, str) and len(block_id) == 66):
+            block_hash = to_hex(HexBytes(block_id))
+            block_call = ("eth_getBlockByHash", [block_hash, True])
+            receipts_params = {"blockHash": block_hash}
+        elif isinstance(block_id, int) or (isinstance(block_id, str) and block_id.startswith("0x")):
+            block_number = to_hex(int(block_id, 16) if isinstance(block_id, str) else block_id)
+            block_call = ("eth_getBlockByNumber", [block_number, True])
+            receipts_params = {"blockNumber": block_number}
+        else:
+            # NOTE: Resolve tags, like "latest", first so both requests are for the same block.
+            block = self.make_request("eth_getBlockByNumber", [block_id, True])
+            return self.get_receipts_for_block(block["number"]) if block else []
+
+        with self.batch_requests() as batch:
+            block_future = batch.add(*block_call)
+            receipts_future = batch.add("alchemy_getTransactionReceipts", [receipts_params])
+
+        if not (block := block_future.result()):
+            raise BlockNotFoundError(block_id)
+
+        transactions = block.get("transactions", [])
+        try:
+            receipts = receipts_future.result()["receipts"]
+        except (AlchemyProviderError, KeyError, TypeError) as err:
+            logger.debug(f"Fetching receipts concurrently: {err}")
+            with ThreadPoolExecutor(self.concurrency) as pool:
+                receipts = list(
+                    pool.map(
+                        lambda txn: self.make_request("eth_getTransactionReceipt", [txn["hash"]]),
+                        transactions,
+                    )
+                )
+
+        # NOTE: Receipts may be missing, such as while the block is propagating or re-organized.
+        receipts_by_hash = {r["transactionHash"].lower(): r for r in receipts if r}
+        if missing := next(
+            (txn["hash"] for txn in transactions if txn["hash"].lower() not in receipts_by_hash),
+            None,
+        ):
+            raise TransactionNotFoundError(missing, f"Receipt not found in block '{block_id}'.")
+
+        return [
+            self._decode_receipt(txn, receipts_by_hash[txn["hash"].lower()]) for txn in transactions
+        ]
+
+    def _create_receipt_with_transaction(
+        self, txn: dict, receipt: dict, required_confirmations: int = 0
+    ) -> ReceiptAPI:
+        # NOTE: Uses transaction data as ape serializes it, the same as
+        #   `Web3Provider.get_receipt()` does when given the transaction.
+        receipt_data = dict(receipt_formatter(receipt))
+        if "effectiveGasPrice" in receipt_data:
+            receipt_data["gasPrice"] = receipt_data["effectiveGasPrice"]
+
+        return self._create_receipt(
+            **{"required_confirmations": required_confirmations, **txn, **receipt_data}
+        )
+
+    def _decode_receipt(
+        self, txn: dict, receipt: dict, required_confirmations: int = 0
+    ) -> ReceiptAPI:
+        # NOTE: The raw RPC data must be formatted the same as `web3.eth` would.
+        return self.network.ecosystem.decode_receipt(
+            {
+                "provider": self,
+                "required_confirmations": required_confirmations,
+                **transaction_result_formatter(txn),
+                **receipt_formatter(receipt),
+            }
         )
@@ -0,0 +1,202 @@
+import struct
+import time
+from collections.abc import Callable
+from hashlib import sha256
+from pathlib import Path
+from threading import Lock
+from typing import TYPE_CHECKING
+
+try:
+    import fcntl
+except ImportError:
+    # NOTE: Not available on Windows; sharing across processes is unsupported there.
+    fcntl = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from .config import RateLimitConfig
+
+# Compute units per method, as published by Alchemy.
+# See https://docs.alchemy.com/reference/compute-unit-costs
+# NOTE: Override or extend these using the `rate_limit.compute_unit_costs` config.
+COMPUTE_UNITS: dict[str, int] = {
+    "alchemy_getTokenBalances": 26,
+    "alchemy_getTokenMetadata": 16,
+    "alchemy_getTransactionReceipts": 250,
+    "alchemy_simulateAssetChanges": 2500,
+    "alchemy_simulateAssetChangesBundle": 2500,
+    "alchemy_simulateExecution": 2500,
+    "alchemy_simulateExecutionBundle": 2500,
+    "debug_traceBlockByNumber": 497,
+    "debug_traceCall": 309,
+    "debug_traceTransaction": 309,
+    "eth_blockNumber": 10,
+    "eth_call": 26,
+    "eth_chainId": 0,
+    "eth_createAccessList": 10,
+    "eth_estimateGas": 87,
+    "eth_feeHistory": 10,
+    "eth_gasPrice": 19,
+    "eth_getBalance": 19,
+    "eth_getBlockByHash": 21,
+    "eth_getBlockByNumber": 16,
+    "eth_getCode": 19,
+    "eth_getLogs": 75,
+    "eth_getStorageAt": 17,
+    "eth_getTransactionByHash": 17,
+    "eth_getTransactionCount": 26,
+    "eth_getTransactionReceipt": 15,
+    "eth_maxPriorityFeePerGas": 10,
+    "eth_sendPrivateTransaction": 250,
+    "eth_sendRawTransaction": 250,
+    "eth_subscribe": 10,
+    "net_version": 0,
+    "trace_block": 24,
+    "trace_call": 75,
+    "trace_transaction": 26,
+}
+
+# The cost used for methods missing from the table.
+DEFAULT_COMPUTE_UNITS = 26
+
+
+def get_compute_units(rpc: str, overrides: dict[str, int] | None = None) -> int:
+    """
+    The estimated compute-unit cost of an RPC method.
+    """
+    if overrides and rpc in overrides:
+        return overrides[rpc]
+
+    return COMPUTE_UNITS.get(rpc, DEFAULT_COMPUTE_UNITS)
+
+
+class ComputeUnitBucket:
+    """
+    A thread-safe token bucket, measured in compute units, that refills at a
+    constant rate and holds at most one second of capacity. Callers reserve units
+    up-front and wait the returned delay, so concurrent callers queue fairly
+    instead of all retrying at once.
+    """
+
+    def __init__(self, rate: float, clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self._clock = clock
+        self._lock = Lock()
+        self._tokens = rate
+        self._updated = clock()
+
+    def reserve(self, units: int) -> float:
+        """
+        Take compute units from the bucket.
+
+        Args:
+            units (int): The number of compute units.
+
+        Returns:
+            float: The number of seconds to wait before sending the request.
+        """
+        with self._lock:
+            self._tokens, self._updated, delay = _take(
+                self._tokens, self._updated, self._clock(), self.rate, units
+            )
+
+        return delay
+
+    def remaining(self) -> float:
+        """
+        The number of compute units left in the bucket.
+        """
+        with self._lock:
+            return _refill(self._tokens, self._updated, self._clock(), self.rate)
+
+
+class SharedComputeUnitBucket(ComputeUnitBucket):
+    """
+    A :class:`~ape_alchemy.rate_limit.ComputeUnitBucket` with its state kept
+    in a locked file, so all processes on the machine share the same budget.
+    """
+
+    _STATE = struct.Struct("dd")
+
+    def __init__(self, rate: float, path: Path):
+        super().__init__(rate, clock=time.time)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch(exist_ok=True)
+        self.path = path
+
+    def reserve(self, units: int) -> float:
+        with self._lock, open(self.path, "r+b") as file:
+            fcntl.flock(file, fcntl.LOCK_EX)
+            try:
+                data = file.read(self._STATE.size)
+                now = self._clock()
+                tokens, updated = (
+                    self._STATE.unpack(data) if len(data) == self._STATE.size else (self.rate, now)
+                )
+                tokens, updated, delay = _take(tokens, updated, now, self.rate, units)
+                file.seek(0)
+                file.write(self._STATE.pack(tokens, updated))
+                file.truncate()
+            finally:
+                fcntl.flock(file, fcntl.LOCK_UN)
+
+        return delay
+
+    def remaining(self) -> float:
+        with self._lock, open(self.path, "rb") as file:
+            fcntl.flock(file, fcntl.LOCK_SH)
+            try:
+                data = file.read(self._STATE.size)
+            finally:
+                fcntl.flock(file, fcntl.LOCK_UN)
+
+        if len(data) != self._STATE.size:
+            return self.rate
+
+        tokens, updated = self._STATE.unpack(data)
+        return _refill(tokens, updated, self._clock(), self.rate)
+
+
+def _refill(tokens: float, updated: float, now: float, rate: float) -> float:
+    return min(rate, tokens + max(now - updated, 0) * rate)
+
+
+def _take(
+    tokens: float, updated: float, now: float, rate: float, units: int
+) -> tuple[float, float, float]:
+    # NOTE: Tokens may go negative; that debt is the wait time of the next caller.
+    tokens = _refill(tokens, updated, now, rate) - units
+    delay = -tokens / rate if tokens < 0 else 0.0
+    return tokens, now, delay
+
+
+_BUCKETS: dict[tuple, ComputeUnitBucket] = {}
+_BUCKETS_LOCK = Lock()
+
+
+def get_compute_unit_bucket(
+    uri: str, config: "RateLimitConfig", data_folder: Path
+) -> ComputeUnitBucket | None:
+    """
+    Get the bucket shared by all providers using the given URI, or ``None``
+    when ``compute_units_per_second`` is not configured.
+    """
+    if not (rate := config.compute_units_per_second):
+        return None
+
+    shared = config.share_across_processes and fcntl is not None
+    key = (uri, rate, shared)
+    if bucket := _BUCKETS.get(key):
+        return bucket
+
+    with _BUCKETS_LOCK:
+        if bucket := _BUCKETS.get(key):
+            return bucket
+
+        if shared:
+            file_name = f"{sha256(uri.encode()).hexdigest()[:16]}.bucket"
+            bucket = SharedComputeUnitBucket(rate, data_folder / "rate_limit" / file_name)
+        else:
+            bucket = ComputeUnitBucket(rate)
+
+        _BUCKETS[key] = bucket
+        return bucket
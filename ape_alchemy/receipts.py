@@ -0,0 +1,379 @@
+import time
+from concurrent.futures import Future
+from threading import Event, Lock, Thread
+from typing import TYPE_CHECKING, TypeVar
+
+from ape.exceptions import TransactionNotFoundError
+from ape.logging import logger
+
+from .exceptions import AlchemyProviderError
+
+if TYPE_CHECKING:
+    from ape.api import ReceiptAPI
+
+    from .provider import Alchemy
+    from .websocket import Subscription
+
+# The shortest time between checks for a new block.
+MIN_POLL_INTERVAL = 0.25
+# The most new blocks to match against the pending transactions. After a longer
+# gap, such as on start-up, every pending transaction's receipt is checked instead.
+MAX_BLOCKS_TO_MATCH = 16
+
+_Limit = TypeVar("_Limit", int, float)
+
+
+class PendingReceipt:
+    """
+    A transaction waiting to be mined and confirmed.
+    """
+
+    __slots__ = (
+        "block_number",
+        "checked",
+        "deadline",
+        "future",
+        "max_block_number",
+        "required_confirmations",
+        "transaction",
+    )
+
+    def __init__(
+        self,
+        required_confirmations: int,
+        deadline: float | None,
+        max_block_number: int | None,
+        transaction: dict | None = None,
+    ):
+        self.required_confirmations = required_confirmations
+        self.deadline = deadline
+        self.max_block_number = max_block_number
+        # The transaction's data, when known, so it is not fetched.
+        self.transaction = transaction
+        self.block_number: int | None = None
+        # Whether its receipt has been checked since it started being watched.
+        self.checked = False
+        self.future: Future[ReceiptAPI] = Future()
+
+
+class ReceiptWatcher:
+    """
+    Waits for the receipts of many transactions at once, rather than each
+    transaction polling on its own. A single thread fetches each new block once
+    and matches its transactions against the pending ones, so only the receipts
+    of mined transactions are requested. The cost of waiting stays about the same
+    however many transactions are pending. The thread only runs while there are
+    transactions to wait for.
+
+    Args:
+        provider (:class:`~ape_alchemy.provider.Alchemy`): The provider.
+        poll_interval (float): The number of seconds between checks for a new block.
+        use_subscriptions (bool): Wait for ``newHeads`` notifications instead of
+          polling, when the network has a WebSocket URI.
+    """
+
+    def __init__(self, provider: "Alchemy", poll_interval: float, use_subscriptions: bool = False):
+        self.provider = provider
+        self.poll_interval = max(poll_interval, MIN_POLL_INTERVAL)
+        self.use_subscriptions = use_subscriptions
+        self._lock = Lock()
+        self._pending: dict[str, PendingReceipt] = {}
+        self._thread: Thread | None = None
+        self._stopped = Event()
+        # Set to check newly watched transactions without waiting for the next poll.
+        self._wake = Event()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def watch(
+        self,
+        txn_hash: str,
+        required_confirmations: int = 0,
+        timeout: float | None = None,
+        max_block_number: int | None = None,
+        transaction: dict | None = None,
+    ) -> "Future[ReceiptAPI]":
+        """
+        Wait for a transaction to be mined and confirmed.
+
+        Args:
+            txn_hash (str): The transaction hash.
+            required_confirmations (int): The number of blocks after the
+              transaction's block to wait for.
+            timeout (float | None): The number of seconds to wait before failing
+              with ``TransactionNotFoundError``. Defaults to ``None`` (no limit).
+            max_block_number (int | None): Fail once a later block has been mined
+              without the transaction.
+            transaction (dict | None): The transaction's data, as ape serializes
+              it, to use instead of fetching it.
+
+        Returns:
+            Future[:class:`~ape.api.transactions.ReceiptAPI`]
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            if (pending := self._pending.get(txn_hash)) is None:
+                pending = PendingReceipt(
+                    required_confirmations, deadline, max_block_number, transaction=transaction
+                )
+                self._pending[txn_hash] = pending
+            else:
+                # NOTE: Waiters of the same transaction share the most confirmations
+                #   and the latest limits, so none fails before it would on its own.
+                pending.required_confirmations = max(
+                    pending.required_confirmations, required_confirmations
+                )
+                pending.deadline = _get_later(pending.deadline, deadline)
+                pending.max_block_number = _get_later(pending.max_block_number, max_block_number)
+                pending.transaction = pending.transaction or transaction
+
+            if self._thread is None:
+                # NOTE: Each thread has its own stop event, so a stopped one cannot be revived.
+                self._stopped = Event()
+                self._thread = Thread(
+                    target=self._run, args=(self._stopped,), daemon=True, name="alchemy-receipts"
+                )
+                self._thread.start()
+
+        self._wake.set()
+        return pending.future
+
+    def stop(self):
+        """
+        Stop waiting, failing the futures of all pending transactions.
+        """
+        self._stopped.set()
+        self._wake.set()
+        with self._lock:
+            pending = list(self._pending.values())
+            self._pending.clear()
+            self._thread = None
+
+        for item in pending:
+            if not item.future.done():
+                item.future.set_exception(AlchemyProviderError("Stopped waiting for receipt."))
+
+    def _run(self, stopped: Event):
+        heads = self._subscribe()
+        last_head = None
+        try:
+            while not stopped.is_set():
+                with self._lock:
+                    for txn_hash in [h for h, i in self._pending.items() if i.future.cancelled()]:
+                        del self._pending[txn_hash]
+
+                    if not self._pending:
+                        self._thread = None
+                        return
+
+                if heads is not None and heads.is_closed:
+                    logger.debug("New heads subscription closed. Polling instead.")
+                    heads = None
+
+                try:
+                    head = self._get_head(heads, last_head)
+                    self._check(head, last_head)
+                    last_head = head
+
+                except Exception as err:
+                    # NOTE: Tried again on the next poll.
+                    logger.debug(f"Failed checking for receipts: {err}")
+
+                # NOTE: Expire on every poll, so timeouts still fire while the node is down.
+                self._expire(last_head)
+
+                if heads is None:
+                    self._wake.wait(self.poll_interval)
+                    self._wake.clear()
+
+        finally:
+            if heads is not None:
+                heads.close()
+
+    def _subscribe(self) -> "Subscription | None":
+        if not self.use_subscriptions or self.provider.ws_uri is None:
+            return None
+
+        try:
+            return self.provider.subscribe_new_heads()
+        except Exception as err:
+            logger.debug(f"Failed subscribing to new heads: {err} Polling instead.")
+            return None
+
+    def _get_head(self, heads: "Subscription | None", last_head: int | None) -> int:
+        if heads is None or last_head is None:
+            return int(self.provider.make_request("eth_blockNumber", []), 16)
+
+        # NOTE: Wait briefly, so newly watched transactions are still checked promptly.
+        head = last_head
+        try:
+            notification = heads.get(timeout=MIN_POLL_INTERVAL)
+            while True:
+                head = int(notification["number"], 16)
+                # NOTE: Skip to the newest head, when several are queued.
+                notification = heads.get(timeout=0)
+
+        except TimeoutError:
+            pass
+
+        return head
+
+    def _check(self, head: int, last_head: int | None):
+        if last_head is None or head == last_head:
+            new_blocks = range(0)
+        elif head < last_head:
+            # NOTE: Re-organized, so the blocks matched before may be gone.
+            new_blocks = range(max(head + 1 - MAX_BLOCKS_TO_MATCH, 0), head + 1)
+        else:
+            new_blocks = range(last_head + 1, head + 1)
+
+        with self._lock:
+            unmined = {h for h, i in self._pending.items() if i.block_number is None}
+
+        matched = self._match(unmined, new_blocks) if unmined and new_blocks else set()
+        with self._lock:
+            pending = [
+                (txn_hash, item)
+                for txn_hash, item in self._pending.items()
+                if not item.checked
+                or txn_hash in matched
+                # NOTE: Re-check mined transactions once confirmed, in case of a re-org.
+                or (
+                    head != last_head
+                    and item.block_number is not None
+                    and head - item.block_number >= item.required_confirmations
+                )
+            ]
+
+        if pending:
+            self._check_receipts(head, pending)
+
+    def _match(self, txn_hashes: set[str], block_numbers: range) -> set[str]:
+        """
+        The given transactions included in the given blocks, or all of them when
+        there are too many blocks to fetch.
+        """
+        if len(block_numbers) > MAX_BLOCKS_TO_MATCH:
+            return txn_hashes
+
+        with self.provider.batch_requests() as batch:
+            blocks = [
+                batch.add("eth_getBlockByNumber", [hex(number), False]) for number in block_numbers
+            ]
+
+        lowered = {txn_hash.lower(): txn_hash for txn_hash in txn_hashes}
+        matched: set[str] = set()
+        for block in blocks:
+            try:
+                included = (block.result() or {}).get("transactions", [])
+            except Exception as err:
+                logger.debug(f"Failed getting block: {err}")
+                # NOTE: Cannot tell what the block includes, so check them all.
+                return txn_hashes
+
+            matched.update(lowered[h.lower()] for h in included if h.lower() in lowered)
+
+        return matched
+
+    def _check_receipts(self, head: int | None, pending: list[tuple[str, PendingReceipt]]):
+        with self.provider.batch_requests() as batch:
+            receipt_futures = [batch.add("eth_getTransactionReceipt", [h]) for h, _ in pending]
+
+        confirmed = []
+        for (txn_hash, item), receipt_future in zip(pending, receipt_futures, strict=True):
+            try:
+                receipt = receipt_future.result()
+            except Exception as err:
+                logger.debug(f"Failed getting receipt '{txn_hash}': {err}")
+                continue
+
+            item.checked = True
+            if not receipt:
+                item.block_number = None
+                continue
+
+            item.block_number = int(receipt["blockNumber"], 16)
+            if head is not None and head - item.block_number >= item.required_confirmations:
+                confirmed.append((txn_hash, item, receipt))
+
+        # NOTE: Only fetch the transactions not given by the waiters.
+        unknown = [(h, i, r) for h, i, r in confirmed if i.transaction is None]
+        if unknown:
+            with self.provider.batch_requests() as batch:
+                txn_futures = {h: batch.add("eth_getTransactionByHash", [h]) for h, _, _ in unknown}
+        else:
+            txn_futures = {}
+
+        for txn_hash, item, receipt in confirmed:
+            try:
+                if item.transaction is not None:
+                    result = self.provider._create_receipt_with_transaction(
+                        item.transaction,
+                        receipt,
+                        required_confirmations=item.required_confirmations,
+                    )
+                else:
+                    result = self.provider._decode_receipt(
+                        txn_futures[txn_hash].result(),
+                        receipt,
+                        required_confirmations=item.required_confirmations,
+                    )
+
+            except Exception as err:
+                logger.debug(f"Failed getting transaction '{txn_hash}': {err}")
+                continue
+
+            self._resolve(txn_hash, item, result)
+
+    def _expire(self, head: int | None):
+        now = time.monotonic()
+        with self._lock:
+            expired = [
+                (txn_hash, item)
+                for txn_hash, item in self._pending.items()
+                if item.block_number is None
+                and (
+                    (item.deadline is not None and now > item.deadline)
+                    or (
+                        item.max_block_number is not None
+                        and head is not None
+                        and head > item.max_block_number
+                    )
+                )
+            ]
+
+        if not expired:
+            return
+
+        try:
+            # NOTE: Check once more, in case a match was missed.
+            self._check_receipts(head, expired)
+        except Exception as err:
+            logger.debug(f"Failed checking expired receipts: {err}")
+        for txn_hash, item in expired:
+            if item.block_number is None:
+                self._resolve(
+                    txn_hash,
+                    item,
+                    TransactionNotFoundError(txn_hash, "Timed out waiting for receipt."),
+                )
+
+    def _resolve(self, txn_hash: str, item: PendingReceipt, result: "ReceiptAPI | Exception"):
+        with self._lock:
+            if self._pending.get(txn_hash) is item:
+                del self._pending[txn_hash]
+
+        if item.future.done():
+            # NOTE: Cancelled by the caller.
+            return
+
+        if isinstance(result, Exception):
+            item.future.set_exception(result)
+        else:
+            item.future.set_result(result)
+
+
+def _get_later(limit: _Limit | None, other: _Limit | None) -> _Limit | None:
+    # NOTE: No limit is the latest.
+    return None if limit is None or other is None else max(limit, other)
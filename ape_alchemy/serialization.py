@@ -0,0 +1,254 @@
+import re
+import struct
+import sys
+import zlib
+from typing import Any
+
+from .exceptions import AlchemyProviderError
+
+try:
+    from compression import zstd  # type: ignore[import-not-found]
+except ImportError:
+    try:
+        import zstandard as zstd  # type: ignore[import-not-found,no-redef]
+    except ImportError:
+        # NOTE: Install `ape-alchemy[zstd]` for zstd compression; zlib is used otherwise.
+        zstd = None
+
+# NOTE: Starts with a null byte, so it is never mistaken for JSON.
+MAGIC = b"\x00T"
+VERSION = 1
+
+# Payloads smaller than this are not worth compressing.
+_MIN_COMPRESS_SIZE = 256
+
+# Compression codes.
+_UNCOMPRESSED = 0
+_ZLIB = 1
+_ZSTD = 2
+
+# Value tags.
+_NULL = 0
+_TRUE = 1
+_FALSE = 2
+_INT = 3
+_FLOAT = 4
+_STR = 5  # A string, added to the string table.
+_STR_REF = 6  # A reference to the string table.
+_ADDRESS = 7  # A 20-byte address, added to the string table.
+_HEX = 8  # Hex data, stored as raw bytes.
+_QUANTITY = 9  # A hex-encoded integer, such as "0x1f".
+_LIST = 10
+_DICT = 11
+_LONG_STR = 12  # A string not worth adding to the table.
+
+# Strings longer than this are not interned.
+_MAX_INTERNED_SIZE = 64
+
+_HEX_PATTERN = re.compile(r"0x(?:[0-9a-f]{2})*")
+_QUANTITY_PATTERN = re.compile(r"0x(?:0|[1-9a-f][0-9a-f]*)")
+_FLOAT_STRUCT = struct.Struct(">d")
+
+
+def dumps(data: Any, compress: bool = True) -> bytes:
+    """
+    Serialize a trace payload, such as the result of ``trace_transaction`` or
+    ``debug_traceTransaction``, into a compact binary format. Hex data is stored
+    as raw bytes, quantities as integers, and repeated keys and addresses once.
+
+    Args:
+        data (Any): The JSON-like payload.
+        compress (bool): Set to ``False`` to skip compression. Uses zstd when
+          available, else zlib. Small payloads are never compressed.
+
+    Returns:
+        bytes
+    """
+    body = bytearray()
+    _encode(data, body, {})
+    if not compress or len(body) < _MIN_COMPRESS_SIZE:
+        compression, payload = _UNCOMPRESSED, bytes(body)
+    elif zstd is not None:
+        compression, payload = _ZSTD, zstd.compress(bytes(body))
+    else:
+        compression, payload = _ZLIB, zlib.compress(body, 6)
+
+    # NOTE: The version and compression share the byte after the magic.
+    return MAGIC + bytes(((VERSION << 4) | compression,)) + payload
+
+
+def loads(data: bytes) -> Any:
+    """
+    Deserialize a payload created by :func:`~ape_alchemy.serialization.dumps`.
+    Repeated keys and addresses share a single string object.
+
+    Args:
+        data (bytes): The serialized payload.
+
+    Returns:
+        Any: The JSON-like payload.
+    """
+    header_size = len(MAGIC) + 1
+    if data[: len(MAGIC)] != MAGIC or len(data) < header_size:
+        raise AlchemyProviderError("Not a serialized trace.")
+
+    version, compression = divmod(data[len(MAGIC)], 16)
+    if version != VERSION:
+        raise AlchemyProviderError(f"Unsupported serialized trace version '{version}'.")
+
+    payload = data[header_size:]
+    if compression == _ZLIB:
+        payload = zlib.decompress(payload)
+    elif compression == _ZSTD:
+        if zstd is None:
+            raise AlchemyProviderError(
+                "Trace is zstd-compressed. Install 'ape-alchemy[zstd]' to load it."
+            )
+
+        payload = zstd.decompress(payload)
+    elif compression != _UNCOMPRESSED:
+        raise AlchemyProviderError(f"Unknown trace compression '{compression}'.")
+
+    value, _ = _decode(memoryview(payload), 0, [])
+    return value
+
+
+def _encode(value: Any, out: bytearray, table: dict[str, int]):
+    if value is None:
+        out.append(_NULL)
+    elif value is True:
+        out.append(_TRUE)
+    elif value is False:
+        out.append(_FALSE)
+    elif isinstance(value, int):
+        out.append(_INT)
+        _write_varint((value << 1) if value >= 0 else ((-value << 1) - 1), out)
+    elif isinstance(value, float):
+        out.append(_FLOAT)
+        out += _FLOAT_STRUCT.pack(value)
+    elif isinstance(value, str):
+        _encode_str(value, out, table)
+    elif isinstance(value, dict):
+        out.append(_DICT)
+        _write_varint(len(value), out)
+        for key, item in value.items():
+            _encode_str(str(key), out, table)
+            _encode(item, out, table)
+    elif isinstance(value, list | tuple):
+        out.append(_LIST)
+        _write_varint(len(value), out)
+        for item in value:
+            _encode(item, out, table)
+    elif isinstance(value, bytes | bytearray):
+        out.append(_HEX)
+        _write_varint(len(value), out)
+        out += value
+    else:
+        raise TypeError(f"Unable to serialize '{type(value).__name__}'.")
+
+
+def _encode_str(value: str, out: bytearray, table: dict[str, int]):
+    if (index := table.get(value)) is not None:
+        out.append(_STR_REF)
+        _write_varint(index, out)
+
+    elif len(value) == 42 and _HEX_PATTERN.fullmatch(value):
+        table[value] = len(table)
+        out.append(_ADDRESS)
+        out += bytes.fromhex(value[2:])
+
+    elif len(value) % 2 == 0 and _HEX_PATTERN.fullmatch(value):
+        data = bytes.fromhex(value[2:])
+        out.append(_HEX)
+        _write_varint(len(data), out)
+        out += data
+
+    elif _QUANTITY_PATTERN.fullmatch(value):
+        out.append(_QUANTITY)
+        _write_varint(int(value, 16), out)
+
+    else:
+        data = value.encode()
+        if len(data) <= _MAX_INTERNED_SIZE:
+            table[value] = len(table)
+            out.append(_STR)
+        else:
+            out.append(_LONG_STR)
+
+        _write_varint(len(data), out)
+        out += data
+
+
+def _decode(data: memoryview, offset: int, table: list[str]) -> tuple[Any, int]:
+    tag = data[offset]
+    offset += 1
+    if tag == _NULL:
+        return None, offset
+    if tag == _TRUE:
+        return True, offset
+    if tag == _FALSE:
+        return False, offset
+    if tag == _INT:
+        number, offset = _read_varint(data, offset)
+        return (number >> 1) if not number & 1 else -((number + 1) >> 1), offset
+    if tag == _FLOAT:
+        return _FLOAT_STRUCT.unpack_from(data, offset)[0], offset + _FLOAT_STRUCT.size
+    if tag == _STR_REF:
+        index, offset = _read_varint(data, offset)
+        return table[index], offset
+    if tag == _ADDRESS:
+        address = sys.intern(f"0x{data[offset : offset + 20].hex()}")
+        table.append(address)
+        return address, offset + 20
+    if tag == _HEX:
+        size, offset = _read_varint(data, offset)
+        return f"0x{data[offset : offset + size].hex()}", offset + size
+    if tag == _QUANTITY:
+        number, offset = _read_varint(data, offset)
+        return hex(number), offset
+    if tag in (_STR, _LONG_STR):
+        size, offset = _read_varint(data, offset)
+        text = str(data[offset : offset + size], "utf8")
+        if tag == _STR:
+            text = sys.intern(text)
+            table.append(text)
+
+        return text, offset + size
+    if tag == _LIST:
+        size, offset = _read_varint(data, offset)
+        items = []
+        for _ in range(size):
+            item, offset = _decode(data, offset, table)
+            items.append(item)
+
+        return items, offset
+    if tag == _DICT:
+        size, offset = _read_varint(data, offset)
+        result = {}
+        for _ in range(size):
+            key, offset = _decode(data, offset, table)
+            result[key], offset = _decode(data, offset, table)
+
+        return result, offset
+
+    raise AlchemyProviderError(f"Invalid serialized trace (unknown tag '{tag}').")
+
+
+def _write_varint(number: int, out: bytearray):
+    while number > 0x7F:
+        out.append((number & 0x7F) | 0x80)
+        number >>= 7
+
+    out.append(number)
+
+
+def _read_varint(data: memoryview, offset: int) -> tuple[int, int]:
+    number = shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        number |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return number, offset
+
+        shift += 7
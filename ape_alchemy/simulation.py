@@ -0,0 +1,164 @@
+from typing import TYPE_CHECKING, Any
+
+from hexbytes import HexBytes
+
+if TYPE_CHECKING:
+    from ape.exceptions import VirtualMachineError
+
+# The transaction fields the simulation methods accept.
+SIMULATION_FIELDS = (
+    "from",
+    "to",
+    "value",
+    "data",
+    "gas",
+    "gasPrice",
+    "maxFeePerGas",
+    "maxPriorityFeePerGas",
+)
+
+
+class AssetChange:
+    """
+    A change to an account's assets, from ``alchemy_simulateAssetChanges``.
+    """
+
+    __slots__ = (
+        "amount",
+        "asset_type",
+        "change_type",
+        "contract_address",
+        "decimals",
+        "name",
+        "raw_amount",
+        "sender",
+        "receiver",
+        "symbol",
+        "token_id",
+    )
+
+    def __init__(
+        self,
+        asset_type: str,
+        change_type: str,
+        sender: str | None,
+        receiver: str | None,
+        raw_amount: int,
+        amount: str | None = None,
+        contract_address: str | None = None,
+        token_id: int | None = None,
+        decimals: int | None = None,
+        symbol: str | None = None,
+        name: str | None = None,
+    ):
+        # `NATIVE`, `ERC20`, `ERC721`, `ERC1155` or `SPECIAL_NFT`.
+        self.asset_type = asset_type
+        # `TRANSFER` or `APPROVE`.
+        self.change_type = change_type
+        self.sender = sender
+        self.receiver = receiver
+        self.raw_amount = raw_amount
+        # The amount in whole units, such as ether, as a decimal string.
+        self.amount = amount
+        self.contract_address = contract_address
+        self.token_id = token_id
+        self.decimals = decimals
+        self.symbol = symbol
+        self.name = name
+
+    def __repr__(self) -> str:
+        asset = self.symbol or self.contract_address or self.asset_type
+        return (
+            f"<{type(self).__name__} {self.change_type} {self.amount or self.raw_amount} "
+            f"{asset} {self.sender} -> {self.receiver}>"
+        )
+
+    @classmethod
+    def from_raw(cls, data: dict) -> "AssetChange":
+        token_id = data.get("tokenId")
+        return cls(
+            asset_type=data["assetType"],
+            change_type=data["changeType"],
+            sender=data.get("from"),
+            receiver=data.get("to"),
+            raw_amount=int(data.get("rawAmount") or 0),
+            amount=data.get("amount"),
+            contract_address=data.get("contractAddress"),
+            token_id=None if token_id is None else int(token_id, 0),
+            decimals=data.get("decimals"),
+            symbol=data.get("symbol"),
+            name=data.get("name"),
+        )
+
+
+class Simulation:
+    """
+    The simulated outcome of a transaction.
+
+    Args:
+        changes (list[:class:`~ape_alchemy.simulation.AssetChange`]): The asset changes.
+        calls (list[dict]): The call frames, from ``alchemy_simulateExecution``.
+          The first is the transaction's own call.
+        logs (list[dict]): The emitted logs.
+        gas_used (int | None): The gas used.
+        error (:class:`~ape.exceptions.VirtualMachineError` | None): Why the
+          transaction would fail, such as a ``ContractLogicError`` for a revert.
+    """
+
+    __slots__ = ("calls", "changes", "error", "gas_used", "logs")
+
+    def __init__(
+        self,
+        changes: list[AssetChange] | None = None,
+        calls: list[dict] | None = None,
+        logs: list[dict] | None = None,
+        gas_used: int | None = None,
+        error: "VirtualMachineError | None" = None,
+    ):
+        self.changes = changes or []
+        self.calls = calls or []
+        self.logs = logs or []
+        self.gas_used = gas_used
+        self.error = error
+
+    def __repr__(self) -> str:
+        outcome = f"error={self.error!r}" if self.error else f"changes={len(self.changes)}"
+        return f"<{type(self).__name__} {outcome}>"
+
+    @property
+    def failed(self) -> bool:
+        return self.error is not None
+
+    @property
+    def return_data(self) -> HexBytes:
+        """
+        The data returned by the transaction's call.
+        """
+        return HexBytes(self.calls[0].get("output") or b"") if self.calls else HexBytes(b"")
+
+
+def get_simulation_revert(changes: dict, execution: dict) -> str | None:
+    """
+    The revert message of simulation results, or ``None`` when it succeeded.
+    """
+    calls = execution.get("calls") or []
+    call = calls[0] if calls else {}
+    if reason := call.get("revertReason"):
+        return f"execution reverted: {reason}"
+
+    if error := call.get("error"):
+        return error
+
+    error = changes.get("error")
+    return (error.get("message") if isinstance(error, dict) else error) or None
+
+
+def get_simulation_params(txn: dict[str, Any]) -> dict[str, Any]:
+    """
+    The transaction fields the simulation methods accept, as RPC values.
+    """
+    return {
+        field: hex(value) if isinstance(value, int) else value
+        for field in SIMULATION_FIELDS
+        if (value := txn.get(field)) is not None
+    }
@@ -0,0 +1,281 @@
+import json
+import re
+from tempfile import SpooledTemporaryFile
+from threading import Lock
+from typing import IO, Any
+
+import ijson  # type: ignore[import-untyped]
+
+from .exceptions import AlchemyProviderError
+
+# Responses larger than this are spooled to disk rather than kept in memory.
+SPOOL_SIZE = 8 * 1024 * 1024
+
+# Responses smaller than this are checked for JSON-RPC errors up-front.
+_ERROR_CHECK_SIZE = 64 * 1024
+
+# Frames are located by scanning the response this many bytes at a time.
+_SCAN_SIZE = 64 * 1024
+
+# The characters that delimit JSON strings and containers.
+_DELIMITERS = re.compile(rb'[\\"{}\[\]]')
+
+
+def new_spool() -> IO[bytes]:
+    """
+    A temporary file that moves from memory to disk past ``SPOOL_SIZE`` bytes.
+    """
+    return SpooledTemporaryFile(max_size=SPOOL_SIZE)  # type: ignore[return-value]
+
+
+def check_response(file: IO[bytes]) -> dict | None:
+    """
+    Get the JSON-RPC error of a spooled response, if it has one.
+    Only small responses are checked; error responses are never large.
+    """
+    file.seek(0, 2)
+    size = file.tell()
+    file.seek(0)
+    if size > _ERROR_CHECK_SIZE:
+        return None
+
+    response = json.loads(file.read())
+    file.seek(0)
+    if not isinstance(response, dict):
+        return None
+
+    if "error" in response:
+        return response["error"]
+
+    if response.get("result") is None:
+        return {"message": "Trace result is empty."}
+
+    return None
+
+
+class _SpanReader:
+    """
+    Reads the bytes of a file between two offsets, as if they were the whole file.
+    """
+
+    def __init__(self, file: IO[bytes], span: tuple[int, int]):
+        self.file = file
+        self.file.seek(span[0])
+        self.remaining = span[1] - span[0]
+
+    def read(self, size: int = -1) -> bytes:
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+
+        data = self.file.read(size)
+        self.remaining -= len(data)
+        return data
+
+
+class _TraceFile:
+    """
+    A spooled ``callTracer`` response, shared by the frames parsed from it.
+    Each frame is located by its byte span, so parsing a frame only reads the
+    bytes of that frame.
+    """
+
+    def __init__(self, file: IO[bytes]):
+        self.file = file
+        self.lock = Lock()
+
+    def find_result(self) -> tuple[int, int]:
+        """
+        The byte span of the top-level frame.
+        """
+        with self.lock:
+            self.file.seek(0, 2)
+            spans = self._find_values((0, self.file.tell()), b"result")
+
+        if not spans:
+            raise AlchemyProviderError("Call frame [] not found in trace.")
+
+        return spans[0]
+
+    def find_calls(self, span: tuple[int, int]) -> list[tuple[int, int]]:
+        """
+        The byte spans of the sub-calls of the frame in the given span.
+        """
+        with self.lock:
+            return self._find_values(span, b"calls")
+
+    def build(self, span: tuple[int, int], include_calls: bool) -> dict:
+        """
+        Parse the frame in the given span.
+        """
+        builder = ijson.ObjectBuilder()
+        with self.lock:
+            for prefix, event, value in ijson.parse(_SpanReader(self.file, span)):
+                if not include_calls and (
+                    prefix == "calls"
+                    or prefix.startswith("calls.")
+                    or (prefix == "" and event == "map_key" and value == "calls")
+                ):
+                    continue
+
+                builder.event(event, value)
+
+        return builder.value
+
+    def _find_values(self, span: tuple[int, int], key: bytes) -> list[tuple[int, int]]:
+        # Find the span of the object value of a key of the object in the given span,
+        # or the spans of its items if the value is an array, by scanning only for
+        # the characters that delimit strings and containers.
+        spans: list[tuple[int, int]] = []
+        depth = 0
+        in_string = False
+        # The offset of the character escaped by the last backslash.
+        escaped = -1
+        string_start = 0
+        is_key = False
+        # The depth at which wanted objects open, once the key's value is found.
+        item_depth = 0
+        item_start = 0
+        position, end = span
+        self.file.seek(position)
+        while position < end:
+            chunk = self.file.read(min(_SCAN_SIZE, end - position))
+            if not chunk:
+                break
+
+            for match in _DELIMITERS.finditer(chunk):
+                offset = position + match.start()
+                char = match.group()
+                if offset == escaped:
+                    continue
+
+                if in_string:
+                    if char == b"\\":
+                        escaped = offset + 1
+                    elif char == b'"':
+                        in_string = False
+                        if depth == 1:
+                            is_key = offset - string_start + 1 == len(key) + 2 and (
+                                self._read(string_start + 1, offset, chunk, position) == key
+                            )
+
+                elif char == b'"':
+                    in_string = True
+                    string_start = offset
+
+                elif char in (b"{", b"["):
+                    depth += 1
+                    if depth == 2 and is_key:
+                        item_depth = 2 if char == b"{" else 3
+
+                    if depth == item_depth and char == b"{":
+                        item_start = offset
+
+                else:
+                    if depth == item_depth and char == b"}":
+                        spans.append((item_start, offset + 1))
+
+                    depth -= 1
+                    if (depth == 1 and item_depth) or depth == 0:
+                        return spans
+
+            position += len(chunk)
+
+        return spans
+
+    def _read(self, start: int, end: int, chunk: bytes, position: int) -> bytes:
+        if start >= position:
+            return chunk[start - position : end - position]
+
+        # NOTE: The bytes straddle the previous chunk.
+        resume = self.file.tell()
+        self.file.seek(start)
+        data = self.file.read(end - start)
+        self.file.seek(resume)
+        return data
+
+
+class CallFrame:
+    """
+    A frame of a ``callTracer`` trace, parsed lazily from a spooled response.
+    A frame's fields and sub-calls are only parsed when first accessed, and its
+    sub-calls are frames themselves, so only the visited parts of a large trace
+    are ever loaded into memory.
+    """
+
+    __slots__ = ("_calls", "_fields", "_source", "_span", "path")
+
+    def __init__(
+        self,
+        source: _TraceFile,
+        path: tuple[int, ...] = (),
+        span: tuple[int, int] | None = None,
+    ):
+        self.path = path
+        self._source = source
+        # NOTE: The top-level frame is not located until it is used.
+        self._span = span
+        self._fields: dict | None = None
+        self._calls: list[CallFrame] | None = None
+
+    def __repr__(self) -> str:
+        return f"<CallFrame {list(self.path)}>"
+
+    def __getitem__(self, key: str) -> Any:
+        return self.fields[key]
+
+    @classmethod
+    def from_file(cls, file: IO[bytes]) -> "CallFrame":
+        """
+        The top-level frame of a spooled ``debug_traceTransaction`` response.
+
+        Args:
+            file (IO[bytes]): The JSON-RPC response.
+
+        Returns:
+            :class:`~ape_alchemy.streaming.CallFrame`
+        """
+        return cls(_TraceFile(file))
+
+    @property
+    def fields(self) -> dict:
+        """
+        The frame's fields, such as ``to``, ``output`` and ``revertReason``,
+        without its sub-calls.
+        """
+        if self._fields is None:
+            self._load()
+
+        return self._fields  # type: ignore[return-value]
+
+    @property
+    def calls(self) -> list["CallFrame"]:
+        """
+        The frame's sub-calls, which are not parsed until used.
+        """
+        if self._calls is None:
+            self._load()
+
+        return self._calls  # type: ignore[return-value]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.fields.get(key, default)
+
+    def to_dict(self) -> dict:
+        """
+        Parse the frame and all of its sub-calls. The result is not kept.
+        """
+        return self._source.build(self._get_span(), include_calls=True)
+
+    def _get_span(self) -> tuple[int, int]:
+        if self._span is None:
+            self._span = self._source.find_result()
+
+        return self._span
+
+    def _load(self):
+        span = self._get_span()
+        self._fields = self._source.build(span, include_calls=False)
+        self._calls = [
+            CallFrame(self._source, (*self.path, index), call_span)
+            for index, call_span in enumerate(self._source.find_calls(span))
+        ]
@@ -1,13 +1,170 @@
+from collections.abc import Callable
 from functools import cached_property
+from pathlib import Path
 from typing import Any
 
+from ape.exceptions import ProviderError, TransactionNotFoundError
 from ape_ethereum.trace import TraceApproach, TransactionTrace
+from evm_trace import (
+    CallTreeNode,
+    ParityTraceList,
+    get_calltree_from_geth_call_trace,
+    get_calltree_from_parity_trace,
+)
 from hexbytes import HexBytes
 
+from .serialization import dumps, loads
+from .streaming import CallFrame
+
+# The fetched RPC results a serialized trace may include, by `from_raw` argument.
+_RAW_RESULTS = {
+    "parity_trace": "_parity_trace",
+    "top_level_call": "_top_level_call",
+    "call_trace": "_call_trace",
+    "prestate": "prestate",
+}
+
+
+def get_call_tracer(timeout: str) -> dict:
+    """
+    The ``debug_traceTransaction`` parameters for tracing the full call tree.
+    """
+    return {"tracer": "callTracer", "timeout": timeout}
+
+
+def get_prestate_tracer(timeout: str) -> dict:
+    """
+    The ``debug_traceTransaction`` parameters for tracing the accessed state.
+    """
+    return {"tracer": "prestateTracer", "timeout": timeout}
+
+
+def get_top_level_call_tracer(timeout: str) -> dict:
+    """
+    The ``debug_traceTransaction`` parameters for tracing only the top-level call.
+    """
+    return {
+        "tracer": "callTracer",
+        "timeout": timeout,
+        "tracerConfig": {
+            "onlyTopLevelCall": True,
+        },
+    }
+
 
 class AlchemyTransactionTrace(TransactionTrace):
     call_trace_approach: TraceApproach = TraceApproach.PARITY
 
+    @classmethod
+    def from_raw(
+        cls,
+        transaction_hash: str,
+        parity_trace: list | None = None,
+        top_level_call: dict | None = None,
+        call_trace: dict | None = None,
+        prestate: dict | None = None,
+        **kwargs,
+    ) -> "AlchemyTransactionTrace":
+        """
+        Create a trace using RPC results that were already fetched,
+        so they are not requested again.
+
+        Args:
+            transaction_hash (str): The transaction hash.
+            parity_trace (list | None): The result of ``trace_transaction``.
+            top_level_call (dict | None): The result of ``debug_traceTransaction``
+              using the ``callTracer`` with ``onlyTopLevelCall``.
+            call_trace (dict | None): The result of ``debug_traceTransaction``
+              using the ``callTracer``.
+            prestate (dict | None): The result of ``debug_traceTransaction``
+              using the ``prestateTracer``.
+            **kwargs: Additional trace kwargs.
+
+        Returns:
+            :class:`~ape_alchemy.trace.AlchemyTransactionTrace`
+        """
+        trace = cls(transaction_hash=transaction_hash, **kwargs)
+
+        # NOTE: Set the cached-properties directly.
+        if parity_trace is not None:
+            trace.__dict__["_parity_trace"] = parity_trace
+        if top_level_call is not None:
+            trace.__dict__["_top_level_call"] = top_level_call
+        if call_trace is not None:
+            trace.__dict__["_call_trace"] = call_trace
+        if prestate is not None:
+            trace.__dict__["prestate"] = prestate
+
+        return trace
+
+    @classmethod
+    def loads(cls, data: bytes) -> "AlchemyTransactionTrace":
+        """
+        Create a trace from the output of
+        :meth:`~ape_alchemy.trace.AlchemyTransactionTrace.dump`,
+        without making any requests for the results it includes.
+
+        Args:
+            data (bytes): The serialized trace.
+
+        Returns:
+            :class:`~ape_alchemy.trace.AlchemyTransactionTrace`
+        """
+        raw = loads(data)
+        raw["call_trace_approach"] = TraceApproach(raw["call_trace_approach"])
+        return cls.from_raw(**raw)
+
+    @classmethod
+    def load(cls, path: Path | str) -> "AlchemyTransactionTrace":
+        """
+        Load a trace saved using
+        :meth:`~ape_alchemy.trace.AlchemyTransactionTrace.save`.
+
+        Args:
+            path (Path | str): The file path.
+
+        Returns:
+            :class:`~ape_alchemy.trace.AlchemyTransactionTrace`
+        """
+        return cls.loads(Path(path).read_bytes())
+
+    def dump(self) -> bytes:
+        """
+        Serialize the trace, including the RPC results fetched so far, in a
+        compact binary format. The results the trace's approach needs are
+        fetched first, if they have not been.
+
+        Returns:
+            bytes
+        """
+        if self.call_trace_approach is TraceApproach.PARITY:
+            _ = self._parity_trace
+        elif self.call_trace_approach is TraceApproach.GETH_CALL_TRACER:
+            _ = self._call_trace
+
+        raw: dict[str, Any] = {
+            "transaction_hash": self.transaction_hash,
+            "call_trace_approach": self.call_trace_approach.value,
+            "debug_trace_transaction_parameters": self.debug_trace_transaction_parameters,
+        }
+        for arg, attr in _RAW_RESULTS.items():
+            if attr in self.__dict__:
+                raw[arg] = self.__dict__[attr]
+
+        return dumps(raw)
+
+    def save(self, path: Path | str):
+        """
+        Save the trace to a file, to load later using
+        :meth:`~ape_alchemy.trace.AlchemyTransactionTrace.load`.
+
+        Args:
+            path (Path | str): The file path.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(self.dump())
+
     @cached_property
     def return_value(self) -> Any:
         node = self._top_level_call
@@ -26,18 +183,101 @@ class AlchemyTransactionTrace(TransactionTrace):
         node = self._top_level_call
         return node.get("revertReason")
 
+    @cached_property
+    def prestate(self) -> dict:
+        """
+        The state the transaction accessed, as it was before the transaction,
+        from the ``prestateTracer``.
+        """
+        if self._combine_traces and not self._stream_traces:
+            return self._combined_traces[1]
+
+        return self.provider._get_prestate_trace(self.transaction_hash)
+
+    @cached_property
+    def call_frame(self) -> CallFrame:
+        """
+        The top-level frame of the ``callTracer`` trace. The trace is streamed into
+        a temporary file and each frame is parsed only when used, so large traces
+        can be explored without loading them into memory.
+        """
+        file = self.provider._spool_request(
+            "debug_traceTransaction",
+            [self.transaction_hash, self._get_tracer_parameters(get_call_tracer)],
+        )
+        return CallFrame.from_file(file)
+
+    @property
+    def _combine_traces(self) -> bool:
+        return self.provider.config.combine_traces
+
+    @property
+    def _stream_traces(self) -> bool:
+        return self.provider.config.stream_traces
+
+    @cached_property
+    def _combined_traces(self) -> tuple[dict, dict]:
+        # NOTE: Sets the full call trace and prestate, fetched in one batch request.
+        timeout = self.provider.config.trace_timeout
+        with self.provider.batch_requests() as batch:
+            call_trace = batch.add(
+                "debug_traceTransaction",
+                [self.transaction_hash, self._get_tracer_parameters(get_call_tracer)],
+            )
+            prestate = batch.add(
+                "debug_traceTransaction", [self.transaction_hash, get_prestate_tracer(timeout)]
+            )
+
+        return call_trace.result(), prestate.result()
+
+    @cached_property
+    def _call_trace(self) -> dict:
+        if self._stream_traces:
+            return self.call_frame.to_dict()
+
+        if self._combine_traces:
+            return self._combined_traces[0]
+
+        return self.provider.make_request(
+            "debug_traceTransaction",
+            [self.transaction_hash, self._get_tracer_parameters(get_call_tracer)],
+        )
+
     @cached_property
     def _top_level_call(self) -> dict:
+        if self._stream_traces and (self._combine_traces or "call_frame" in self.__dict__):
+            # NOTE: Only parses the top-level frame.
+            return self.call_frame.fields
+
+        if self._combine_traces or "_call_trace" in self.__dict__:
+            # NOTE: The full call trace includes the top-level call.
+            return {k: v for k, v in self._call_trace.items() if k != "calls"}
+
         return self.provider.make_request(
             "debug_traceTransaction",
-            [
-                self.transaction_hash,
-                {
-                    "tracer": "callTracer",
-                    "timeout": self.provider.config.trace_timeout,
-                    "tracerConfig": {
-                        "onlyTopLevelCall": True,
-                    },
-                },
-            ],
+            [self.transaction_hash, self._get_tracer_parameters(get_top_level_call_tracer)],
         )
+
+    @cached_property
+    def _parity_trace(self) -> list:
+        try:
+            return self.provider.make_request("trace_transaction", [self.transaction_hash])
+        except ProviderError as err:
+            if "transaction not found" in str(err).lower():
+                raise TransactionNotFoundError(transaction_hash=self.transaction_hash) from err
+
+            raise  # The ProviderError as-is
+
+    def _get_tracer_parameters(self, get_tracer: Callable[[str], dict]) -> dict:
+        # NOTE: Same as the base trace, the user's parameters are kept, though not their tracer.
+        return {
+            **self.debug_trace_transaction_parameters,
+            **get_tracer(self.provider.config.trace_timeout),
+        }
+
+    def _debug_trace_transaction_call_tracer(self) -> CallTreeNode:
+        return get_calltree_from_geth_call_trace(self._call_trace)
+
+    def _trace_transaction(self) -> CallTreeNode:
+        parity_objects = ParityTraceList.model_validate(self._parity_trace)
+        return get_calltree_from_parity_trace(parity_objects)
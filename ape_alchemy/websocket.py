@@ -0,0 +1,483 @@
+import asyncio
+import itertools
+import json
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import (
+    Future,
+    TimeoutError as FutureTimeoutError,
+)
+from contextlib import suppress
+from threading import Condition, Lock, Thread
+from typing import TYPE_CHECKING, Any
+
+from ape.logging import logger
+from web3._utils.encoding import Web3JsonEncoder
+from web3.providers.base import JSONBaseProvider
+from web3.types import RPCEndpoint, RPCResponse
+from websockets.exceptions import WebSocketException
+from websockets.sync.client import ClientConnection, connect
+
+from .config import READ_METHODS
+from .exceptions import AlchemyProviderError, AlchemyRateLimitError
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+# Returned from a subscription's queue once it is closed and empty.
+_CLOSED = object()
+# Requests sent again after reconnecting, as sending them twice changes nothing.
+# Others, such as sending transactions, fail instead, as the server may have received them.
+_REPLAYABLE_METHODS = frozenset((*READ_METHODS, "eth_subscribe", "eth_unsubscribe"))
+_REPLAYABLE_PREFIXES = ("eth_get", "debug_trace", "trace_", "alchemy_get", "alchemy_simulate")
+
+
+class Subscription:
+    """
+    The notifications of an ``eth_subscribe`` subscription, as an iterator or
+    an async iterator. When the consumer falls behind, at most ``max_queue``
+    notifications are held, after which the oldest are dropped and counted in
+    ``dropped``. This never stops the connection from reading, so one slow
+    consumer does not hold up the other subscriptions sharing its connection.
+    Subscriptions are renewed after reconnecting, though notifications sent
+    while disconnected are missed.
+
+    .. code-block:: python
+
+        with provider.subscribe_new_heads() as heads:
+            for head in heads:
+                print(int(head["number"], 16))
+    """
+
+    def __init__(self, client: "WebSocketClient", parameters: list, max_queue: int = 1_000):
+        self.client = client
+        self.parameters = parameters
+        self.max_queue = max(max_queue, 1)
+        self.id: str | None = None
+        # The number of notifications dropped because the consumer fell behind.
+        self.dropped = 0
+        self._condition = Condition()
+        self._notifications: deque = deque()
+        self._closed = False
+        self._error: Exception | None = None
+
+    def __enter__(self) -> "Self":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __iter__(self) -> "Self":
+        return self
+
+    def __next__(self) -> Any:
+        if (notification := self._get()) is _CLOSED:
+            raise StopIteration
+
+        return notification
+
+    def __aiter__(self) -> "Self":
+        return self
+
+    async def __anext__(self) -> Any:
+        if (notification := await asyncio.to_thread(self._get)) is _CLOSED:
+            raise StopAsyncIteration
+
+        return notification
+
+    @property
+    def is_closed(self) -> bool:
+        return self._closed
+
+    def get(self, timeout: float | None = None) -> Any:
+        """
+        Wait for the next notification.
+
+        Args:
+            timeout (float | None): The number of seconds to wait.
+              Defaults to waiting forever.
+
+        Raises:
+            TimeoutError: When no notification arrives in time.
+
+        Returns:
+            Any: The notification's result.
+        """
+        if (notification := self._get(timeout)) is _CLOSED:
+            raise AlchemyProviderError("Subscription closed.")
+
+        return notification
+
+    def close(self):
+        """
+        Unsubscribe. Notifications already received can still be iterated.
+        """
+        self.client.unsubscribe(self)
+
+    def _get(self, timeout: float | None = None) -> Any:
+        with self._condition:
+            if not self._condition.wait_for(
+                lambda: self._notifications or self._closed, timeout=timeout
+            ):
+                raise TimeoutError("Timed out waiting for a subscription notification.")
+
+            if self._notifications:
+                return self._notifications.popleft()
+
+            if self._error is not None:
+                raise self._error
+
+            return _CLOSED
+
+    def _put(self, notification: Any):
+        with self._condition:
+            if self._closed:
+                return
+
+            # NOTE: Never block, as that would block the reader for every subscription.
+            if len(self._notifications) >= self.max_queue:
+                self._notifications.popleft()
+                if not self.dropped:
+                    logger.warning(
+                        f"Subscription '{self.id}' fell behind. Dropping its oldest notifications."
+                    )
+
+                self.dropped += 1
+
+            self._notifications.append(notification)
+            self._condition.notify_all()
+
+    def _finish(self, error: Exception | None = None):
+        with self._condition:
+            self._closed = True
+            self._error = error
+            self._condition.notify_all()
+
+
+class WebSocketClient:
+    """
+    A thread-safe JSON-RPC client over a single, persistent WebSocket connection.
+    Requests are pipelined and matched to responses by ID. When the connection
+    drops, the client reconnects, re-sends the read requests still awaiting a
+    response, and renews its subscriptions. Other requests still awaiting a
+    response, such as sent transactions, fail, as they may have been received.
+    """
+
+    def __init__(
+        self,
+        uri: str,
+        request_timeout: float = 30,
+        max_reconnect_attempts: int = 5,
+        reconnect_delay: float = 1,
+        connector: Callable[..., ClientConnection] = connect,
+    ):
+        self.uri = uri
+        self.request_timeout = request_timeout
+        self.max_reconnect_attempts = max_reconnect_attempts
+        self.reconnect_delay = reconnect_delay
+        self._connector = connector
+        self._connection: ClientConnection | None = None
+        self._closed = False
+        self._ids = itertools.count(1)
+        self._lock = Lock()
+        # request ID -> (method, payload, future, subscription being created)
+        self._pending: dict[int, tuple[str, str, Future, Subscription | None]] = {}
+        # subscription ID -> subscription
+        self._subscriptions: dict[str, Subscription] = {}
+
+    @property
+    def is_connected(self) -> bool:
+        return self._connection is not None
+
+    def connect(self):
+        with self._lock:
+            self._closed = False
+            if self._connection is None:
+                self._open()
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            connection, self._connection = self._connection, None
+
+        if connection is not None:
+            connection.close()
+
+        self._fail_pending(AlchemyProviderError("WebSocket connection closed."))
+
+    def request(self, rpc: str, parameters: Any) -> dict:
+        """
+        Send a request and wait for its response.
+
+        Args:
+            rpc (str): The RPC method.
+            parameters (Any): The RPC parameters.
+
+        Returns:
+            dict: The JSON-RPC response.
+        """
+        return self.wait(self.send(rpc, parameters))
+
+    def send(self, rpc: str, parameters: Any, subscription: Subscription | None = None) -> Future:
+        """
+        Send a request without waiting for its response.
+
+        Args:
+            rpc (str): The RPC method.
+            parameters (Any): The RPC parameters.
+            subscription (:class:`~ape_alchemy.websocket.Subscription` | None): The
+              subscription an ``eth_subscribe`` request creates.
+
+        Returns:
+            ``concurrent.futures.Future``: The JSON-RPC response.
+        """
+        with self._lock:
+            if self._closed:
+                raise AlchemyProviderError("WebSocket connection closed.")
+
+            if self._connection is None:
+                self._open()
+
+            payload, future = self._add_pending(rpc, parameters, subscription)
+            connection = self._connection
+
+        # NOTE: On failure, the reader reconnects and re-sends this request,
+        #   unless it is not safe to send twice, which fails it instead.
+        with suppress(OSError, WebSocketException):
+            connection.send(payload)  # type: ignore[union-attr]
+
+        return future
+
+    def wait(self, future: Future) -> dict:
+        try:
+            return future.result(timeout=self.request_timeout)
+        except FutureTimeoutError as err:
+            with self._lock:
+                self._pending.pop(future.request_id, None)  # type: ignore[attr-defined]
+
+            raise AlchemyProviderError(
+                f"Timed out after {self.request_timeout}s waiting for a WebSocket response."
+            ) from err
+
+    def subscribe(self, parameters: list, max_queue: int = 1_000) -> Subscription:
+        """
+        Create a subscription using ``eth_subscribe``.
+
+        Args:
+            parameters (list): The ``eth_subscribe`` parameters, such as ``["newHeads"]``.
+            max_queue (int): The number of notifications to hold for a slow consumer,
+              after which the oldest are dropped.
+
+        Returns:
+            :class:`~ape_alchemy.websocket.Subscription`
+        """
+        subscription = Subscription(self, parameters, max_queue=max_queue)
+        response = self.wait(self.send("eth_subscribe", parameters, subscription=subscription))
+        if "error" in response:
+            raise AlchemyProviderError(_get_error_message(response))
+
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        # NOTE: Finish first so a reader blocked on the subscription is released.
+        subscription._finish()
+        with self._lock:
+            subscription_id = subscription.id
+            if self._subscriptions.get(subscription_id) is not subscription:  # type: ignore[arg-type]
+                return
+
+            del self._subscriptions[subscription_id]  # type: ignore[arg-type]
+
+        with suppress(AlchemyProviderError):
+            self.request("eth_unsubscribe", [subscription_id])
+
+    def _add_pending(
+        self, rpc: str, parameters: Any, subscription: Subscription | None = None
+    ) -> tuple[str, Future]:
+        # NOTE: Only call while holding the lock.
+        request_id = next(self._ids)
+        payload = json.dumps(
+            {"jsonrpc": "2.0", "id": request_id, "method": rpc, "params": parameters},
+            cls=Web3JsonEncoder,
+        )
+        future: Future = Future()
+        future.request_id = request_id  # type: ignore[attr-defined]
+        self._pending[request_id] = (rpc, payload, future, subscription)
+        return payload, future
+
+    def _open(self):
+        # NOTE: Only call while holding the lock.
+        try:
+            connection = self._connector(self.uri, open_timeout=self.request_timeout, max_size=None)
+        except (OSError, WebSocketException) as err:
+            raise AlchemyProviderError(f"Unable to connect to '{self.uri}': {err}") from err
+
+        self._connection = connection
+        Thread(target=self._read, args=(connection,), daemon=True, name="ape-alchemy-ws").start()
+
+    def _read(self, connection: ClientConnection):
+        while True:
+            try:
+                message = connection.recv()
+            except (OSError, WebSocketException):
+                self._reconnect(connection)
+                return
+
+            try:
+                data = json.loads(message)
+            except ValueError:
+                logger.debug(f"Ignoring invalid WebSocket message: {message!r}")
+                continue
+
+            for response in data if isinstance(data, list) else [data]:
+                self._handle(response)
+
+    def _handle(self, response: dict):
+        if response.get("method") == "eth_subscription":
+            params = response.get("params", {})
+            with self._lock:
+                subscription = self._subscriptions.get(params.get("subscription"))
+
+            if subscription is not None:
+                subscription._put(params.get("result"))
+
+            return
+
+        with self._lock:
+            if (pending := self._pending.pop(response.get("id"), None)) is None:  # type: ignore[arg-type]
+                return
+
+            _, _, future, subscription = pending
+            if subscription is not None and "result" in response:
+                # NOTE: Registered here, before the reader handles any notifications.
+                subscription.id = response["result"]
+                self._subscriptions[response["result"]] = subscription
+
+        if subscription is not None and "error" in response:
+            subscription._finish(AlchemyProviderError(_get_error_message(response)))
+
+        future.set_result(response)
+
+    def _reconnect(self, dropped: ClientConnection):
+        for attempt in range(self.max_reconnect_attempts):
+            with self._lock:
+                if self._closed or self._connection is not dropped:
+                    # Closed, or already replaced.
+                    return
+
+                try:
+                    self._open()
+                except AlchemyProviderError as err:
+                    logger.debug(f"WebSocket reconnect attempt {attempt + 1} failed: {err}")
+                else:
+                    unsafe = self._replay()
+                    break
+
+            time.sleep(self.reconnect_delay * 2**attempt)
+
+        else:
+            with self._lock:
+                if self._connection is dropped:
+                    # NOTE: The next request tries connecting again.
+                    self._connection = None
+
+            self._fail_pending(
+                AlchemyProviderError(
+                    f"Lost WebSocket connection after {self.max_reconnect_attempts} "
+                    "reconnect attempts."
+                )
+            )
+            return
+
+        for rpc, _, future, _ in unsafe:
+            # NOTE: The caller decides whether to send it again.
+            future.set_exception(
+                AlchemyProviderError(
+                    f"WebSocket connection dropped waiting for '{rpc}', "
+                    "which may have been received."
+                )
+            )
+
+    def _replay(self) -> list[tuple[str, str, Future, Subscription | None]]:
+        """
+        Renew the subscriptions and re-send the pending requests that are safe to
+        send twice over the new connection. Returns the other pending requests.
+        """
+        # NOTE: Only call while holding the lock.
+        subscriptions = list(self._subscriptions.values())
+        self._subscriptions.clear()
+        for subscription in subscriptions:
+            self._add_pending("eth_subscribe", subscription.parameters, subscription)
+
+        unsafe = [
+            self._pending.pop(request_id)
+            for request_id, (rpc, _, _, _) in list(self._pending.items())
+            if not _is_replayable(rpc)
+        ]
+        # NOTE: On failure, the new connection's reader reconnects again.
+        with suppress(OSError, WebSocketException):
+            for _, payload, _, _ in self._pending.values():
+                self._connection.send(payload)  # type: ignore[union-attr]
+
+        return unsafe
+
+    def _fail_pending(self, error: AlchemyProviderError):
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            subscriptions = [
+                *self._subscriptions.values(),
+                *(s for _, _, _, s in pending.values() if s is not None),
+            ]
+            self._subscriptions = {}
+
+        for _, _, future, _ in pending.values():
+            if not future.done():
+                future.set_exception(error)
+
+        for subscription in subscriptions:
+            # NOTE: Closing the client ends subscriptions without an error.
+            subscription._finish(None if self._closed else error)
+
+
+def _is_replayable(rpc: str) -> bool:
+    return rpc in _REPLAYABLE_METHODS or rpc.startswith(_REPLAYABLE_PREFIXES)
+
+
+def _get_error_message(response: dict) -> str:
+    error = response.get("error")
+    return error.get("message", str(error)) if isinstance(error, dict) else str(error)
+
+
+class AlchemyWebSocketProvider(JSONBaseProvider):
+    """
+    A web3 provider making requests over a
+    :class:`~ape_alchemy.websocket.WebSocketClient`.
+    """
+
+    def __init__(self, client: WebSocketClient):
+        super().__init__()
+        self.client = client
+
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        return self._check_response(self.client.request(method, params))
+
+    def make_batch_request(self, requests: list[tuple[RPCEndpoint, Any]]) -> list[RPCResponse]:
+        # NOTE: Requests are pipelined over the connection rather than sent as one message.
+        futures = [self.client.send(method, params) for method, params in requests]
+        return [self.client.wait(future) for future in futures]  # type: ignore[misc]
+
+    def is_connected(self, show_traceback: bool = False) -> bool:
+        if not self.client.is_connected and show_traceback:
+            raise AlchemyProviderError(f"Not connected to '{self.client.uri}'.")
+
+        return self.client.is_connected
+
+    @staticmethod
+    def _check_response(response: dict) -> RPCResponse:
+        # NOTE: Over HTTP, rate-limited requests fail with status 429 and get retried.
+        error = response.get("error")
+        if isinstance(error, dict) and error.get("code") == 429:
+            raise AlchemyRateLimitError(error.get("message", "Rate limited."))
+
+        return response  # type: ignore[return-value]
@@ -1,13 +1,14 @@
 import os
-from typing import TYPE_CHECKING
 
 import ape
 import pytest
 from requests import HTTPError, Response
 from web3 import Web3
 
-if TYPE_CHECKING:
-    from ape_alchemy.provider import Alchemy
+from ape_alchemy.config import AlchemyConfig
+from ape_alchemy.provider import Alchemy
+
+from .mock_alchemy import MockAlchemy
 
 FEATURE_NOT_AVAILABLE_BECAUSE_OF_TIER_RESPONSE = (
     "trace_transaction is not available on the Free tier - "
@@ -56,6 +57,47 @@ def token(mocker):
     return mock
 
 
+@pytest.fixture
+def mock_alchemy():
+    with MockAlchemy() as server:
+        yield server
+
+
+@pytest.fixture
+def config():
+    """
+    The config of the ``provider`` fixture. Override it in a module, or
+    parametrize it, e.g. ``@pytest.mark.parametrize("config", [AlchemyConfig(...)])``.
+    """
+    return AlchemyConfig(connect={"metadata_ttl": 0})
+
+
+@pytest.fixture
+def uris(mock_alchemy):
+    """
+    The URIs of the ``provider`` fixture's API keys. Requests go to the first by default.
+    """
+    return [mock_alchemy.uri]
+
+
+@pytest.fixture
+def provider(mocker, tmp_path, networks, mock_alchemy, config, uris):
+    """
+    An Alchemy provider connected to the ``mock_alchemy`` server, using the ``config`` fixture.
+    """
+    provider = networks.ethereum.sepolia.get_provider("alchemy")
+    mocker.patch.object(Alchemy, "config", new_callable=mocker.PropertyMock, return_value=config)
+    mocker.patch.object(
+        Alchemy, "data_folder", new_callable=mocker.PropertyMock, return_value=tmp_path
+    )
+    mocker.patch.object(Alchemy, "uris", new_callable=mocker.PropertyMock, return_value=uris)
+    mocker.patch.object(Alchemy, "uri", new_callable=mocker.PropertyMock, return_value=uris[0])
+    provider.connect()
+    mock_alchemy.reset()
+    yield provider
+    provider.disconnect()
+
+
 @pytest.fixture
 def mock_web3(mocker):
     mock = mocker.MagicMock(spec=Web3)
@@ -92,5 +134,69 @@ def feature_not_available_http_error(mocker, request):
 
 
 @pytest.fixture
-def alchemy_provider(networks) -> "Alchemy":
+def alchemy_provider(networks) -> Alchemy:
     return networks.ethereum.sepolia.get_provider("alchemy")
+
+
+@pytest.fixture
+def raw_receipt(txn_hash):
+    return {
+        "blockHash": "0x141a61b8c738c0f1508728116049a0d4a6ff41ee1180d956148880f32ae99215",
+        "blockNumber": "0x10",
+        "contractAddress": None,
+        "cumulativeGasUsed": "0x5208",
+        "effectiveGasPrice": "0x3b9aca00",
+        "from": "0x958f973513f723f2cb9b47abe5e903695ab93e36",
+        "gasUsed": "0x5208",
+        "logs": [],
+        "logsBloom": "0x" + "00" * 256,
+        "status": "0x1",
+        "to": "0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48",
+        "transactionHash": txn_hash,
+        "transactionIndex": "0x0",
+        "type": "0x2",
+    }
+
+
+@pytest.fixture
+def raw_transaction(txn_hash):
+    return {
+        "blockHash": "0x141a61b8c738c0f1508728116049a0d4a6ff41ee1180d956148880f32ae99215",
+        "blockNumber": "0x10",
+        "chainId": "0xaa36a7",
+        "from": "0x958f973513f723f2cb9b47abe5e903695ab93e36",
+        "gas": "0x5208",
+        "gasPrice": "0x3b9aca00",
+        "hash": txn_hash,
+        "input": "0x",
+        "maxFeePerGas": "0x3b9aca00",
+        "maxPriorityFeePerGas": "0x0",
+        "nonce": "0x1",
+        "to": "0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48",
+        "transactionIndex": "0x0",
+        "type": "0x2",
+        "value": "0x0",
+        "accessList": [],
+        "v": "0x0",
+        "r": "0x1",
+        "s": "0x1",
+    }
+
+
+@pytest.fixture
+def mock_rpc(mocker, mock_web3):
+    """
+    Route mocked RPC requests by method, e.g. ``mock_rpc["eth_chainId"] = "0xaa36a7"``.
+    """
+    responses: dict = {"eth_chainId": "0xaa36a7"}
+
+    def make_request(rpc, params):
+        response = responses[rpc]
+        return {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "result": response(params) if callable(response) else response,
+        }
+
+    mock_web3.provider.make_request.side_effect = make_request
+    return responses
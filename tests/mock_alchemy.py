@@ -0,0 +1,304 @@
+"""
+A local JSON-RPC server imitating Alchemy, for offline tests and benchmarks.
+"""
+
+import json
+import time
+from collections import Counter
+from collections.abc import Callable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+CHAIN_ID = 11155111
+RATE_LIMIT_ERROR = {
+    "code": 429,
+    "message": "Your app has exceeded its compute units per second capacity.",
+}
+METHOD_NOT_FOUND_ERROR = {"code": -32601, "message": "Method not found"}
+
+
+class RpcError(Exception):
+    """
+    Raise from a result function to respond with a JSON-RPC error.
+    """
+
+    def __init__(self, message: str, code: int = -32000, data: str | None = None):
+        super().__init__(message)
+        self.error = {"code": code, "message": message}
+        if data is not None:
+            self.error["data"] = data
+
+
+def make_block(number: int) -> dict:
+    return {
+        "number": hex(number),
+        "hash": f"0x{number:064x}",
+        "parentHash": f"0x{max(number - 1, 0):064x}",
+        "timestamp": hex(1_700_000_000 + 12 * number),
+        "gasLimit": "0x1c9c380",
+        "gasUsed": "0x0",
+        "baseFeePerGas": "0x7",
+        "extraData": "0x",
+        "miner": "0x" + "00" * 20,
+        "difficulty": "0x0",
+        "totalDifficulty": "0x0",
+        "size": "0x220",
+        "nonce": "0x0000000000000000",
+        "stateRoot": "0x" + "00" * 32,
+        "receiptsRoot": "0x" + "00" * 32,
+        "transactionsRoot": "0x" + "00" * 32,
+        "sha3Uncles": "0x" + "00" * 32,
+        "logsBloom": "0x" + "00" * 256,
+        "mixHash": "0x" + "00" * 32,
+        "transactions": [],
+        "uncles": [],
+    }
+
+
+class MockChain:
+    """
+    Blocks and mined transactions on a mock server, mined when the test says so.
+    """
+
+    def __init__(self, server: "MockAlchemy", raw_receipt: dict, raw_transaction: dict):
+        self.head = 0x100
+        self.blocks: dict[int, list[str]] = {}
+        self.mined: dict[str, int] = {}
+        self.raw_receipt = raw_receipt
+        self.raw_transaction = raw_transaction
+        server.results["eth_blockNumber"] = lambda _: hex(self.head)
+        server.results["eth_getBlockByNumber"] = self.get_block
+        server.results["eth_getTransactionReceipt"] = self.get_receipt
+        server.results["eth_getTransactionByHash"] = lambda params: {
+            **raw_transaction,
+            "hash": params[0],
+        }
+
+    def get_block(self, params: list) -> dict:
+        number = int(params[0], 16)
+        return {**make_block(number), "transactions": self.blocks.get(number, [])}
+
+    def get_receipt(self, params: list) -> dict | None:
+        if (block_number := self.mined.get(params[0])) is None:
+            return None
+
+        return {**self.raw_receipt, "transactionHash": params[0], "blockNumber": hex(block_number)}
+
+    def mine(self, *txn_hashes: str):
+        self.head += 1
+        self.blocks[self.head] = list(txn_hashes)
+        for txn_hash in txn_hashes:
+            self.mined[txn_hash] = self.head
+
+
+def make_call_trace(depth: int, width: int) -> dict:
+    call = {
+        "type": "CALL",
+        "from": "0x5cab1e5286529370880776461c53a0e47d74fb63",
+        "to": "0xc17f2c69ae2e66fd87367e3260412eeff637f70e",
+        "value": "0x0",
+        "gas": "0x17e6f0",
+        "gasUsed": "0x1562f0",
+        "input": "0x96d373e5" + "00" * 64,
+        "output": "0x" + "00" * 32,
+    }
+    if depth > 0:
+        call["calls"] = [make_call_trace(depth - 1, width) for _ in range(width)]
+
+    return call
+
+
+def make_parity_trace(txn_hash: str, num_calls: int) -> list[dict]:
+    return [
+        {
+            "action": {
+                "from": "0x5cab1e5286529370880776461c53a0e47d74fb63",
+                "callType": "call",
+                "gas": "0x17e6f0",
+                "input": "0x96d373e5",
+                "to": "0xc17f2c69ae2e66fd87367e3260412eeff637f70e",
+                "value": "0x0",
+            },
+            "blockHash": "0xa7e0792b07687130af6042d9e295e7a96d83a34f40fe01074348cac5c5dd0699",
+            "blockNumber": 15104985,
+            "result": {"gasUsed": "0x1562f0", "output": "0x"},
+            "subtraces": num_calls - 1 if index == 0 else 0,
+            "traceAddress": [] if index == 0 else [index - 1],
+            "transactionHash": txn_hash,
+            "transactionPosition": 259,
+            "type": "call",
+        }
+        for index in range(num_calls)
+    ]
+
+
+def get_default_results(head: int = 0x100) -> dict[str, Any]:
+    return {
+        "eth_blockNumber": hex(head),
+        "eth_call": "0x" + "00" * 32,
+        "eth_chainId": hex(CHAIN_ID),
+        "eth_gasPrice": "0x3b9aca00",
+        "eth_getBalance": "0x0",
+        "eth_getBlockByNumber": lambda params: make_block(
+            head if params[0] == "latest" else 0 if params[0] == "earliest" else int(params[0], 16)
+        ),
+        "eth_getCode": "0x",
+        "eth_maxPriorityFeePerGas": "0x0",
+        "net_version": str(CHAIN_ID),
+    }
+
+
+class MockAlchemy:
+    """
+    A JSON-RPC server on a local port, imitating Alchemy.
+
+    Args:
+        latency (float): Seconds to wait before each response.
+        rate_limit_every (int): Reject every Nth HTTP request, starting with the first,
+          with a 429. ``0`` never does. Batch requests are answered with a 429 error
+          for each call instead, like Alchemy.
+        drop_every (int): Close the connection of every Nth HTTP request, starting with
+          the first, without responding. ``0`` never does.
+        stall_every (int): Wait ``stall`` more seconds before responding to every Nth
+          HTTP request, starting with the first. ``0`` never does.
+        stall (float): Seconds stalled requests wait.
+
+    Requests are accepted for any API key, given as the last part of the URI path.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        rate_limit_every: int = 0,
+        drop_every: int = 0,
+        stall_every: int = 0,
+        stall: float = 1.0,
+    ):
+        self.latency = latency
+        self.rate_limit_every = rate_limit_every
+        self.drop_every = drop_every
+        self.stall_every = stall_every
+        self.stall = stall
+        # RPC method -> result, or a function of the parameters returning the result.
+        self.results: dict[str, Any | Callable[[list], Any]] = get_default_results()
+        self.calls: Counter[str] = Counter()
+        self.keys: Counter[str] = Counter()
+        # API keys rejected with a 429, as if over their rate limit.
+        self.rate_limited_keys: set[str] = set()
+        self.num_requests = 0
+        self._lock = Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self._server.daemon_threads = True
+        self._server.mock = self  # type: ignore[attr-defined]
+        self._thread: Thread | None = None
+
+    def __enter__(self) -> "Self":
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    @property
+    def uri(self) -> str:
+        return self.get_uri("test")
+
+    def get_uri(self, key: str) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host!s}:{port}/v2/{key}"
+
+    def start(self):
+        self._thread = Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def reset(self):
+        with self._lock:
+            self.calls.clear()
+            self.keys.clear()
+            self.num_requests = 0
+
+    def respond(self, body: bytes, key: str = "test") -> tuple[int, Any]:
+        """
+        The HTTP status and JSON response of a request, or ``None`` for
+        the JSON response to drop the connection.
+        """
+        with self._lock:
+            self.num_requests += 1
+            self.keys[key] += 1
+            number = self.num_requests
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        if self.stall_every and (number - 1) % self.stall_every == 0:
+            time.sleep(self.stall)
+
+        if self.drop_every and (number - 1) % self.drop_every == 0:
+            return 0, None
+
+        payload = json.loads(body)
+        is_rate_limited = key in self.rate_limited_keys or (
+            bool(self.rate_limit_every) and (number - 1) % self.rate_limit_every == 0
+        )
+        if isinstance(payload, list):
+            responses = [self._call(p, is_rate_limited) for p in payload]
+            return 200, responses
+
+        if is_rate_limited:
+            return 429, {"jsonrpc": "2.0", "id": payload.get("id"), "error": RATE_LIMIT_ERROR}
+
+        return 200, self._call(payload, False)
+
+    def _call(self, payload: dict, is_rate_limited: bool) -> dict:
+        rpc = payload["method"]
+        response: dict[str, Any] = {"jsonrpc": "2.0", "id": payload.get("id")}
+        if is_rate_limited:
+            response["error"] = RATE_LIMIT_ERROR
+            return response
+
+        with self._lock:
+            self.calls[rpc] += 1
+
+        if rpc not in self.results:
+            response["error"] = METHOD_NOT_FOUND_ERROR
+            return response
+
+        result = self.results[rpc]
+        try:
+            response["result"] = result(payload.get("params", [])) if callable(result) else result
+        except RpcError as err:
+            response["error"] = err.error
+
+        return response
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive, like Alchemy.
+    # NOTE: Otherwise, writing the headers and body separately adds ~40ms per response.
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        key = self.path.rstrip("/").rsplit("/", 1)[-1]
+        status, response = self.server.mock.respond(body, key)  # type: ignore[attr-defined]
+        if response is None:
+            self.close_connection = True
+            return
+
+        data = json.dumps(response).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args: Any):
+        pass
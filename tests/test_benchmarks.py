@@ -0,0 +1,139 @@
+"""
+Benchmarks against a local server imitating Alchemy, so they need no network access.
+They run once, untimed, with the rest of the tests. To time them, run::
+
+    pytest tests/test_benchmarks.py --benchmark-enable
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from ape_alchemy.config import AlchemyConfig
+
+from .mock_alchemy import make_call_trace, make_parity_trace
+
+TXN_HASH = "0x3cef4aaa52b97b6b61aa32b3afcecb0d14f7862ca80fdc76504c37a9374645c4"
+
+
+@pytest.fixture
+def faults():
+    # NOTE: Injected after connecting.
+    return {}
+
+
+@pytest.fixture
+def config():
+    # NOTE: Retry quickly, so the retry paths are not benchmarking sleeps.
+    return AlchemyConfig(
+        rate_limit={"min_retry_delay": 1, "retry_jitter": 0, "max_retries": 5},
+        connect={"metadata_ttl": 0},
+    )
+
+
+@pytest.fixture(autouse=True)
+def inject_faults(provider, mock_alchemy, faults):
+    provider.stats.reset()
+    for name, value in faults.items():
+        setattr(mock_alchemy, name, value)
+
+
+def test_make_request(benchmark, provider):
+    assert benchmark(provider.make_request, "eth_blockNumber", []) == "0x100"
+
+
+def test_make_request_concurrently(benchmark, provider):
+    def make_requests():
+        with ThreadPoolExecutor(8) as pool:
+            return list(pool.map(lambda _: provider.make_request("eth_chainId", []), range(64)))
+
+    assert benchmark(make_requests) == ["0xaa36a7"] * 64
+
+
+def test_make_batch_request(benchmark, provider, mock_alchemy):
+    calls = [("eth_getBalance", [f"0x{i:040x}", "latest"]) for i in range(100)]
+    assert benchmark(provider.make_batch_request, calls) == ["0x0"] * 100
+    assert mock_alchemy.calls["eth_getBalance"] == mock_alchemy.num_requests * 100
+
+
+def test_get_receipt(benchmark, provider, mock_alchemy, raw_receipt, raw_transaction, txn_hash):
+    mock_alchemy.results["eth_getTransactionReceipt"] = raw_receipt
+    mock_alchemy.results["eth_getTransactionByHash"] = raw_transaction
+    receipt = benchmark(provider.get_receipt, txn_hash)
+    assert receipt.txn_hash == txn_hash
+
+
+def test_connect(benchmark, provider, mock_alchemy):
+    rounds = 0
+
+    def connect():
+        nonlocal rounds
+        rounds += 1
+        provider.disconnect()
+        provider.connect()
+
+    benchmark.pedantic(connect, rounds=10)
+    # The chain ID, and the earliest and latest blocks to check for POA.
+    assert mock_alchemy.num_requests == 3 * rounds
+
+
+@pytest.mark.parametrize("config", [AlchemyConfig()], ids=["metadata-cached"])
+def test_connect_cached_metadata(benchmark, provider, mock_alchemy):
+    def connect():
+        provider.disconnect()
+        provider.connect()
+
+    benchmark(connect)
+    assert mock_alchemy.num_requests == 0
+
+
+@pytest.mark.parametrize(
+    "faults", [{"rate_limit_every": 2}, {"drop_every": 2}], ids=["rate-limited", "dropped"]
+)
+def test_make_request_retried(benchmark, provider):
+    assert benchmark(provider.make_request, "eth_blockNumber", []) == "0x100"
+    assert provider.stats["eth_blockNumber"]["retries"] > 0
+
+
+@pytest.mark.parametrize("faults", [{"rate_limit_every": 2}], ids=["rate-limited"])
+def test_make_batch_request_retried(benchmark, provider):
+    calls = [("eth_getBalance", [f"0x{i:040x}", "latest"]) for i in range(100)]
+    assert benchmark(provider.make_batch_request, calls) == ["0x0"] * 100
+    assert provider.stats["eth_getBalance"]["rate_limited"] > 0
+
+
+@pytest.mark.parametrize(
+    "config",
+    [AlchemyConfig(hedge={"enabled": True, "initial_delay": 0.02, "max_extra_compute_units": 100})],
+    ids=["hedged"],
+)
+@pytest.mark.parametrize("faults", [{"stall_every": 2, "stall": 0.5}], ids=["stalled"])
+def test_make_request_hedged(benchmark, provider):
+    assert benchmark(provider.make_request, "eth_blockNumber", []) == "0x100"
+    assert provider.stats["eth_blockNumber"]["hedged"] > 0
+    assert provider.stats["eth_blockNumber"]["latency"]["p99"] < 0.5
+
+
+def test_get_transaction_trace(benchmark, networks, provider, mock_alchemy):
+    networks.active_provider = provider
+    mock_alchemy.results["trace_transaction"] = make_parity_trace(TXN_HASH, 200)
+
+    def get_calltree():
+        return provider.get_transaction_trace(TXN_HASH).get_calltree()
+
+    assert len(benchmark(get_calltree).calls) == 199
+
+
+@pytest.mark.parametrize("config", [AlchemyConfig(stream_traces=True)], ids=["streamed"])
+def test_stream_transaction_trace(benchmark, networks, provider, mock_alchemy):
+    networks.active_provider = provider
+    call_trace = make_call_trace(depth=4, width=6)
+    mock_alchemy.results["debug_traceTransaction"] = lambda _: call_trace
+
+    def get_first_calls():
+        frame = provider.get_transaction_trace(TXN_HASH).call_frame
+        return frame.fields, [call.fields for call in frame.calls]
+
+    fields, calls = benchmark(get_first_calls)
+    assert fields["to"] == call_trace["to"]
+    assert len(calls) == 6
@@ -0,0 +1,87 @@
+from ape.utils import ZERO_ADDRESS
+
+from ape_alchemy.cache import RequestCache, get_block_number, get_cache_key
+from ape_alchemy.memoize import BlockScopedLRUCache, get_memo_key
+
+
+class Clock:
+    now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_get_cache_key():
+    key = get_cache_key(1, "eth_getBlockByNumber", ["0x10", False])
+    assert key is not None
+    assert key != get_cache_key(5, "eth_getBlockByNumber", ["0x10", False])
+    assert get_cache_key(1, "eth_getBlockByNumber", ["latest", False]) is None
+    assert get_cache_key(1, "eth_call", [{}, "0x10"]) is None
+
+
+def test_get_block_number():
+    assert get_block_number("eth_getBlockByNumber", {"number": "0x10"}) == 16
+    assert get_block_number("eth_getTransactionReceipt", {"blockNumber": "0x10"}) == 16
+    assert get_block_number("eth_getTransactionByHash", {"blockNumber": None}) is None
+    assert get_block_number("trace_transaction", [{"blockNumber": 16}]) == 16
+
+
+def test_request_cache_evicts_least_recently_used(tmp_path):
+    cache = RequestCache(tmp_path / "cache.sqlite", max_size=100)
+    cache.set("a", "a" * 40)
+    cache.set("b", "b" * 40)
+    assert cache.get("a") == "a" * 40  # Now, "b" is the least-recently used.
+
+    cache.set("c", "c" * 40)
+    assert cache.get("b") is None
+    assert cache.get("a") == "a" * 40
+    assert cache.get("c") == "c" * 40
+    assert cache.size <= 100
+
+
+def test_request_cache_replace(tmp_path):
+    cache = RequestCache(tmp_path / "cache.sqlite", max_size=100)
+    cache.set("a", "a" * 40)
+    size = cache._size
+    for _ in range(5):
+        cache.set("a", "a" * 40)
+
+    # Re-setting a key does not count its size again, or evict other results.
+    assert cache._size == size == cache.size
+    cache.set("b", "b" * 40)
+    assert cache.get("a") == "a" * 40
+
+
+def test_get_memo_key():
+    assert get_memo_key("eth_call", [{"to": ZERO_ADDRESS}, "latest"]) is not None
+    assert get_memo_key("eth_call", [{"to": ZERO_ADDRESS}, "0x10"]) is None
+    assert get_memo_key("eth_gasPrice", []) is not None
+
+
+def test_block_scoped_lru_cache():
+    clock = Clock()
+    cache = BlockScopedLRUCache(2, clock=clock)
+    cache.set_head(1)
+    cache.set("gas", "eth_gasPrice", "0x1", ttl=10)
+    cache.set("chain", "eth_chainId", "0x1", ttl=100)
+    assert cache.get("gas") == "0x1"
+
+    # A new head block invalidates block-scoped entries only.
+    cache.set_head(2)
+    assert cache.get("gas") is None
+    assert cache.get("chain") == "0x1"
+
+    # Entries expire.
+    clock.now = 100
+    assert cache.get("chain") is None
+    assert cache.stats == {"hits": 2, "misses": 2, "hit_rate": 0.5}
+
+
+def test_block_scoped_lru_cache_evicts_least_recently_used():
+    cache = BlockScopedLRUCache(2)
+    cache.set("a", "eth_call", "0x1", ttl=10)
+    cache.set("b", "eth_call", "0x2", ttl=10)
+    cache.get("a")
+    cache.set("c", "eth_call", "0x3", ttl=10)
+    assert cache.get("b") is None
+    assert len(cache) == 2
@@ -0,0 +1,114 @@
+import time
+
+import pytest
+from ape.exceptions import ProviderError
+
+from ape_alchemy.config import AlchemyConfig
+from ape_alchemy.failover import EndpointRouter
+
+from .mock_alchemy import MockAlchemy
+
+
+def wait_for(condition, timeout: float = 5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "Timed out."
+        time.sleep(0.01)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_router():
+    clock = Clock()
+    healthy = {"primary": True, "fallback": True}
+    router = EndpointRouter(
+        "primary", ["fallback"], healthy.get, max_failures=2, health_check_interval=10, clock=clock
+    )
+    # Until checked, the primary is preferred.
+    assert router.select() == "primary"
+    wait_for(lambda: all(h["latency"] is not None for h in router.to_dict().values()))
+
+    router.record("primary", failed=True)
+    assert router.select() == "primary"
+    router.record("primary", failed=True)
+    assert router["primary"]["is_down"]
+    assert router.select() == "fallback"
+
+    # Back once a health check passes.
+    clock.now = 10
+    router.select()
+    wait_for(lambda: not router["primary"]["is_down"])
+    assert router.select() == "primary"
+
+
+def test_router_check_fails():
+    router = EndpointRouter("primary", ["fallback"], {"primary": True}.get)
+    router.select()
+    wait_for(lambda: router["fallback"]["is_down"])
+    assert router["fallback"]["consecutive_failures"] == 1
+
+    # When all are down, requests still go to the primary.
+    router.record("primary", failed=True)
+    router.record("primary", failed=True)
+    router.record("primary", failed=True)
+    assert router["primary"]["is_down"]
+    assert router.select() == "primary"
+
+
+@pytest.fixture
+def fallback():
+    with MockAlchemy() as server:
+        yield server
+
+
+@pytest.fixture
+def config(fallback):
+    return AlchemyConfig(
+        rate_limit={"min_retry_delay": 1, "retry_jitter": 0, "max_retries": 5},
+        connect={"metadata_ttl": 0},
+        failover={
+            "endpoints": {"ethereum:sepolia": [fallback.uri]},
+            "health_check_interval": 0.05,
+        },
+    )
+
+
+def test_failover(provider, mock_alchemy, fallback):
+    mock_alchemy.drop_every = 1
+    assert provider.make_request("eth_blockNumber", []) == "0x100"
+    assert provider.endpoint_health[mock_alchemy.uri]["is_down"]
+    assert fallback.calls["eth_blockNumber"] == 1
+
+    # Writes are not sent to fallbacks.
+    fallback.reset()
+    with pytest.raises(ProviderError):
+        provider.make_request("eth_sendRawTransaction", ["0x"])
+
+    assert fallback.calls["eth_sendRawTransaction"] == 0
+
+    # Reads move back once Alchemy recovers.
+    mock_alchemy.drop_every = 0
+    mock_alchemy.reset()
+    wait_for(
+        lambda: (
+            provider.make_request("eth_blockNumber", []) and mock_alchemy.calls["eth_blockNumber"]
+        )
+    )
+    assert not provider.endpoint_health[mock_alchemy.uri]["is_down"]
+
+
+def test_failover_wrong_chain(provider, mock_alchemy, fallback):
+    fallback.results["eth_chainId"] = "0x1"
+    provider.make_request("eth_blockNumber", [])
+    wait_for(lambda: provider.endpoint_health[fallback.uri]["is_down"])
+    mock_alchemy.drop_every = 1
+    with pytest.raises(ProviderError):
+        provider.make_request("eth_blockNumber", [])
+
+    assert fallback.calls["eth_blockNumber"] == 0
@@ -0,0 +1,104 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+
+import pytest
+
+from ape_alchemy.hedging import HedgeBudget, send_hedged
+
+
+@pytest.fixture
+def executor():
+    with ThreadPoolExecutor(4) as executor:
+        yield executor
+
+
+def make_request(*outcomes):
+    """
+    A request returning (or raising) each outcome in turn, once its event is set.
+    """
+    calls = []
+    events = [Event() for _ in outcomes]
+
+    def request():
+        index = len(calls)
+        calls.append(index)
+        events[index].wait(5)
+        if isinstance(outcomes[index], Exception):
+            raise outcomes[index]
+
+        return outcomes[index]
+
+    return request, calls, events
+
+
+def test_send_hedged(executor):
+    request, calls, events = make_request("primary", "hedge")
+    events[1].set()
+    assert send_hedged(executor, request, 0.01, lambda: True) == "hedge"
+    assert calls == [0, 1]
+    events[0].set()
+
+
+def test_send_hedged_fast(executor):
+    request, calls, events = make_request("primary", "hedge")
+    events[0].set()
+    assert send_hedged(executor, request, 1, lambda: True) == "primary"
+    assert calls == [0]
+
+
+def test_send_hedged_busy_executor(executor):
+    request, calls, events = make_request("primary")
+    events[0].set()
+    busy = Event()
+    for _ in range(4):
+        executor.submit(busy.wait, 5)
+
+    # The first call does not wait for the executor.
+    assert send_hedged(executor, request, 1, lambda: True) == "primary"
+    busy.set()
+
+
+def test_send_hedged_over_budget(executor):
+    request, calls, events = make_request("primary", "hedge")
+    executor.submit(lambda: time.sleep(0.05) or events[0].set())
+    assert send_hedged(executor, request, 0.01, lambda: False) == "primary"
+    assert calls == [0]
+
+
+def test_send_hedged_primary_fails(executor):
+    request, calls, events = make_request(ConnectionError("primary"), "hedge")
+    # The hedge is sent, then the primary fails before the hedge returns.
+    executor.submit(lambda: len(calls) > 1 or time.sleep(0.05) or events[0].set())
+    executor.submit(lambda: time.sleep(0.1) or events[1].set())
+    assert send_hedged(executor, request, 0.01, lambda: True) == "hedge"
+
+
+def test_send_hedged_both_fail(executor):
+    request, calls, events = make_request(ConnectionError("primary"), ConnectionError("hedge"))
+    executor.submit(lambda: time.sleep(0.05) or events[1].set() or events[0].set())
+    with pytest.raises(ConnectionError, match="primary"):
+        send_hedged(executor, request, 0.01, lambda: True)
+
+
+def test_budget():
+    budget = HedgeBudget(max_extra_percent=10)
+    assert not budget.spend(26)
+
+    for _ in range(10):
+        budget.add(26)
+
+    assert budget.spend(26)
+    assert not budget.spend(26)
+    assert budget.hedged_compute_units == 26
+
+
+def test_budget_in_flight():
+    budget = HedgeBudget(max_extra_percent=100, max_in_flight=1)
+    budget.add(100)
+    assert budget.spend(10)
+    # Another hedge would queue behind the first.
+    assert not budget.spend(10)
+
+    budget.finish()
+    assert budget.spend(10)
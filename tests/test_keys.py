@@ -0,0 +1,93 @@
+import pytest
+
+from ape_alchemy.config import AlchemyConfig
+from ape_alchemy.keys import ApiKeyPool
+from ape_alchemy.rate_limit import ComputeUnitBucket
+
+URIS = ["https://a", "https://b", "https://c"]
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_round_robin():
+    pool = ApiKeyPool(URIS)
+    assert [pool.select() for _ in range(4)] == [*URIS, URIS[0]]
+
+
+def test_least_loaded():
+    pool = ApiKeyPool(URIS, strategy="least-loaded")
+    with pool.use() as first, pool.use() as second:
+        assert (first, second) == tuple(URIS[:2])
+        assert pool.select() == URIS[2]
+        with pool.use():
+            # All have one in flight, so the rotation decides.
+            assert pool.select() == URIS[1]
+
+
+def test_compute_units():
+    buckets = {uri: ComputeUnitBucket(100, clock=Clock()) for uri in URIS}
+    buckets[URIS[0]].reserve(50)
+    buckets[URIS[1]].reserve(10)
+    buckets[URIS[2]].reserve(30)
+    pool = ApiKeyPool(URIS, strategy="compute-units", get_bucket=buckets.get)
+    assert pool.select() == URIS[1]
+
+
+def test_cooldown():
+    clock = Clock()
+    pool = ApiKeyPool(URIS[:2], cooldown=10, clock=clock)
+    pool.eject(URIS[0])
+    assert pool.is_cooling_down(URIS[0])
+    assert [pool.select() for _ in range(3)] == [URIS[1]] * 3
+
+    # When all are cooling down, the one done soonest is used.
+    clock.now = 5
+    pool.eject(URIS[1])
+    assert pool.select() == URIS[0]
+
+    clock.now = 10
+    assert not pool.is_cooling_down(URIS[0])
+    assert {pool.select() for _ in range(2)} == {URIS[0]}
+
+
+@pytest.fixture
+def config():
+    return AlchemyConfig(
+        rate_limit={"min_retry_delay": 1, "retry_jitter": 0}, connect={"metadata_ttl": 0}
+    )
+
+
+@pytest.fixture
+def uris(mock_alchemy):
+    return [mock_alchemy.get_uri("key1"), mock_alchemy.get_uri("key2")]
+
+
+def test_make_request(provider, mock_alchemy):
+    for _ in range(4):
+        provider.make_request("eth_blockNumber", [])
+
+    assert mock_alchemy.keys == {"key1": 2, "key2": 2}
+
+
+def test_make_request_rate_limited(provider, mock_alchemy):
+    mock_alchemy.rate_limited_keys.add("key1")
+    for _ in range(4):
+        assert provider.make_request("eth_blockNumber", []) == "0x100"
+
+    # The rate-limited key is skipped once it gets a 429.
+    assert mock_alchemy.keys["key1"] == 1
+    assert provider.stats["eth_blockNumber"]["rate_limited"] == 1
+
+
+def test_make_batch_request_rate_limited(provider, mock_alchemy):
+    mock_alchemy.rate_limited_keys.add("key1")
+    calls = [("eth_getBalance", [f"0x{i:040x}", "latest"]) for i in range(10)]
+    assert provider.make_batch_request(calls) == ["0x0"] * 10
+    assert provider.make_batch_request(calls) == ["0x0"] * 10
+    assert mock_alchemy.keys == {"key1": 1, "key2": 2}
@@ -0,0 +1,79 @@
+from types import SimpleNamespace
+
+import pytest
+from ape.types import LogFilter
+
+from ape_alchemy.config import AlchemyConfig
+from ape_alchemy.exceptions import AlchemyProviderError
+from ape_alchemy.logs import LogQuery, get_suggested_page_size, is_range_too_large
+from ape_alchemy.provider import Alchemy
+
+RANGE_TOO_LARGE = (
+    "Log response size exceeded. You can make eth_getLogs requests with up to a 2K block "
+    "range and no limit on the response size, or you can request any block range with a "
+    "cap of 10K logs in the response. Based on your parameters, this block range should "
+    "work: [0x0, 0x3]"
+)
+
+
+class MockProvider:
+    """
+    A provider returning one log per block from ``eth_getLogs``,
+    rejecting ranges larger than ``max_range``.
+    """
+
+    concurrency = 4
+    block_page_size = 100
+
+    def __init__(self, max_range: int, **logs_config):
+        self.config = AlchemyConfig(logs=logs_config)
+        self.max_range = max_range
+        self.requested: list[tuple[int, int]] = []
+        self.network = SimpleNamespace(
+            ecosystem=SimpleNamespace(decode_logs=lambda logs, *_: iter(logs))
+        )
+
+    def make_request(self, rpc, parameters):
+        assert rpc == "eth_getLogs"
+        start = int(parameters[0]["fromBlock"], 16)
+        stop = int(parameters[0]["toBlock"], 16)
+        self.requested.append((start, stop))
+        if stop - start + 1 > self.max_range:
+            return {"error": {"code": -32602, "message": RANGE_TOO_LARGE}}
+
+        return list(range(start, stop + 1))
+
+    _get_rpc_error = staticmethod(Alchemy._get_rpc_error)
+
+
+def test_is_range_too_large():
+    assert is_range_too_large(AlchemyProviderError(RANGE_TOO_LARGE))
+    assert is_range_too_large(AlchemyProviderError("query returned more than 10000 results"))
+    assert not is_range_too_large(AlchemyProviderError("execution reverted"))
+
+
+def test_get_suggested_page_size():
+    assert get_suggested_page_size(AlchemyProviderError(RANGE_TOO_LARGE)) == 4
+    assert get_suggested_page_size(AlchemyProviderError("range too large")) is None
+
+
+def test_log_query_splits_ranges():
+    provider = MockProvider(max_range=4)
+    query = LogQuery(provider, LogFilter(), 0, 99)  # type: ignore[arg-type]
+    assert list(query) == list(range(100))
+    assert query.page_size <= 4
+
+
+def test_log_query_grows_sparse_ranges():
+    provider = MockProvider(max_range=10_000, initial_page_size=10, target_logs_per_page=1_000)
+    provider.concurrency = 1
+    query = LogQuery(provider, LogFilter(), 0, 149)  # type: ignore[arg-type]
+    assert list(query) == list(range(150))
+    assert [stop - start + 1 for start, stop in provider.requested] == [10, 20, 40, 80]
+
+
+def test_log_query_raises_other_errors():
+    provider = MockProvider(max_range=4)
+    provider.make_request = lambda *_: {"error": {"message": "execution reverted"}}
+    with pytest.raises(AlchemyProviderError, match="execution reverted"):
+        list(LogQuery(provider, LogFilter(), 0, 9))  # type: ignore[arg-type]
@@ -0,0 +1,79 @@
+import socket
+from urllib.request import urlopen
+
+import pytest
+
+from ape_alchemy.metrics import RequestStats, start_metrics_server
+
+
+@pytest.fixture
+def stats():
+    stats = RequestStats(labels={"network": "ethereum:mainnet"}, max_samples=100)
+    for latency in range(1, 101):
+        stats.record("eth_call", latency / 1000, compute_units=26)
+
+    stats.record("eth_getLogs", 0.2, error=True, bytes_sent=100, bytes_received=2_000)
+    stats.record_retries(["eth_getLogs"], retries=1, rate_limited=1)
+    stats.record_cache_hit("eth_call")
+    return stats
+
+
+def test_stats(stats):
+    eth_call = stats["eth_call"]
+    assert eth_call["count"] == 100
+    assert eth_call["cache_hits"] == 1
+    assert eth_call["compute_units"] == 2_600
+    assert eth_call["latency"]["p50"] == 0.05
+    assert eth_call["latency"]["p95"] == 0.095
+    assert eth_call["latency"]["p99"] == 0.099
+    assert eth_call["latency"]["mean"] == pytest.approx(0.0505)
+
+    assert stats.methods == ["eth_call", "eth_getLogs"]
+    assert stats.totals["errors"] == 1
+    assert stats.totals["retries"] == 1
+    assert stats.totals["rate_limited"] == 1
+    assert stats.totals["bytes_received"] == 2_000
+
+    stats.reset()
+    assert stats.to_dict() == {}
+
+
+def test_stats_latency_window():
+    stats = RequestStats(max_samples=10)
+    for _ in range(100):
+        stats.record("eth_call", 1.0)
+    for _ in range(10):
+        stats.record("eth_call", 0.01)
+
+    # Percentiles are of the most recent requests.
+    assert stats["eth_call"]["latency"]["p99"] == 0.01
+
+
+def test_to_openmetrics(stats):
+    text = stats.to_openmetrics()
+    labels = 'network="ethereum:mainnet",method="eth_call"'
+    assert "# TYPE alchemy_requests counter" in text
+    assert f"alchemy_requests_total{{{labels}}} 100" in text
+    assert f"alchemy_compute_units_total{{{labels}}} 2600" in text
+    assert f'alchemy_request_duration_seconds_bucket{{{labels},le="0.05"}} 50' in text
+    assert f'alchemy_request_duration_seconds_bucket{{{labels},le="+Inf"}} 100' in text
+    assert f"alchemy_request_duration_seconds_count{{{labels}}} 100" in text
+    assert text.endswith("# EOF\n")
+
+
+def test_metrics_server(stats):
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    server = start_metrics_server(port)
+    try:
+        assert start_metrics_server(port) is server
+        with urlopen(f"http://127.0.0.1:{port}/metrics") as response:
+            assert response.headers["Content-Type"].startswith("application/openmetrics-text")
+            body = response.read().decode()
+
+        assert 'alchemy_requests_total{network="ethereum:mainnet",method="eth_getLogs"} 1' in body
+    finally:
+        server.shutdown()
+        server.server_close()
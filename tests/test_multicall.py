@@ -0,0 +1,224 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from ape.exceptions import ContractLogicError
+from eth_abi import decode, encode
+from eth_utils import to_hex
+from hexbytes import HexBytes
+
+from ape_alchemy.config import AlchemyConfig
+from ape_alchemy.exceptions import AlchemyProviderError
+from ape_alchemy.multicall import ERROR_SELECTOR, MULTICALL3_ADDRESS, get_revert_message
+
+from .mock_alchemy import RpcError
+
+TOKEN = "0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48"
+# balanceOf(address)
+SELECTOR = HexBytes("0x70a08231")
+REVERTING_ACCOUNT = 666
+# Reverts with a custom error, `Denied(uint256)`.
+DENIED_ACCOUNT = 667
+DENIED_SELECTOR = HexBytes("0xdeadbeef")
+# Runs out of gas only when aggregated.
+GASSY_ACCOUNT = 668
+
+
+class Multicall3:
+    """
+    ``eth_call`` on the mock server, with a Multicall3 contract and a token
+    whose balances are double the account number.
+    """
+
+    def __init__(self, mock_alchemy):
+        self.is_deployed = True
+        # Aggregated calls with more calls than this run out of gas.
+        self.max_calls = 1_000
+        self.sizes: list[int] = []
+        mock_alchemy.results["eth_call"] = self.call
+
+    def call(self, params):
+        txn = params[0]
+        data = HexBytes(txn["data"])
+        if txn["to"].lower() != MULTICALL3_ADDRESS.lower():
+            success, return_data = self.balance_of(data, aggregated=False)
+            if not success:
+                raise RpcError(get_revert_message(return_data), code=3, data=to_hex(return_data))
+
+            return to_hex(return_data)
+
+        if not self.is_deployed:
+            return "0x"
+
+        (calls,) = decode(["(address,bool,bytes)[]"], data[4:])
+        if len(calls) > self.max_calls:
+            raise RpcError("out of gas")
+
+        self.sizes.append(len(calls))
+        results = [
+            self.balance_of(HexBytes(call_data), aggregated=True) for _, _, call_data in calls
+        ]
+        return to_hex(encode(["(bool,bytes)[]"], [results]))
+
+    @staticmethod
+    def balance_of(data: HexBytes, aggregated: bool) -> tuple[bool, bytes]:
+        account = int.from_bytes(data[4:36], "big")
+        if account == REVERTING_ACCOUNT:
+            return False, ERROR_SELECTOR + encode(["string"], ["Nope"])
+
+        if account == DENIED_ACCOUNT:
+            return False, DENIED_SELECTOR + encode(["uint256"], [account])
+
+        if account == GASSY_ACCOUNT and aggregated:
+            return False, b""
+
+        return True, encode(["uint256"], [2 * account])
+
+
+def make_call(account: int, block_id: str = "latest") -> list:
+    data = SELECTOR + encode(["uint256"], [account])
+    return [{"to": TOKEN, "data": to_hex(data), "value": "0x0"}, block_id]
+
+
+@pytest.fixture
+def config():
+    return AlchemyConfig(connect={"metadata_ttl": 0}, multicall={"enabled": True, "window": 0.05})
+
+
+@pytest.fixture
+def multicall(mock_alchemy):
+    return Multicall3(mock_alchemy)
+
+
+@pytest.fixture
+def executor():
+    with ThreadPoolExecutor(50) as executor:
+        yield executor
+
+
+def get_balances(provider, executor, accounts, block_id: str = "latest"):
+    return list(
+        executor.map(lambda a: provider.make_request("eth_call", make_call(a, block_id)), accounts)
+    )
+
+
+def test_make_request(provider, multicall, executor, mock_alchemy):
+    balances = get_balances(provider, executor, range(200))
+    assert [int(b, 16) for b in balances] == [2 * a for a in range(200)]
+    assert mock_alchemy.calls["eth_call"] < 10
+    # Each call is aggregated or, when made alone, sent on its own, once.
+    num_alone = mock_alchemy.calls["eth_call"] - len(multicall.sizes)
+    assert sum(multicall.sizes) + num_alone == 200
+
+
+@pytest.mark.parametrize(
+    "config",
+    [AlchemyConfig(connect={"metadata_ttl": 0}, multicall={"enabled": True, "window": 10})],
+)
+def test_make_request_alone(provider, multicall, mock_alchemy):
+    started = time.perf_counter()
+    assert int(provider.make_request("eth_call", make_call(3)), 16) == 6
+    # Does not wait for others to join.
+    assert time.perf_counter() - started < 5
+    assert mock_alchemy.calls["eth_call"] == 1
+    assert not multicall.sizes
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        AlchemyConfig(connect={"metadata_ttl": 0}),
+        AlchemyConfig(connect={"metadata_ttl": 0}, multicall={"enabled": True}),
+    ],
+    ids=["plain", "aggregated"],
+)
+def test_eth_call_reverts(provider, multicall):
+    with pytest.raises(ContractLogicError, match="Nope"):
+        provider._eth_call(make_call(REVERTING_ACCOUNT), skip_trace=True)
+
+    # The revert data is kept, so the custom error can be decoded.
+    data = DENIED_SELECTOR + encode(["uint256"], [DENIED_ACCOUNT])
+    with pytest.raises(ContractLogicError) as info:
+        provider._eth_call(make_call(DENIED_ACCOUNT), skip_trace=True)
+
+    assert info.value.revert_message == to_hex(data)
+
+
+def test_make_request_reverts(provider, multicall):
+    calls = [("eth_call", make_call(a)) for a in (1, REVERTING_ACCOUNT, 2)]
+    with provider.batch_requests() as batch:
+        futures = [batch.add(rpc, parameters) for rpc, parameters in calls]
+
+    assert int(futures[0].result(), 16) == 2
+    assert int(futures[2].result(), 16) == 4
+    assert multicall.sizes == [3]
+    with pytest.raises(AlchemyProviderError, match="execution reverted: Nope"):
+        futures[1].result()
+
+    # The error maps to a revert.
+    error = provider.get_virtual_machine_error(futures[1].exception())
+    assert error.revert_message == "Nope"
+
+
+def test_make_request_custom_error(provider, multicall):
+    calls = [("eth_call", make_call(a)) for a in (1, DENIED_ACCOUNT, 2)]
+    with provider.batch_requests() as batch:
+        futures = [batch.add(rpc, parameters) for rpc, parameters in calls]
+
+    assert int(futures[0].result(), 16) == 2
+    assert multicall.sizes == [3]
+    with pytest.raises(AlchemyProviderError, match="execution reverted") as info:
+        futures[1].result()
+
+    # The revert data is kept, so the custom error can be decoded.
+    data = DENIED_SELECTOR + encode(["uint256"], [DENIED_ACCOUNT])
+    assert info.value.data == to_hex(data)
+    error = provider.get_virtual_machine_error(info.value)
+    assert error.revert_message == to_hex(data)
+
+
+def test_make_request_out_of_gas(provider, multicall):
+    accounts = [1, GASSY_ACCOUNT, 2]
+    results = provider.make_batch_request([("eth_call", make_call(a)) for a in accounts])
+    # Failing without data is not a revert, so the call is sent again on its own.
+    assert [int(r, 16) for r in results] == [2 * a for a in accounts]
+    assert multicall.sizes == [3]
+
+
+def test_make_request_by_block(provider, multicall):
+    accounts = list(range(20))
+    blocks = ["latest", "0x100"] * 10
+    calls = [("eth_call", make_call(a, b)) for a, b in zip(accounts, blocks, strict=True)]
+    results = provider.make_batch_request(calls)
+    assert [int(r, 16) for r in results] == [2 * a for a in accounts]
+    # NOTE: One aggregated call per block.
+    assert multicall.sizes == [10, 10]
+
+
+def test_make_request_splits_failed_chunks(provider, multicall, executor):
+    multicall.max_calls = 30
+    balances = get_balances(provider, executor, range(100))
+    assert [int(b, 16) for b in balances] == [2 * a for a in range(100)]
+    assert max(multicall.sizes) <= 30
+
+
+def test_make_request_without_multicall(provider, multicall, executor, mock_alchemy):
+    multicall.is_deployed = False
+    balances = get_balances(provider, executor, range(10))
+    assert [int(b, 16) for b in balances] == [2 * a for a in range(10)]
+    assert not multicall.sizes
+
+
+def test_make_batch_request(provider, multicall, mock_alchemy):
+    calls = [("eth_call", make_call(a)) for a in range(50)]
+    results = provider.make_batch_request([*calls, ("eth_chainId", [])])
+    assert [int(r, 16) for r in results[:-1]] == [2 * a for a in range(50)]
+    assert multicall.sizes == [50]
+
+
+def test_make_request_with_sender(provider, multicall):
+    # NOTE: Calls made by an account cannot be aggregated.
+    call = make_call(3)
+    call[0]["from"] = "0x5cab1e5286529370880776461c53a0e47d74fb63"
+    assert int(provider.make_request("eth_call", call), 16) == 6
+    assert not multicall.sizes
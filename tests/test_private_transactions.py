@@ -0,0 +1,106 @@
+import time
+
+import pytest
+from ape.exceptions import ContractLogicError, TransactionNotFoundError
+
+from ape_alchemy.config import AlchemyConfig
+
+from .mock_alchemy import MockChain, RpcError
+
+
+class Chain(MockChain):
+    """
+    Private transactions on the mock server, mined when the test says so.
+    """
+
+    def __init__(self, mock_alchemy, raw_receipt, raw_transaction):
+        super().__init__(mock_alchemy, raw_receipt, raw_transaction)
+        mock_alchemy.results["eth_sendPrivateTransaction"] = self.send
+
+    @staticmethod
+    def send(params):
+        tx = params[0]["tx"].removeprefix("0x")
+        if tx == "dead":
+            raise RpcError("execution reverted: Nope")
+
+        return "0x" + tx.rjust(64, "0")
+
+
+@pytest.fixture
+def config():
+    return AlchemyConfig(
+        connect={"metadata_ttl": 0},
+        receipts={"poll_interval": 0},
+        websocket={"poll_with_subscriptions": False},
+    )
+
+
+@pytest.fixture
+def chain(mock_alchemy, raw_receipt, raw_transaction):
+    return Chain(mock_alchemy, raw_receipt, raw_transaction)
+
+
+def make_txn(mocker, index: int):
+    txn = mocker.MagicMock()
+    txn.serialize_transaction.return_value = index.to_bytes(2, "big")
+    txn.required_confirmations = 2
+    return txn
+
+
+def wait_for(condition, timeout: float = 5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "Timed out."
+        time.sleep(0.01)
+
+
+def test_send_private_transactions(mocker, provider, chain, mock_alchemy):
+    txns = [make_txn(mocker, i) for i in range(1, 41)]
+    futures = provider.send_private_transactions(txns, fast=True)
+    wait_for(lambda: mock_alchemy.calls["eth_sendPrivateTransaction"] == 40)
+    assert not any(future.done() for future in futures)
+
+    txn_hashes = ["0x" + f"{i:04x}".rjust(64, "0") for i in range(1, 41)]
+    chain.mine(*txn_hashes[:20])
+    chain.mine(*txn_hashes[20:])
+    chain.mine()
+    chain.mine()
+    receipts = [future.result(timeout=5) for future in futures]
+    assert [r.txn_hash for r in receipts] == txn_hashes
+    # One batch of receipt requests per new block, not one request per transaction.
+    assert mock_alchemy.calls["eth_getTransactionReceipt"] <= 4 * 40
+
+
+def test_send_private_transactions_reverts(mocker, provider, chain):
+    txn = make_txn(mocker, 0xDEAD)
+    (future,) = provider.send_private_transactions([txn])
+    with pytest.raises(ContractLogicError, match="Nope"):
+        future.result(timeout=5)
+
+
+def test_send_private_transactions_not_mined(mocker, provider, chain):
+    (future,) = provider.send_private_transactions(
+        [make_txn(mocker, 1)], max_block_number=hex(chain.head + 1)
+    )
+    chain.mine()
+    chain.mine()
+    with pytest.raises(TransactionNotFoundError):
+        future.result(timeout=5)
+
+
+def test_send_private_transaction_node_down(mocker, provider, chain, mock_alchemy):
+    network_type = type(provider.network)
+    mocker.patch.object(
+        network_type, "block_time", new_callable=mocker.PropertyMock, return_value=0
+    )
+    mocker.patch.object(
+        network_type,
+        "transaction_acceptance_timeout",
+        new_callable=mocker.PropertyMock,
+        return_value=1,
+    )
+    mocker.patch("ape_alchemy.provider.RECEIPT_WAIT_MARGIN", 1)
+    # The watcher never gets a head, but the send does not wait forever.
+    mock_alchemy.results["eth_blockNumber"] = mocker.MagicMock(side_effect=RpcError("Down."))
+    with pytest.raises(TransactionNotFoundError):
+        provider.send_private_transaction(make_txn(mocker, 1))
@@ -1,12 +1,22 @@
+import asyncio
+import os
 import re
 
 import pytest
-from ape.exceptions import ContractLogicError
+from aiohttp import ClientResponseError
+from ape.exceptions import ContractLogicError, TransactionNotFoundError
 from ape.types import LogFilter
+from ape_ethereum.trace import TraceApproach
 from hexbytes import HexBytes
 from requests import HTTPError
 from web3.exceptions import ContractLogicError as Web3ContractLogicError
 
+from ape_alchemy._session import get_session
+from ape_alchemy.async_provider import AsyncAlchemy
+from ape_alchemy.config import AlchemyConfig
+from ape_alchemy.exceptions import AlchemyFeatureNotAvailable
+from ape_alchemy.provider import Alchemy
+
 TXN_HASH = "0x3cef4aaa52b97b6b61aa32b3afcecb0d14f7862ca80fdc76504c37a9374645c4"
 
 
@@ -111,6 +121,20 @@ def test_uri_no_api_key(missing_token, alchemy_provider):
     assert alchemy_provider.uri.endswith("/demo")
 
 
+def test_uris(mocker, alchemy_provider):
+    alchemy_provider.network_uris = {}
+    mocker.patch.dict(os.environ, {"WEB3_ALCHEMY_API_KEY": "key1, key2"})
+    assert alchemy_provider.uris == [
+        "https://eth-sepolia.g.alchemy.com/v2/key1",
+        "https://eth-sepolia.g.alchemy.com/v2/key2",
+    ]
+    assert alchemy_provider.uri == alchemy_provider.uris[0]
+
+    # Setting a URI directly uses only it.
+    alchemy_provider.network_uris = {("ethereum", "sepolia"): "https://example.com"}
+    assert alchemy_provider.uris == ["https://example.com"]
+
+
 def test_send_transaction_reverts(token, alchemy_provider, mock_web3, transaction):
     expected_revert_message = "EXPECTED REVERT MESSAGE"
     mock_web3.eth.send_raw_transaction.side_effect = Web3ContractLogicError(
@@ -205,3 +229,379 @@ def test_make_request_empty_result(alchemy_provider, mock_web3):
     mock_web3.provider.make_request.return_value = {"jsonrpc": "2.0", "id": 8, "result": []}
     result = alchemy_provider.make_request("ape_madeUpRPC", [])
     assert result == []
+
+
+def test_make_batch_request(alchemy_provider, mock_web3, feature_not_available_http_error):
+    alchemy_provider._web3 = mock_web3
+    message = feature_not_available_http_error.response.fixture_param
+    mock_web3.provider.make_batch_request.return_value = [
+        {"jsonrpc": "2.0", "id": 0, "result": "0x1"},
+        {"jsonrpc": "2.0", "id": 1, "error": {"code": -32601, "message": message}},
+    ]
+    with alchemy_provider.batch_requests() as batch:
+        chain_id = batch.add("eth_chainId")
+        trace = batch.add("trace_transaction", [TXN_HASH])
+
+    assert chain_id.result() == "0x1"
+    with pytest.raises(AlchemyFeatureNotAvailable, match=re.escape(message)):
+        trace.result()
+
+    mock_web3.provider.make_batch_request.assert_called_once_with(
+        [("eth_chainId", []), ("trace_transaction", [TXN_HASH])]
+    )
+
+
+def test_make_batch_request_retries_rate_limited_calls(mocker, alchemy_provider, mock_web3):
+    mocker.patch("ape.utils.rpc.time.sleep")
+    alchemy_provider._web3 = mock_web3
+    rate_limited = {"code": 429, "message": "Your app has exceeded its compute units"}
+    mock_web3.provider.make_batch_request.side_effect = [
+        [{"id": 0, "result": "0x1"}, {"id": 1, "error": rate_limited}],
+        [{"id": 2, "result": "0x2"}],
+    ]
+    actual = alchemy_provider.make_batch_request([("eth_chainId", None), ("eth_blockNumber", [])])
+    assert actual == ["0x1", "0x2"]
+    last_call = mock_web3.provider.make_batch_request.call_args_list[-1]
+    assert last_call.args[0] == [("eth_blockNumber", [])]
+
+
+def test_shared_session(alchemy_provider):
+    http_config = alchemy_provider.config.http
+    session = get_session(alchemy_provider.uri, http_config)
+    assert get_session(alchemy_provider.uri, http_config) is session
+    assert session.get_adapter(alchemy_provider.uri)._pool_maxsize == http_config.pool_maxsize
+    assert set(alchemy_provider.connection_pool_stats) == {"hits", "misses"}
+
+    no_keep_alive = http_config.model_copy(update={"keep_alive": False})
+    other_session = get_session(alchemy_provider.uri, no_keep_alive)
+    assert other_session is not session
+    assert other_session.headers["Connection"] == "close"
+
+
+def test_async_make_request_rate_limiting(mocker, alchemy_provider):
+    mocker.patch("ape_alchemy.async_provider.asyncio.sleep", new=mocker.AsyncMock())
+    rate_limited = ClientResponseError(mocker.MagicMock(), (), status=429)
+    alchemy = AsyncAlchemy(alchemy_provider)
+    alchemy._web3 = mocker.MagicMock()
+    alchemy._web3.provider.make_request = mocker.AsyncMock(
+        side_effect=[rate_limited, {"jsonrpc": "2.0", "id": 1, "result": "0x1"}]
+    )
+    assert asyncio.run(alchemy.make_request("eth_chainId")) == "0x1"
+    assert alchemy._web3.provider.make_request.await_count == 2
+
+
+def test_async_make_request_not_available(mocker, alchemy_provider, mock_alchemy):
+    mocker.patch.object(
+        Alchemy, "uri", new_callable=mocker.PropertyMock, return_value=mock_alchemy.uri
+    )
+
+    async def make_request():
+        async with AsyncAlchemy(alchemy_provider) as alchemy:
+            return await alchemy.make_request("alchemy_notAMethod", [])
+
+    with pytest.raises(AlchemyFeatureNotAvailable):
+        asyncio.run(make_request())
+
+
+def test_async_make_request_http_error(mocker, alchemy_provider):
+    alchemy = AsyncAlchemy(alchemy_provider)
+    response = mocker.MagicMock(ok=False, status=400, reason="Bad Request")
+    response.json = mocker.AsyncMock(
+        return_value={"error": {"code": -32600, "message": "trace_block is not available"}}
+    )
+    # The error body of a failed HTTP response is kept.
+    with pytest.raises(AlchemyFeatureNotAvailable, match="trace_block is not available"):
+        asyncio.run(alchemy._raise_for_status(response))
+
+
+def test_async_get_transaction_trace(mocker, alchemy_provider, parity_trace):
+    alchemy = AsyncAlchemy(alchemy_provider)
+    alchemy._web3 = mocker.MagicMock()
+    top_level_call = {"output": "0x", "revertReason": "NOPE"}
+
+    async def make_request(rpc, params):
+        return {"result": [parity_trace] if rpc == "trace_transaction" else top_level_call}
+
+    alchemy._web3.provider.make_request = make_request
+    trace = asyncio.run(alchemy.get_transaction_trace(TXN_HASH))
+    assert trace.revert_message == "NOPE"
+    assert trace._parity_trace == [parity_trace]
+
+
+def test_get_receipt(alchemy_provider, mock_web3, mock_rpc, raw_receipt, raw_transaction, txn_hash):
+    alchemy_provider._web3 = mock_web3
+    mock_rpc["eth_getTransactionReceipt"] = raw_receipt
+    mock_rpc["eth_getTransactionByHash"] = raw_transaction
+    receipt = alchemy_provider.get_receipt(txn_hash)
+    assert receipt.txn_hash == txn_hash
+    assert receipt.block_number == 16
+    assert receipt.gas_used == 21_000
+
+    mock_rpc["eth_getTransactionReceipt"] = None
+    with pytest.raises(TransactionNotFoundError):
+        alchemy_provider.get_receipt(txn_hash)
+
+
+def test_make_request_cache(
+    mocker, tmp_path, alchemy_provider, mock_web3, mock_rpc, raw_receipt, txn_hash
+):
+    config = AlchemyConfig(cache={"enabled": True, "finality_depth": 10})
+    mocker.patch.object(Alchemy, "config", new_callable=mocker.PropertyMock, return_value=config)
+    mocker.patch.object(
+        Alchemy, "data_folder", new_callable=mocker.PropertyMock, return_value=tmp_path
+    )
+    alchemy_provider._web3 = mock_web3
+    mock_rpc["eth_getTransactionReceipt"] = raw_receipt
+    mock_rpc["eth_blockNumber"] = "0x19"  # Block 16 is not final yet.
+
+    def get_receipt_request_count():
+        calls = mock_web3.provider.make_request.call_args_list
+        return len([c for c in calls if c.args[0] == "eth_getTransactionReceipt"])
+
+    assert alchemy_provider.make_request("eth_getTransactionReceipt", [txn_hash]) == raw_receipt
+    alchemy_provider.make_request("eth_getTransactionReceipt", [txn_hash])
+    assert get_receipt_request_count() == 2
+
+    alchemy_provider._finality_head = None
+    mock_rpc["eth_blockNumber"] = "0x1a"  # Block 16 is final.
+    alchemy_provider.make_request("eth_getTransactionReceipt", [txn_hash])
+    assert alchemy_provider.make_request("eth_getTransactionReceipt", [txn_hash]) == raw_receipt
+    assert get_receipt_request_count() == 3
+
+
+def test_make_request_memoize(mocker, alchemy_provider, mock_web3, mock_rpc):
+    config = AlchemyConfig(memoize={"enabled": True})
+    mocker.patch.object(Alchemy, "config", new_callable=mocker.PropertyMock, return_value=config)
+    alchemy_provider._web3 = mock_web3
+    alchemy_provider._memoized_reads = None
+    mock_rpc["eth_blockNumber"] = "0x10"
+    mock_rpc["eth_gasPrice"] = "0x3b9aca00"
+
+    alchemy_provider.make_request("eth_blockNumber")
+    assert alchemy_provider.gas_price == 1_000_000_000
+    assert alchemy_provider.gas_price == 1_000_000_000
+    assert alchemy_provider.memoization_stats["hits"] == 1
+
+    # Seeing a new block invalidates the memoized gas price.
+    mock_rpc["eth_blockNumber"] = "0x11"
+    mock_rpc["eth_gasPrice"] = "0x1"
+    alchemy_provider.make_request("eth_blockNumber")
+    assert alchemy_provider.gas_price == 1
+
+
+def test_get_receipts_for_block(alchemy_provider, mock_web3, raw_receipt, raw_transaction):
+    alchemy_provider._web3 = mock_web3
+    block = {"number": "0x10", "transactions": [raw_transaction]}
+    mock_web3.provider.make_batch_request.return_value = [
+        {"id": 0, "result": block},
+        {"id": 1, "result": {"receipts": [raw_receipt]}},
+    ]
+    receipts = alchemy_provider.get_receipts_for_block(16)
+    assert [r.txn_hash for r in receipts] == [raw_transaction["hash"]]
+    mock_web3.provider.make_batch_request.assert_called_once_with(
+        [
+            ("eth_getBlockByNumber", ["0x10", True]),
+            ("alchemy_getTransactionReceipts", [{"blockNumber": "0x10"}]),
+        ]
+    )
+
+
+def test_get_receipts_for_block_not_available(
+    alchemy_provider, mock_web3, mock_rpc, raw_receipt, raw_transaction
+):
+    alchemy_provider._web3 = mock_web3
+    block = {"number": "0x10", "transactions": [raw_transaction]}
+    message = "alchemy_getTransactionReceipts is not available on this network"
+    mock_web3.provider.make_batch_request.return_value = [
+        {"id": 0, "result": block},
+        {"id": 1, "error": {"code": -32600, "message": message}},
+    ]
+    mock_rpc["eth_getTransactionReceipt"] = raw_receipt
+    receipts = alchemy_provider.get_receipts_for_block(16)
+    assert [r.block_number for r in receipts] == [16]
+
+
+def test_get_receipts_for_block_missing_receipt(
+    alchemy_provider, mock_web3, mock_rpc, raw_transaction
+):
+    alchemy_provider._web3 = mock_web3
+    block = {"number": "0x10", "transactions": [raw_transaction]}
+    mock_web3.provider.make_batch_request.return_value = [
+        {"id": 0, "result": block},
+        {"id": 1, "error": {"code": -32601, "message": "Method not found"}},
+    ]
+    # The block is still propagating.
+    mock_rpc["eth_getTransactionReceipt"] = None
+    with pytest.raises(TransactionNotFoundError):
+        alchemy_provider.get_receipts_for_block(16)
+
+
+def test_get_receipts(alchemy_provider, mock_web3, raw_receipt, raw_transaction, txn_hash):
+    alchemy_provider._web3 = mock_web3
+    mock_web3.provider.make_batch_request.return_value = [
+        {"id": 0, "result": raw_receipt},
+        {"id": 1, "result": raw_transaction},
+    ]
+    receipts = alchemy_provider.get_receipts([txn_hash])
+    assert [r.txn_hash for r in receipts] == [txn_hash]
+
+
+def test_get_transaction_traces(networks, alchemy_provider, mock_web3, mock_rpc, parity_trace):
+    alchemy_provider._web3 = mock_web3
+    networks.active_provider = alchemy_provider
+    mock_rpc["trace_transaction"] = lambda params: [{**parity_trace, "transactionHash": params[0]}]
+    txn_hashes = [f"0x{i:064x}" for i in range(5)]
+    traces = alchemy_provider.get_transaction_traces(txn_hashes, concurrency=2)
+    assert [t.transaction_hash for t in traces] == txn_hashes
+    assert [t._parity_trace[0]["transactionHash"] for t in traces] == txn_hashes
+    assert mock_web3.provider.make_request.call_count == 5
+
+
+def test_trace_block(alchemy_provider, mock_web3, mock_rpc, parity_trace):
+    alchemy_provider._web3 = mock_web3
+    other_hash = f"0x{1:064x}"
+    reward_trace = {**parity_trace, "type": "reward", "transactionHash": None}
+    mock_rpc["trace_block"] = [
+        parity_trace,
+        {**parity_trace, "traceAddress": [0]},
+        {**parity_trace, "transactionHash": other_hash},
+        reward_trace,
+    ]
+    traces = alchemy_provider.trace_block(15104985)
+    assert [t.transaction_hash for t in traces] == [TXN_HASH, other_hash]
+    assert len(traces[0]._parity_trace) == 2
+    mock_web3.provider.make_request.assert_called_once_with("trace_block", ["0xe67bd9"])
+
+
+def test_trace_block_not_available(
+    networks, alchemy_provider, mock_web3, mock_rpc, parity_trace, feature_not_available_http_error
+):
+    alchemy_provider._web3 = mock_web3
+    networks.active_provider = alchemy_provider
+    feature_not_available_http_error.response.status_code = 400
+
+    def trace_block(params):
+        raise feature_not_available_http_error
+
+    mock_rpc["trace_block"] = trace_block
+    block = {"number": "0xe67bd9", "transactions": [TXN_HASH]}
+    mock_rpc["eth_getBlockByHash"] = block
+    mock_rpc["eth_getBlockByNumber"] = block
+    mock_rpc["trace_transaction"] = [parity_trace]
+    traces = alchemy_provider.trace_block(HexBytes(f"0x{1:064x}"))
+    assert [t.transaction_hash for t in traces] == [TXN_HASH]
+
+
+def test_get_transaction_trace_combined(mocker, networks, alchemy_provider, mock_web3):
+    config = AlchemyConfig(combine_traces=True)
+    mocker.patch.object(Alchemy, "config", new_callable=mocker.PropertyMock, return_value=config)
+    alchemy_provider._web3 = mock_web3
+    networks.active_provider = alchemy_provider
+    call_trace = {
+        "type": "CALL",
+        "from": "0x5cab1e5286529370880776461c53a0e47d74fb63",
+        "to": "0xc17f2c69ae2e66fd87367e3260412eeff637f70e",
+        "value": "0x0",
+        "gas": "0x17e6f0",
+        "gasUsed": "0x1562f0",
+        "input": "0x96d373e5",
+        "output": "0x",
+        "error": "execution reverted",
+        "revertReason": "Not allowed",
+        "calls": [
+            {
+                "type": "STATICCALL",
+                "from": "0xc17f2c69ae2e66fd87367e3260412eeff637f70e",
+                "to": "0x5cab1e5286529370880776461c53a0e47d74fb63",
+                "gas": "0x1000",
+                "gasUsed": "0x100",
+                "input": "0x",
+            }
+        ],
+    }
+    prestate = {"0x5cab1e5286529370880776461c53a0e47d74fb63": {"balance": "0x1"}}
+    mock_web3.provider.make_batch_request.return_value = [
+        {"id": 0, "result": call_trace},
+        {"id": 1, "result": prestate},
+    ]
+    trace = alchemy_provider.get_transaction_trace(TXN_HASH)
+    assert trace.revert_message == "Not allowed"
+    assert trace.prestate == prestate
+    assert len(trace.get_calltree().calls) == 1
+
+    # Everything came from one batch request.
+    assert mock_web3.provider.make_batch_request.call_count == 1
+    assert mock_web3.provider.make_request.call_count == 0
+
+
+@pytest.mark.parametrize("declared", [False, True])
+def test_connect_reuses_chain_metadata(mocker, tmp_path, token, alchemy_provider, declared):
+    networks = {"ethereum:sepolia": {"chain_id": 11155111, "is_poa": False}} if declared else {}
+    config = AlchemyConfig(connect={"networks": networks})
+    mocker.patch.object(Alchemy, "config", new_callable=mocker.PropertyMock, return_value=config)
+    mocker.patch.object(
+        Alchemy, "data_folder", new_callable=mocker.PropertyMock, return_value=tmp_path
+    )
+    web3 = mocker.patch("ape_alchemy.provider.Web3")
+    web3.return_value.eth.chain_id = 11155111
+    web3.return_value.eth.get_block.return_value = {"extraData": "0x"}
+    alchemy_provider.connect()
+    assert web3.return_value.eth.get_block.call_count == (0 if declared else 2)
+    alchemy_provider.disconnect()
+
+    # Connecting again makes no requests.
+    web3.reset_mock()
+    chain_id = mocker.PropertyMock(side_effect=AssertionError("Chain ID requested."))
+    type(web3.return_value.eth).chain_id = chain_id
+    alchemy_provider.connect()
+    assert alchemy_provider.chain_id == 11155111
+    assert web3.return_value.eth.get_block.call_count == 0
+    assert web3.return_value.provider.make_request.call_count == 0
+    web3.return_value.middleware_onion.inject.assert_not_called()
+    alchemy_provider.disconnect()
+
+
+def test_stats(mocker, alchemy_provider, mock_web3):
+    mocker.patch("ape.utils.rpc.time.sleep")
+    alchemy_provider._web3 = mock_web3
+    alchemy_provider.stats.reset()
+    response = mocker.MagicMock()
+    response.status_code = 429
+    mock_web3.provider.make_request.side_effect = [
+        HTTPError(response=response),
+        {"jsonrpc": "2.0", "id": 1, "result": "0x1"},
+    ]
+    mock_web3.provider.make_batch_request.return_value = [
+        {"id": 2, "result": "0x1"},
+        {"id": 3, "error": {"code": -32000, "message": "execution reverted"}},
+    ]
+    alchemy_provider.make_request("eth_blockNumber", [])
+    with alchemy_provider.batch_requests() as batch:
+        batch.add("eth_blockNumber")
+        batch.add("eth_call", [{}, "latest"])
+
+    block_number = alchemy_provider.stats["eth_blockNumber"]
+    assert block_number["count"] == 2
+    assert block_number["retries"] == 1
+    assert block_number["rate_limited"] == 1
+    assert block_number["compute_units"] == 20
+    assert block_number["latency"]["p50"] is not None
+    assert alchemy_provider.stats["eth_call"]["errors"] == 1
+
+
+def test_get_transaction_trace_parameters(networks, alchemy_provider, mock_web3, mock_rpc):
+    alchemy_provider._web3 = mock_web3
+    networks.active_provider = alchemy_provider
+    call_trace = {"type": "CALL", "revertReason": "Nope", "calls": []}
+    mock_rpc["debug_traceTransaction"] = call_trace
+    trace = alchemy_provider.get_transaction_trace(
+        TXN_HASH,
+        call_trace_approach=TraceApproach.GETH_CALL_TRACER,
+        debug_trace_transaction_parameters={"tracerConfig": {"withLog": True}},
+    )
+    assert trace._call_trace == call_trace
+
+    # The given parameters are sent, along with the call tracer.
+    _, (_, tracer) = mock_web3.provider.make_request.call_args.args
+    assert tracer["tracer"] == "callTracer"
+    assert tracer["tracerConfig"] == {"withLog": True}
@@ -0,0 +1,51 @@
+import pytest
+
+from ape_alchemy.config import RateLimitConfig
+from ape_alchemy.rate_limit import (
+    ComputeUnitBucket,
+    SharedComputeUnitBucket,
+    get_compute_unit_bucket,
+    get_compute_units,
+)
+
+
+class Clock:
+    now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_get_compute_units():
+    assert get_compute_units("eth_call") < get_compute_units("debug_traceTransaction")
+    assert get_compute_units("eth_call", {"eth_call": 1}) == 1
+    assert get_compute_units("ape_madeUpRPC") > 0
+
+
+def test_compute_unit_bucket():
+    clock = Clock()
+    bucket = ComputeUnitBucket(100, clock=clock)
+    assert bucket.reserve(60) == 0
+    assert bucket.reserve(60) == pytest.approx(0.2)
+
+    # Refills at the configured rate, but only up to one second of capacity.
+    clock.now = 10
+    assert bucket.reserve(100) == 0
+    assert bucket.reserve(50) == pytest.approx(0.5)
+
+
+def test_shared_compute_unit_bucket(tmp_path):
+    path = tmp_path / "test.bucket"
+    bucket = SharedComputeUnitBucket(100, path)
+    other_process_bucket = SharedComputeUnitBucket(100, path)
+    assert bucket.reserve(100) == 0
+    assert other_process_bucket.reserve(50) == pytest.approx(0.5, abs=0.05)
+
+
+def test_get_compute_unit_bucket(tmp_path):
+    assert get_compute_unit_bucket("https://example.com", RateLimitConfig(), tmp_path) is None
+
+    config = RateLimitConfig(compute_units_per_second=330)
+    bucket = get_compute_unit_bucket("https://example.com", config, tmp_path)
+    assert bucket is not None
+    assert get_compute_unit_bucket("https://example.com", config, tmp_path) is bucket
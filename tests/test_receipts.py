@@ -0,0 +1,155 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from queue import Empty, Queue
+
+import pytest
+from ape.exceptions import TransactionNotFoundError
+from ape_ethereum.transactions import DynamicFeeTransaction
+
+from ape_alchemy.config import AlchemyConfig
+from ape_alchemy.provider import Alchemy
+from ape_alchemy.receipts import MAX_BLOCKS_TO_MATCH, ReceiptWatcher
+
+from .mock_alchemy import MockChain
+from .test_private_transactions import wait_for
+
+TXN_HASHES = [f"0x{i:064x}" for i in range(1, 31)]
+
+
+class Heads:
+    """
+    A stand-in ``newHeads`` subscription.
+    """
+
+    def __init__(self):
+        self.queue: Queue = Queue()
+        self.is_closed = False
+
+    def get(self, timeout=None):
+        try:
+            return self.queue.get(timeout=timeout or None) if timeout else self.queue.get_nowait()
+        except Empty as err:
+            raise TimeoutError() from err
+
+    def close(self):
+        self.is_closed = True
+
+
+@pytest.fixture
+def config():
+    return AlchemyConfig(
+        connect={"metadata_ttl": 0},
+        receipts={"poll_interval": 0},
+        websocket={"poll_with_subscriptions": False},
+    )
+
+
+@pytest.fixture
+def chain(mock_alchemy, raw_receipt, raw_transaction):
+    return MockChain(mock_alchemy, raw_receipt, raw_transaction)
+
+
+@pytest.fixture
+def executor():
+    with ThreadPoolExecutor(len(TXN_HASHES)) as executor:
+        yield executor
+
+
+def test_get_receipt(provider, chain, executor, mock_alchemy):
+    futures = [
+        executor.submit(provider.get_receipt, txn_hash, required_confirmations=1, timeout=30)
+        for txn_hash in TXN_HASHES
+    ]
+    wait_for(lambda: mock_alchemy.calls["eth_getTransactionReceipt"] == len(TXN_HASHES))
+
+    # Waiting costs one block request per block, not a request per transaction.
+    for _ in range(5):
+        chain.mine()
+        wait_for(lambda: mock_alchemy.calls["eth_getBlockByNumber"] == chain.head - 0x100)
+
+    assert mock_alchemy.calls["eth_getTransactionReceipt"] == len(TXN_HASHES)
+    assert not any(future.done() for future in futures)
+
+    chain.mine(*TXN_HASHES)
+    chain.mine()
+    receipts = [future.result(timeout=5) for future in futures]
+    assert [r.txn_hash for r in receipts] == TXN_HASHES
+    assert all(r.required_confirmations == 1 for r in receipts)
+
+
+def test_get_receipt_already_mined(provider, chain):
+    chain.mine(TXN_HASHES[0])
+    chain.mine()
+    receipt = provider.get_receipt(TXN_HASHES[0], required_confirmations=1, timeout=5)
+    assert receipt.txn_hash == TXN_HASHES[0]
+
+
+def test_get_receipt_after_gap(provider, chain, executor, mock_alchemy):
+    future = executor.submit(provider.get_receipt, TXN_HASHES[0], timeout=30)
+    wait_for(lambda: mock_alchemy.calls["eth_getTransactionReceipt"] == 1)
+
+    # Too many new blocks to match, so the receipt is checked instead.
+    for _ in range(MAX_BLOCKS_TO_MATCH):
+        chain.mine()
+
+    chain.mine(TXN_HASHES[0])
+    assert future.result(timeout=5).txn_hash == TXN_HASHES[0]
+
+
+def test_get_receipt_timeout(provider, chain):
+    with pytest.raises(TransactionNotFoundError):
+        provider.get_receipt(TXN_HASHES[0], timeout=0.5)
+
+
+def test_get_receipt_new_heads(mocker, provider, chain, executor, mock_alchemy):
+    heads = Heads()
+    provider.config.websocket.poll_with_subscriptions = True
+    mocker.patch.object(
+        Alchemy, "ws_uri", new_callable=mocker.PropertyMock, return_value="ws://alchemy"
+    )
+    mocker.patch.object(Alchemy, "subscribe_new_heads", return_value=heads)
+    future = executor.submit(provider.get_receipt, TXN_HASHES[0], timeout=30)
+    wait_for(lambda: mock_alchemy.calls["eth_getTransactionReceipt"] == 1)
+
+    chain.mine(TXN_HASHES[0])
+    heads.queue.put({"number": hex(chain.head)})
+    assert future.result(timeout=5).txn_hash == TXN_HASHES[0]
+    # Only the first head is polled for.
+    assert mock_alchemy.calls["eth_blockNumber"] == 1
+
+
+def test_get_receipt_timeout_merged(provider, chain, executor):
+    short = executor.submit(provider.get_receipt, TXN_HASHES[0], timeout=0.5)
+    long = executor.submit(provider.get_receipt, TXN_HASHES[0], timeout=30)
+    # Waiters of the same transaction share the later deadline.
+    time.sleep(1.5)
+    assert not short.done()
+
+    chain.mine(TXN_HASHES[0])
+    assert short.result(timeout=5).txn_hash == long.result(timeout=5).txn_hash
+
+
+def test_get_receipt_with_transaction(provider, chain, mock_alchemy):
+    chain.mine(TXN_HASHES[0])
+    txn = DynamicFeeTransaction(
+        sender="0x958f973513f723f2cb9b47abe5e903695ab93e36",
+        receiver="0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48",
+        nonce=1,
+        gas_limit=21_000,
+    )
+    receipt = provider.get_receipt(TXN_HASHES[0], timeout=5, transaction=txn)
+    assert receipt.txn_hash == TXN_HASHES[0]
+    assert receipt.nonce == 1
+    # The given transaction is used rather than fetched.
+    assert mock_alchemy.calls["eth_getTransactionByHash"] == 0
+
+
+def test_watch_node_down(mocker):
+    provider = mocker.MagicMock(ws_uri=None)
+    provider.make_request.side_effect = ConnectionError("Node is down.")
+    provider.batch_requests.side_effect = ConnectionError("Node is down.")
+    watcher = ReceiptWatcher(provider, 0)
+    future = watcher.watch("0xabc", timeout=0.5)
+    # Timeouts fire even without a head.
+    with pytest.raises(TransactionNotFoundError):
+        future.result(timeout=5)
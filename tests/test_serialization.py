@@ -0,0 +1,97 @@
+import json
+
+import pytest
+
+from ape_alchemy.exceptions import AlchemyProviderError
+from ape_alchemy.serialization import dumps, loads
+from ape_alchemy.trace import AlchemyTransactionTrace
+
+TXN_HASH = "0x3cef4aaa52b97b6b61aa32b3afcecb0d14f7862ca80fdc76504c37a9374645c4"
+ADDRESSES = (
+    "0x5cab1e5286529370880776461c53a0e47d74fb63",
+    "0xc17f2c69ae2e66fd87367e3260412eeff637f70e",
+)
+
+
+def make_parity_trace(num_calls: int) -> list[dict]:
+    return [
+        {
+            "action": {
+                "from": ADDRESSES[i % 2],
+                "callType": "call",
+                "gas": hex(0x17E6F0 - i),
+                "input": f"0x96d373e5{i:064x}",
+                "to": ADDRESSES[(i + 1) % 2],
+                "value": "0x0",
+            },
+            "blockHash": "0xa7e0792b07687130af6042d9e295e7a96d83a34f40fe01074348cac5c5dd0699",
+            "blockNumber": 15104985,
+            "result": {"gasUsed": hex(0x1562F0 - i), "output": "0x"},
+            "subtraces": 0,
+            "traceAddress": [i],
+            "transactionHash": TXN_HASH,
+            "transactionPosition": 259,
+            "type": "call",
+        }
+        for i in range(num_calls)
+    ]
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        None,
+        True,
+        -1,
+        2**80,
+        1.5,
+        "0x",
+        "0x0",
+        "0x00",
+        "0x001",
+        "0xABCD",
+        "0xC17f2C69aE2E66FD87367E3260412EEfF637F70E",
+        "Not allowed",
+        "x" * 100,
+        [1, "a", ["a"]],
+        {"a": {"a": "a"}, "b": []},
+    ],
+)
+def test_round_trip(value):
+    assert loads(dumps(value)) == value
+
+
+def test_dumps_is_compact():
+    trace = make_parity_trace(100)
+    data = dumps(trace)
+    assert loads(data) == trace
+    assert len(data) * 5 < len(json.dumps(trace))
+    assert len(dumps(trace, compress=False)) < len(json.dumps(trace))
+
+
+def test_loads_interns_strings():
+    trace = loads(dumps(make_parity_trace(2)))
+    assert trace[0]["action"]["from"] is trace[1]["action"]["to"]
+    assert next(iter(trace[0])) is next(iter(trace[1]))
+
+
+def test_loads_invalid():
+    with pytest.raises(AlchemyProviderError, match="Not a serialized trace."):
+        loads(b'{"result": null}')
+
+
+def test_save_and_load_trace(tmp_path, networks, alchemy_provider, mock_web3):
+    alchemy_provider._web3 = mock_web3
+    networks.active_provider = alchemy_provider
+    parity_trace = make_parity_trace(3)
+    prestate = {ADDRESSES[0]: {"balance": "0x1"}}
+    trace = AlchemyTransactionTrace.from_raw(TXN_HASH, parity_trace=parity_trace, prestate=prestate)
+    path = tmp_path / "traces" / f"{TXN_HASH}.trace"
+    trace.save(path)
+
+    loaded = AlchemyTransactionTrace.load(path)
+    assert loaded.transaction_hash == TXN_HASH
+    assert loaded.call_trace_approach == trace.call_trace_approach
+    assert loaded.prestate == prestate
+    assert repr(loaded.get_calltree()) == repr(trace.get_calltree())
+    assert mock_web3.provider.make_request.call_count == 0
@@ -0,0 +1,113 @@
+import pytest
+from ape.exceptions import ContractLogicError
+from ape_ethereum.transactions import DynamicFeeTransaction
+
+from ape_alchemy.exceptions import AlchemyFeatureNotAvailable
+
+from .mock_alchemy import RpcError
+
+SENDER = "0x5cab1e5286529370880776461c53a0e47d74fb63"
+RECEIVER = "0xc17f2c69ae2e66fd87367e3260412eeff637f70e"
+TOKEN = "0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48"
+REVERTING_DATA = "0xdead"
+
+
+def simulate_asset_changes(params):
+    if params[0].get("data") == REVERTING_DATA:
+        return {"changes": [], "gasUsed": "0x5208", "error": {"message": "execution reverted"}}
+
+    return {
+        "changes": [
+            {
+                "assetType": "ERC20",
+                "changeType": "TRANSFER",
+                "from": params[0]["from"],
+                "to": params[0]["to"],
+                "rawAmount": "1500000",
+                "amount": "1.5",
+                "contractAddress": TOKEN,
+                "decimals": 6,
+                "symbol": "USDC",
+                "name": "USD Coin",
+            }
+        ],
+        "gasUsed": "0xc350",
+        "error": None,
+    }
+
+
+def simulate_execution(params):
+    call = {
+        "type": "CALL",
+        "from": params[0]["from"],
+        "to": params[0]["to"],
+        "value": params[0].get("value", "0x0"),
+        "gasUsed": "0xc350",
+        "input": params[0].get("data", "0x"),
+        "output": "0x" + "00" * 31 + "01",
+    }
+    if params[0].get("data") == REVERTING_DATA:
+        call.update(output="0x", error="execution reverted", revertReason="Not enough")
+
+    return {"calls": [call], "logs": []}
+
+
+@pytest.fixture
+def provider(provider, mock_alchemy):
+    mock_alchemy.results.update(
+        {
+            "alchemy_simulateAssetChanges": simulate_asset_changes,
+            "alchemy_simulateExecution": simulate_execution,
+            "alchemy_simulateAssetChangesBundle": lambda params: [
+                simulate_asset_changes([txn]) for txn in params[0]
+            ],
+            "alchemy_simulateExecutionBundle": lambda params: [
+                simulate_execution([txn]) for txn in params[0]
+            ],
+        }
+    )
+    return provider
+
+
+def make_txn(data: str = "0x") -> DynamicFeeTransaction:
+    return DynamicFeeTransaction(sender=SENDER, receiver=RECEIVER, data=data, gas_limit=100_000)
+
+
+def test_simulate(provider, mock_alchemy):
+    simulations = provider.simulate([make_txn(), make_txn(REVERTING_DATA), make_txn()])
+    assert mock_alchemy.num_requests == 1
+    assert [s.failed for s in simulations] == [False, True, False]
+
+    (change,) = simulations[0].changes
+    assert change.symbol == "USDC"
+    assert change.raw_amount == 1_500_000
+    assert change.sender.lower() == SENDER
+    assert simulations[0].gas_used == 50_000
+    assert int.from_bytes(simulations[0].return_data, "big") == 1
+
+    assert isinstance(simulations[1].error, ContractLogicError)
+    assert simulations[1].error.revert_message == "Not enough"
+
+
+def test_simulate_request_fails(provider, mock_alchemy):
+    def fail(params):
+        raise RpcError("execution reverted: Nope")
+
+    mock_alchemy.results["alchemy_simulateExecution"] = fail
+    (simulation,) = provider.simulate([make_txn()])
+    assert isinstance(simulation.error, ContractLogicError)
+    assert simulation.error.revert_message == "Nope"
+
+
+def test_simulate_not_available(provider, mock_alchemy):
+    del mock_alchemy.results["alchemy_simulateExecution"]
+    with pytest.raises(AlchemyFeatureNotAvailable):
+        provider.simulate([make_txn()])
+
+
+def test_simulate_bundle(provider, mock_alchemy):
+    simulations = provider.simulate_bundle([make_txn(), make_txn(REVERTING_DATA)])
+    assert mock_alchemy.num_requests == 1
+    assert mock_alchemy.calls["alchemy_simulateExecutionBundle"] == 1
+    assert [s.failed for s in simulations] == [False, True]
+    assert simulations[0].changes[0].amount == "1.5"
@@ -0,0 +1,112 @@
+import io
+import json
+
+import pytest
+import requests
+
+from ape_alchemy.config import AlchemyConfig
+from ape_alchemy.exceptions import AlchemyProviderError
+from ape_alchemy.provider import Alchemy
+from ape_alchemy.streaming import CallFrame, check_response
+
+TXN_HASH = "0x3cef4aaa52b97b6b61aa32b3afcecb0d14f7862ca80fdc76504c37a9374645c4"
+
+
+def make_call(depth: int = 0, index: int = 0, width: int = 3, max_depth: int = 3) -> dict:
+    call = {
+        "type": "CALL",
+        "to": f"0x{depth}{index}",
+        "gas": "0x10",
+        "output": "0x01",
+    }
+    if depth < max_depth:
+        call["calls"] = [make_call(depth + 1, i, width, max_depth) for i in range(width)]
+        call["logs"] = [{"topics": ["0x01"], "data": "0x"}]
+
+    return call
+
+
+@pytest.fixture
+def call_trace():
+    return make_call()
+
+
+@pytest.fixture
+def response_file(call_trace):
+    return io.BytesIO(json.dumps({"jsonrpc": "2.0", "id": 1, "result": call_trace}).encode())
+
+
+class CountingFile(io.BytesIO):
+    num_read = 0
+
+    def read(self, size=-1):
+        data = super().read(size)
+        self.num_read += len(data)
+        return data
+
+
+def without_calls(call: dict) -> dict:
+    return {k: v for k, v in call.items() if k != "calls"}
+
+
+def test_call_frame(call_trace, response_file):
+    frame = CallFrame.from_file(response_file)
+    assert frame.fields == without_calls(call_trace)
+    assert frame["to"] == "0x00"
+    assert len(frame.calls) == 3
+
+    sub_call = frame.calls[2].calls[1]
+    assert sub_call.path == (2, 1)
+    assert sub_call.fields == without_calls(call_trace["calls"][2]["calls"][1])
+    assert sub_call.to_dict() == call_trace["calls"][2]["calls"][1]
+    assert frame.calls[1].calls[0].calls[2].calls == []
+    assert frame.to_dict() == call_trace
+
+
+def test_call_frame_reads_only_its_span(mocker, call_trace):
+    # Strings with escapes and delimiters, split across small scan chunks.
+    call_trace["calls"][0]["revertReason"] = 'Not "calls": [{\\'
+    call_trace["calls"][1]["calls"][0]["input"] = "0x" + "ab" * 100
+    body = json.dumps({"jsonrpc": "2.0", "id": 1, "result": call_trace}).encode()
+    mocker.patch("ape_alchemy.streaming._SCAN_SIZE", 7)
+    response_file = CountingFile(body)
+    frame = CallFrame.from_file(response_file)
+    assert frame.fields == without_calls(call_trace)
+    assert frame.calls[0]["revertReason"] == 'Not "calls": [{\\'
+    assert frame.calls[1].calls[0].to_dict() == call_trace["calls"][1]["calls"][0]
+
+    # Sub-calls are parsed from their own bytes, not from the start of the file.
+    sub_call = frame.calls[2].calls[1]
+    response_file.num_read = 0
+    assert sub_call.fields == without_calls(call_trace["calls"][2]["calls"][1])
+    assert response_file.num_read <= 2 * len(json.dumps(call_trace["calls"][2]["calls"][1]))
+
+
+def test_check_response():
+    assert check_response(io.BytesIO(b'{"result": {}}')) is None
+    error = check_response(io.BytesIO(b'{"error": {"code": -32000, "message": "oops"}}'))
+    assert error == {"code": -32000, "message": "oops"}
+    assert check_response(io.BytesIO(b'{"result": null}')) is not None
+
+
+def test_stream_traces(mocker, networks, alchemy_provider, call_trace):
+    config = AlchemyConfig(combine_traces=True, stream_traces=True)
+    mocker.patch.object(Alchemy, "config", new_callable=mocker.PropertyMock, return_value=config)
+    networks.active_provider = alchemy_provider
+    call_trace["revertReason"] = "Not allowed"
+    body = json.dumps({"jsonrpc": "2.0", "id": 1, "result": call_trace}).encode()
+    response = mocker.MagicMock()
+    response.__enter__.return_value = response
+    response.iter_content.return_value = [body[:100], body[100:]]
+    post = mocker.patch.object(requests.Session, "post", return_value=response)
+
+    trace = alchemy_provider.get_transaction_trace(TXN_HASH)
+    assert trace.revert_message == "Not allowed"
+    assert len(trace.call_frame.calls) == 3
+    assert post.call_count == 1
+    assert post.call_args.kwargs["json"]["method"] == "debug_traceTransaction"
+
+    response.iter_content.return_value = [b'{"error": {"message": "transaction not found"}}']
+    trace = alchemy_provider.get_transaction_trace(TXN_HASH)
+    with pytest.raises(AlchemyProviderError, match="transaction not found"):
+        _ = trace.call_frame
@@ -0,0 +1,81 @@
+import pytest
+from eth_utils import to_checksum_address
+
+TOKENS = [to_checksum_address(f"0x{i:040x}") for i in range(1, 251)]
+ACCOUNTS = [to_checksum_address(f"0x{i:040x}") for i in range(1_001, 1_021)]
+
+
+def get_balance(token: str, account: str) -> int:
+    return int(token, 16) * int(account, 16)
+
+
+def get_token_balances(params):
+    account = params[0]
+    if params[1] == "erc20":
+        # Pages of 100 tokens.
+        page = int((params[2] if len(params) > 2 else {}).get("pageKey", "0"))
+        tokens = TOKENS[page * 100 : (page + 1) * 100]
+        page_key = str(page + 1) if (page + 1) * 100 < len(TOKENS) else None
+    else:
+        tokens, page_key = params[1], None
+
+    balances = [
+        {
+            "contractAddress": token.lower(),
+            "tokenBalance": hex(get_balance(token, account)),
+            "error": None,
+        }
+        for token in tokens
+    ]
+    # A token whose balance could not be read.
+    balances.append({"contractAddress": "0x" + "ff" * 20, "tokenBalance": None, "error": "Oops"})
+    return {"address": account, "tokenBalances": balances, "pageKey": page_key}
+
+
+def get_token_metadata(params):
+    number = int(params[0], 16)
+    return {"name": f"Token {number}", "symbol": f"T{number}", "decimals": 18, "logo": None}
+
+
+@pytest.fixture
+def provider(provider, mock_alchemy):
+    mock_alchemy.results["alchemy_getTokenBalances"] = get_token_balances
+    mock_alchemy.results["alchemy_getTokenMetadata"] = get_token_metadata
+    return provider
+
+
+def test_get_token_balances(provider, mock_alchemy):
+    balances = provider.get_token_balances(ACCOUNTS[0])
+    assert balances == {token: get_balance(token, ACCOUNTS[0]) for token in TOKENS}
+    # Every page was fetched.
+    assert mock_alchemy.calls["alchemy_getTokenBalances"] == 3
+
+
+def test_get_token_balances_of_tokens(provider, mock_alchemy):
+    balances = provider.get_token_balances(ACCOUNTS[0], TOKENS[:150])
+    assert balances == {token: get_balance(token, ACCOUNTS[0]) for token in TOKENS[:150]}
+    # In chunks of `max_tokens_per_request`.
+    assert mock_alchemy.calls["alchemy_getTokenBalances"] == 2
+
+
+def test_get_token_balances_for_accounts(provider, mock_alchemy):
+    balances = provider.get_token_balances_for_accounts(ACCOUNTS, TOKENS[:10])
+    assert list(balances) == ACCOUNTS
+    assert all(
+        balances[account] == {token: get_balance(token, account) for token in TOKENS[:10]}
+        for account in ACCOUNTS
+    )
+    assert mock_alchemy.calls["alchemy_getTokenBalances"] == len(ACCOUNTS)
+
+
+def test_get_token_metadata(provider, mock_alchemy):
+    metadata = provider.get_token_metadata([token.lower() for token in TOKENS[:20]])
+    assert list(metadata) == TOKENS[:20]
+    assert metadata[TOKENS[0]]["symbol"] == "T1"
+    assert mock_alchemy.num_requests == 1
+
+    # Metadata does not change, so it is only fetched once.
+    tokens = [*TOKENS[20:30], *TOKENS[10:20]]
+    metadata = provider.get_token_metadata(tokens)
+    assert list(metadata) == tokens
+    assert mock_alchemy.calls["alchemy_getTokenMetadata"] == 30
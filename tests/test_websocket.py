@@ -0,0 +1,186 @@
+import asyncio
+import json
+from threading import Thread
+
+import pytest
+from web3 import HTTPProvider
+from websockets.sync.server import serve
+
+from ape_alchemy.config import AlchemyConfig
+from ape_alchemy.exceptions import AlchemyProviderError, AlchemyRateLimitError
+from ape_alchemy.provider import Alchemy
+from ape_alchemy.websocket import AlchemyWebSocketProvider, Subscription, WebSocketClient
+
+
+@pytest.fixture
+def ws_server():
+    """
+    A JSON-RPC server that drops the connection on the first request it receives,
+    without responding, and otherwise responds with the request's method.
+    """
+    requests: list[dict] = []
+
+    def handler(connection):
+        for message in connection:
+            request = json.loads(message)
+            requests.append(request)
+            if len(requests) == 1:
+                return  # Drop the connection.
+
+            if request["method"] == "ape_rateLimited":
+                response = {"error": {"code": 429, "message": "Too many requests"}}
+            else:
+                response = {"result": request["method"]}
+
+            connection.send(json.dumps({"jsonrpc": "2.0", "id": request["id"], **response}))
+
+    with serve(handler, "127.0.0.1", 0) as server:
+        Thread(target=server.serve_forever, daemon=True).start()
+        port = server.socket.getsockname()[1]
+        yield f"ws://127.0.0.1:{port}", requests
+        server.shutdown()
+
+
+def test_request_replayed_after_reconnect(ws_server):
+    uri, requests = ws_server
+    client = WebSocketClient(uri, request_timeout=5, reconnect_delay=0)
+    client.connect()
+    response = client.request("eth_chainId", [])
+    assert response["result"] == "eth_chainId"
+
+    # Sent once, then re-sent on the new connection.
+    assert len(requests) == 2
+    assert requests[0]["id"] == requests[1]["id"]
+    client.close()
+    assert not client.is_connected
+
+
+def test_write_not_replayed_after_reconnect(ws_server):
+    uri, requests = ws_server
+    client = WebSocketClient(uri, request_timeout=5, reconnect_delay=0)
+    client.connect()
+    # The server may have received it, so it is not sent again.
+    with pytest.raises(AlchemyProviderError, match="eth_sendRawTransaction"):
+        client.request("eth_sendRawTransaction", ["0x01"])
+
+    assert len(requests) == 1
+    assert client.request("eth_chainId", [])["result"] == "eth_chainId"
+    client.close()
+
+
+def test_provider(ws_server):
+    uri, _ = ws_server
+    client = WebSocketClient(uri, request_timeout=5, reconnect_delay=0)
+    provider = AlchemyWebSocketProvider(client)
+    assert provider.make_request("eth_chainId", [])["result"] == "eth_chainId"
+    assert [r["result"] for r in provider.make_batch_request([("a", []), ("b", [])])] == [
+        "a",
+        "b",
+    ]
+    with pytest.raises(AlchemyRateLimitError):
+        provider.make_request("ape_rateLimited", [])
+
+    client.close()
+
+
+def test_connect_falls_back_to_http(mocker, alchemy_provider):
+    config = AlchemyConfig(websocket={"enabled": True})
+    mocker.patch.object(Alchemy, "config", new_callable=mocker.PropertyMock, return_value=config)
+    mocker.patch.object(
+        WebSocketClient, "connect", side_effect=AlchemyProviderError("Unable to connect.")
+    )
+    assert isinstance(alchemy_provider._get_web3_provider(), HTTPProvider)
+    assert alchemy_provider._ws_client is None
+
+    mocker.patch.object(WebSocketClient, "connect")
+    assert isinstance(alchemy_provider._get_web3_provider(), AlchemyWebSocketProvider)
+    alchemy_provider._ws_client = None
+
+
+@pytest.fixture
+def subscription_server():
+    """
+    A server that sends two ``newHeads`` notifications then drops the connection
+    the first time, and one notification after a client re-subscribes.
+    """
+    connections = []
+
+    def handler(connection):
+        connections.append(connection)
+        subscription_id = hex(len(connections))
+        for message in connection:
+            request = json.loads(message)
+            result = subscription_id if request["method"] == "eth_subscribe" else True
+            connection.send(json.dumps({"jsonrpc": "2.0", "id": request["id"], "result": result}))
+            if request["method"] != "eth_subscribe":
+                continue
+
+            numbers = (1, 2) if len(connections) == 1 else (3,)
+            for number in numbers:
+                notification = {"subscription": subscription_id, "result": {"number": hex(number)}}
+                connection.send(
+                    json.dumps(
+                        {"jsonrpc": "2.0", "method": "eth_subscription", "params": notification}
+                    )
+                )
+
+            if len(connections) == 1:
+                return  # Drop the connection.
+
+    with serve(handler, "127.0.0.1", 0) as server:
+        Thread(target=server.serve_forever, daemon=True).start()
+        port = server.socket.getsockname()[1]
+        yield f"ws://127.0.0.1:{port}"
+        server.shutdown()
+
+
+def test_subscription_renewed_after_reconnect(subscription_server):
+    client = WebSocketClient(subscription_server, request_timeout=5, reconnect_delay=0)
+    with client.subscribe(["newHeads"]) as heads:
+        assert [heads.get(timeout=5)["number"] for _ in range(3)] == ["0x1", "0x2", "0x3"]
+        assert heads.id == "0x2"
+
+    assert heads.is_closed
+    assert list(heads) == []
+    client.close()
+
+
+def test_async_subscription(subscription_server):
+    client = WebSocketClient(subscription_server, request_timeout=5, reconnect_delay=0)
+
+    async def get_numbers():
+        numbers = []
+        async for head in client.subscribe(["newHeads"]):
+            numbers.append(head["number"])
+            if len(numbers) == 3:
+                break
+
+        return numbers
+
+    assert asyncio.run(get_numbers()) == ["0x1", "0x2", "0x3"]
+    client.close()
+
+
+def test_poll_blocks_from_new_heads(mocker, alchemy_provider, mock_web3):
+    alchemy_provider._web3 = mock_web3
+    mock_web3.eth.block_number = 16
+    get_block = mocker.patch.object(Alchemy, "get_block", side_effect=lambda n: n)
+    heads = Subscription(mocker.MagicMock(), ["newHeads"])
+    for number in (17, 17, 20, 19, 21):
+        heads._put({"number": hex(number)})
+
+    blocks = alchemy_provider._poll_new_heads(heads, stop_block=21, required_confirmations=0)
+
+    # Skips repeated heads, fills in skipped blocks, and re-yields after re-orgs.
+    assert list(blocks) == [17, 18, 19, 20, 19, 20, 21]
+    assert get_block.call_count == 7
+
+
+def test_subscription_drops_oldest(mocker):
+    subscription = Subscription(mocker.MagicMock(), ["newHeads"], max_queue=2)
+    # Does not block the reader, though nothing is consuming.
+    for number in range(5):
+        subscription._put(number)
+
+    assert subscription.dropped == 3
+    assert [subscription.get(timeout=0) for _ in range(2)] == [3, 4]